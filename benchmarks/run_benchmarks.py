@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for CryoCalc hot paths.
+
+Times scalar property evaluation for every (material, property) pair, grouped
+by equation type, temperature series, conductivity integrals, thermal power
+and temperature profiles for every material in the database. Caches are
+warmed before timing, so the numbers are steady-state costs per call.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --compare baseline.json
+    python benchmarks/run_benchmarks.py --current results.json --compare baseline.json
+
+In comparison mode every benchmark slower than the baseline by more than
+``--threshold`` (default 25%) is flagged and the exit status is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from cryocalc import MaterialCalculator
+from cryocalc.thermal import ThermalCalculator, create_rod
+
+Benchmark = Tuple[str, Callable[[], Any]]
+
+
+def collect_benchmarks(calculator: MaterialCalculator, thermal: ThermalCalculator,
+                       name_filter: Optional[str] = None) -> List[Benchmark]:
+    """
+    Build the list of (name, zero-argument callable) benchmarks.
+
+    Args:
+        calculator: MaterialCalculator under test
+        thermal: ThermalCalculator sharing ``calculator``
+        name_filter: Only keep benchmarks whose name contains this substring
+
+    Returns:
+        Benchmarks in a stable order
+    """
+    database = calculator.database
+    geometry = create_rod(5.0, 100.0)
+    benchmarks: List[Benchmark] = []
+
+    for material_id in database.get_available_materials():
+        properties = database.get_material_info(material_id)['properties']
+        for property_name in properties:
+            prop_data = database.get_material_property(material_id, property_name)
+            min_temp, max_temp = database.get_temperature_range(material_id, property_name)
+            temperature = float(max(min_temp, 1.0) + max_temp) / 2
+            equation_type = prop_data.get('equation_type', 'unknown')
+            benchmarks.append((
+                f"calculate_property/{equation_type}/{material_id}/{property_name}",
+                lambda m=material_id, p=property_name, t=temperature:
+                    calculator.calculate_property(m, p, t)
+            ))
+            benchmarks.append((
+                f"calculate_temperature_series/{material_id}/{property_name}",
+                lambda m=material_id, p=property_name, r=(max(min_temp, 1.0), max_temp):
+                    calculator.calculate_temperature_series(m, p, r, num_points=100)
+            ))
+
+        if 'thermal_conductivity' not in properties:
+            continue
+        temp_cold, temp_hot = (float(t) for t in
+                               database.get_temperature_range(material_id, 'thermal_conductivity'))
+        temp_cold = max(temp_cold, 1.0)
+        benchmarks.extend([
+            (f"thermal_conductivity_integral/{material_id}",
+             lambda m=material_id, lo=temp_cold, hi=temp_hot:
+                thermal.calculate_thermal_conductivity_integral(m, lo, hi)),
+            (f"thermal_power/{material_id}",
+             lambda m=material_id, lo=temp_cold, hi=temp_hot:
+                thermal.calculate_thermal_power(m, geometry, hi, lo)),
+            (f"temperature_profile/{material_id}",
+             lambda m=material_id, lo=temp_cold, hi=temp_hot:
+                thermal.calculate_temperature_profile(m, geometry, hi, lo)),
+        ])
+
+    if name_filter:
+        benchmarks = [(name, func) for name, func in benchmarks if name_filter in name]
+    return benchmarks
+
+
+def time_callable(func: Callable[[], Any], min_time: float = 0.05,
+                  repeats: int = 5) -> Dict[str, float]:
+    """
+    Time a callable like ``timeit``: calibrate a loop count, then repeat.
+
+    Args:
+        func: Zero-argument callable (called once beforehand to warm caches)
+        min_time: Minimum duration of one repeat in seconds
+        repeats: Number of timed repeats
+
+    Returns:
+        Per-call 'min_s' and 'median_s' plus the 'loops' and 'repeats' used
+    """
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        'min_s': min(samples),
+        'median_s': statistics.median(samples),
+        'loops': loops,
+        'repeats': repeats,
+    }
+
+
+def run_benchmarks(name_filter: Optional[str] = None, min_time: float = 0.05,
+                   repeats: int = 5, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Run the suite and return the JSON-serializable results.
+
+    Args:
+        name_filter: Only run benchmarks whose name contains this substring
+        min_time: Minimum duration of one repeat in seconds
+        repeats: Number of timed repeats per benchmark
+        verbose: Print each result as it completes
+
+    Returns:
+        Dictionary with 'metadata' and 'results' (name -> timings)
+    """
+    calculator = MaterialCalculator()
+    thermal = ThermalCalculator(calculator)
+    results: Dict[str, Dict[str, float]] = {}
+    for name, func in collect_benchmarks(calculator, thermal, name_filter):
+        results[name] = time_callable(func, min_time, repeats)
+        if verbose:
+            print(f"{name:<80} {results[name]['min_s'] * 1e6:12.2f} µs")
+    return {
+        'metadata': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'min_time_s': min_time,
+            'repeats': repeats,
+        },
+        'results': results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Compare two result sets by their best (minimum) per-call time.
+
+    Args:
+        current: Results from ``run_benchmarks``
+        baseline: Stored results to compare against
+        threshold: Relative slowdown above which a benchmark is a regression
+
+    Returns:
+        One row per benchmark present in both sets, with 'name', 'baseline_s',
+        'current_s', 'ratio' and 'regression'
+    """
+    rows = []
+    for name, timing in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        ratio = timing['min_s'] / reference['min_s'] if reference['min_s'] > 0 else float('inf')
+        rows.append({
+            'name': name,
+            'baseline_s': reference['min_s'],
+            'current_s': timing['min_s'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='CryoCalc benchmark suite')
+    parser.add_argument('-o', '--output', help='Write results to this JSON file')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare against a stored results file')
+    parser.add_argument('--current', metavar='RESULTS',
+                        help='Use an existing results file instead of running the suite')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown flagged as a regression (default 0.25)')
+    parser.add_argument('-k', '--filter', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='Minimum seconds per timed repeat (default 0.05)')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed repeats per benchmark')
+    parser.add_argument('--quick', action='store_true',
+                        help='Short smoke run (min-time 0.002 s, 2 repeats)')
+    args = parser.parse_args(argv)
+
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        min_time, repeats = (0.002, 2) if args.quick else (args.min_time, args.repeats)
+        current = run_benchmarks(args.filter, min_time, repeats)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"Wrote {len(current['results'])} results to {args.output}")
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    rows = compare_results(current, baseline, args.threshold)
+    regressions = [row for row in rows if row['regression']]
+    print(f"\nComparison against {args.compare} (threshold +{args.threshold:.0%}):")
+    for row in sorted(rows, key=lambda row: -row['ratio']):
+        flag = 'REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:<80} {row['baseline_s'] * 1e6:10.2f} → "
+              f"{row['current_s'] * 1e6:10.2f} µs  ×{row['ratio']:.2f} {flag}")
+    missing = sorted(set(baseline['results']) - set(current['results']))
+    if missing and not args.filter:
+        print(f"{len(missing)} baseline benchmarks not run: {', '.join(missing[:5])}"
+              f"{' ...' if len(missing) > 5 else ''}")
+    print(f"{len(regressions)} regression(s) in {len(rows)} compared benchmarks")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
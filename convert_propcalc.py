@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+"""
+Convert the fits hard-coded in propcalc.js into materials.json entries.
+
+Every ``case`` of the propcalc.js switch is parsed (see
+``validation_test.parse_js_cases``), its coefficient variables are evaluated,
+and its formula is expanded symbolically into a sum of terms
+c * (x - x0)^p * exp(k x) times erf windows (1 +/- erf(s (x - x_c))) / 2,
+with x = T or log10(T). The expanded form is then classified:
+
+    log10 output, integer powers of log10(T)  -> logarithmic_polynomial
+    plain output, integer powers of T         -> polynomial
+    ratio of sums of T^(i/2), log10 output    -> rational
+    anything else expressible as above        -> erf_composite
+
+Each entry is compiled with ``cryocalc.evaluators.compile_evaluator`` and
+compared with the JavaScript over its range in one batched Node.js process;
+only entries within ``--tolerance`` are emitted.
+
+Usage:
+    python convert_propcalc.py                          # report only
+    python convert_propcalc.py -o materials_full.json   # merged database
+    python convert_propcalc.py -o new.json --no-merge   # converted entries only
+"""
+
+import argparse
+import ast
+import json
+import math
+import os
+import re
+import shutil
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cryocalc.evaluators import compile_evaluator
+from cryocalc.materials import DEFAULT_DATA_FILE
+from cryocalc.properties import EquationType
+from validation_test import (DEFAULT_JS_FILE, JS_CASE_MAP, JSCase, NodePropcalc,
+                             case_temperatures, parse_js_cases, relative_errors)
+
+PROPERTY_NAMES = {
+    'TC': 'thermal_conductivity',
+    'SH': 'specific_heat',
+    'YM': 'youngs_modulus',
+    'LE': 'linear_expansion',
+    'EC': 'expansion_coefficient',
+}
+
+# Header words that describe the fit rather than distinguish variants
+_NOISE_WORDS = {'equation', 'range', 'different', 'uncertainty', 'direction', 'filled', 'k'}
+
+
+class ConversionError(ValueError):
+    """Raised when a case cannot be expressed as a supported equation type."""
+
+
+# --- Symbolic expansion -------------------------------------------------------
+#
+# A term is (coefficient, factors) where factors is a frozenset of
+# (key, value) pairs:
+#   ('pow', var, offset) -> power     (x - offset)^power, var 'T' or 'L'
+#   ('exp', var)         -> rate      exp(rate * x)
+#   ('erf', var, s, c)   -> 1         erf(s * (x - c)), only transiently
+#   ('win', var, s, c, sign) -> count (1 + sign * erf(s * (x - c))) / 2
+# A sum is a list of terms.
+
+Term = Tuple[float, frozenset]
+
+
+def _constant(value: float) -> List[Term]:
+    return [(float(value), frozenset())]
+
+
+def _multiply_terms(left: Term, right: Term) -> Term:
+    factors = dict(left[1])
+    for key, value in right[1]:
+        if key[0] == 'erf' and key in factors:
+            raise ConversionError("Products of erf functions are not supported")
+        factors[key] = factors.get(key, 0) + value
+    return (left[0] * right[0], frozenset((k, v) for k, v in factors.items() if v != 0))
+
+
+def _multiply(left: List[Term], right: List[Term]) -> List[Term]:
+    return _combine_windows([_multiply_terms(a, b) for a in left for b in right])
+
+
+def _combine_windows(terms: List[Term]) -> List[Term]:
+    """Fold pairs c * F +/- c * F * erf(u) into 2c * F * window(u)."""
+    terms = list(terms)
+    changed = True
+    while changed:
+        changed = False
+        for index, (coefficient, factors) in enumerate(terms):
+            erfs = [key for key, _ in factors if key[0] == 'erf']
+            if not erfs:
+                continue
+            key = erfs[0]
+            rest = frozenset(item for item in factors if item[0] != key)
+            for partner_index, (partner_coefficient, partner_factors) in enumerate(terms):
+                if partner_factors != rest or abs(partner_coefficient) != abs(coefficient):
+                    continue
+                sign = 1.0 if partner_coefficient == coefficient else -1.0
+                window = ('win',) + key[1:] + (sign,)
+                combined = _multiply_terms((2 * partner_coefficient, rest),
+                                           (1.0, frozenset({(window, 1)})))
+                terms = [term for i, term in enumerate(terms) if i not in (index, partner_index)]
+                terms.append(combined)
+                changed = True
+                break
+            if changed:
+                break
+    return terms
+
+
+def _as_constant(terms: List[Term]) -> Optional[float]:
+    if all(not factors for _, factors in terms):
+        return sum(coefficient for coefficient, _ in terms)
+    return None
+
+
+def _as_linear(terms: List[Term]) -> Optional[Tuple[str, float, float]]:
+    """Return (var, slope, intercept) if the sum is slope * x + intercept."""
+    slope, intercept, variable = 0.0, 0.0, None
+    for coefficient, factors in terms:
+        if not factors:
+            intercept += coefficient
+            continue
+        if len(factors) != 1:
+            return None
+        (key, power), = factors
+        if key[0] != 'pow' or key[2] != 0 or power != 1 or variable not in (None, key[1]):
+            return None
+        variable = key[1]
+        slope += coefficient
+    if variable is None or slope == 0:
+        return None
+    return variable, slope, intercept
+
+
+class _Ratio:
+    """Quotient of two sums (only allowed as the whole formula)."""
+
+    def __init__(self, numerator: List[Term], denominator: List[Term]):
+        self.numerator = numerator
+        self.denominator = denominator
+
+
+def _expand(node: ast.AST, values: Dict[str, float]):
+    """Expand a parsed formula (Python syntax, see ``_to_python``) into a sum."""
+    if isinstance(node, ast.Expression):
+        return _expand(node.body, values)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return _constant(node.value)
+    if isinstance(node, ast.Name):
+        if node.id == 'T':
+            return [(1.0, frozenset({(('pow', 'T', 0.0), 1.0)}))]
+        if node.id in values:
+            return _constant(values[node.id])
+        raise ConversionError(f"Undefined variable '{node.id}'")
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _sum(_expand(node.operand, values))
+        sign = -1.0 if isinstance(node.op, ast.USub) else 1.0
+        return [(sign * c, f) for c, f in operand]
+    if isinstance(node, ast.BinOp):
+        left = _expand(node.left, values)
+        right = _expand(node.right, values)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            left, right = _sum(left), _sum(right)
+            sign = 1.0 if isinstance(node.op, ast.Add) else -1.0
+            return _combine_windows(left + [(sign * c, f) for c, f in right])
+        if isinstance(node.op, ast.Mult):
+            return _multiply(_sum(left), _sum(right))
+        if isinstance(node.op, ast.Div):
+            left, right = _sum(left), _sum(right)
+            if len(right) == 1 and not any(key[0] in ('win', 'erf') for key, _ in right[0][1]):
+                coefficient, factors = right[0]
+                inverse = (1.0 / coefficient, frozenset((k, -v) for k, v in factors))
+                return [_multiply_terms(term, inverse) for term in left]
+            return _Ratio(left, right)
+        raise ConversionError(f"Unsupported operator {type(node.op).__name__}")
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        name = node.func.id
+        args = [_sum(_expand(arg, values)) for arg in node.args]
+        if name == 'log10' and len(args) == 1:
+            if args[0] == [(1.0, frozenset({(('pow', 'T', 0.0), 1.0)}))]:
+                return [(1.0, frozenset({(('pow', 'L', 0.0), 1.0)}))]
+            constant = _as_constant(args[0])
+            if constant is not None:
+                return _constant(math.log10(constant))
+            raise ConversionError("log10 of anything but T is not supported")
+        if name == 'pow' and len(args) == 2:
+            exponent = _as_constant(args[1])
+            if exponent is None:
+                raise ConversionError("Variable exponents are not supported")
+            base = args[0]
+            constant = _as_constant(base)
+            if constant is not None:
+                return _constant(math.pow(constant, exponent))
+            if len(base) == 1 and all(key[0] in ('pow', 'exp') for key, _ in base[0][1]):
+                coefficient, factors = base[0]
+                return [(coefficient ** exponent,
+                         frozenset((k, v * exponent) for k, v in factors))]
+            linear = _as_linear(base)
+            if linear is not None and linear[1] == 1.0:
+                variable, _, intercept = linear
+                return [(1.0, frozenset({(('pow', variable, -intercept), exponent)}))]
+            if float(exponent).is_integer() and exponent >= 0:
+                result = _constant(1.0)
+                for _ in range(int(exponent)):
+                    result = _multiply(result, base)
+                return result
+            raise ConversionError("Unsupported power expression")
+        if name == 'exp' and len(args) == 1:
+            constant = _as_constant(args[0])
+            if constant is not None:
+                return _constant(math.exp(constant))
+            linear = _as_linear(args[0])
+            if linear is None or linear[2] != 0:
+                raise ConversionError("exp() argument must be proportional to T or log10(T)")
+            return [(1.0, frozenset({(('exp', linear[0]), linear[1])}))]
+        if name == 'erf' and len(args) == 1:
+            linear = _as_linear(args[0])
+            if linear is None:
+                raise ConversionError("erf() argument must be linear in T or log10(T)")
+            variable, slope, intercept = linear
+            return [(1.0, frozenset({(('erf', variable, slope, -intercept / slope), 1)}))]
+        raise ConversionError(f"Unsupported function {name}()")
+    raise ConversionError(f"Unsupported syntax {type(node).__name__}")
+
+
+def _sum(value) -> List[Term]:
+    if isinstance(value, _Ratio):
+        raise ConversionError("Quotients of sums are only supported as the whole formula")
+    return value
+
+
+def _to_python(js_expression: str) -> str:
+    """Translate the JavaScript arithmetic subset used by propcalc.js."""
+    expression = re.sub(r'\bMath\s*\.\s*', '', js_expression)
+    expression = re.sub(r'\bnum2\b', 'T', expression)
+    return ' '.join(expression.split())
+
+
+def _evaluate_constant(js_expression: str, values: Dict[str, float]) -> float:
+    try:
+        tree = ast.parse(_to_python(js_expression), mode='eval')
+    except SyntaxError as e:
+        raise ConversionError(f"Cannot parse '{js_expression.strip()}'") from e
+    constant = _as_constant(_sum(_expand(tree, values)))
+    if constant is None:
+        raise ConversionError(f"Coefficient '{js_expression.strip()}' is not a constant")
+    return constant
+
+
+# --- Case conversion ----------------------------------------------------------
+
+def _strip_comments(source: str) -> str:
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
+    return re.sub(r'//[^\n]*', '', source)
+
+
+def extract_formula(js_case: JSCase) -> Tuple[Dict[str, float], str, bool]:
+    """
+    Pull the coefficients and formula out of a case block.
+
+    Args:
+        js_case: Parsed case
+
+    Returns:
+        (coefficient values by variable name, formula for ``num1`` in Python
+        syntax, whether the output is 10^num1)
+
+    Raises:
+        ConversionError: If the block does not have the expected structure
+    """
+    body = _strip_comments(js_case.body)
+    values: Dict[str, float] = {}
+    for name, expression in re.findall(r'\bvar\s+([A-Za-z_]\w*)\s*=\s*([^\n;]+)', body):
+        values[name] = _evaluate_constant(expression, values)
+    formulas = re.findall(r'\bnum1\s*=\s*(.*?);', body, flags=re.DOTALL)
+    outputs = re.findall(r'\bout\.value\s*=\s*(.*?);', body, flags=re.DOTALL)
+    if len(formulas) != 1 or len(outputs) != 1:
+        raise ConversionError("Expected one num1 formula and one output assignment")
+    output = re.sub(r'\s+', '', outputs[0])
+    output = re.sub(r'\.toFixed\(num3\)$', '', output)
+    if output not in ('num1', 'Math.pow(10,num1)'):
+        raise ConversionError(f"Unsupported output expression '{outputs[0].strip()}'")
+    return values, _to_python(formulas[0]), output != 'num1'
+
+
+def _variable(terms: List[Term]) -> Optional[str]:
+    variables = {key[1] for _, factors in terms for key, _ in factors}
+    if len(variables) > 1:
+        raise ConversionError("Formula mixes T and log10(T)")
+    return variables.pop() if variables else None
+
+
+def _is_plain_polynomial(terms: List[Term]) -> bool:
+    """True if every term is c * x^n with a non-negative integer n."""
+    for _, factors in terms:
+        for (key, power) in factors:
+            if key[0] != 'pow' or key[2] != 0 or power < 0 or not float(power).is_integer():
+                return False
+    return True
+
+
+def _coefficients_by_power(terms: List[Term], scale: float = 1.0) -> List[float]:
+    """Coefficient list indexed by power * scale (terms must be monomials)."""
+    by_index: Dict[int, float] = {}
+    for coefficient, factors in terms:
+        power = dict(factors)
+        index = int(round(scale * sum(power.values()))) if power else 0
+        by_index[index] = by_index.get(index, 0.0) + coefficient
+    return [by_index.get(i, 0.0) for i in range(max(by_index) + 1)]
+
+
+def classify_formula(formula: str, values: Dict[str, float], log_output: bool) -> Dict[str, Any]:
+    """
+    Classify an expanded formula and build the equation part of its entry.
+
+    Args:
+        formula: Formula for ``num1`` in Python syntax (from ``extract_formula``)
+        values: Coefficient values by variable name
+        log_output: Whether the property is 10^num1
+
+    Returns:
+        Property dictionary without range and units, e.g.
+        ``{'equation_type': 'polynomial', 'coefficients': [...]}``
+
+    Raises:
+        ConversionError: If the formula cannot be expressed
+    """
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError as e:
+        raise ConversionError(f"Cannot parse formula '{formula}'") from e
+    expanded = _expand(tree, values)
+
+    if isinstance(expanded, _Ratio):
+        parts = (expanded.numerator, expanded.denominator)
+        if not log_output or any(_variable(part) not in ('T', None) for part in parts) \
+                or not all(_is_plain_polynomial_half(part) for part in parts):
+            raise ConversionError("Only log10 output ratios of sums of T^(i/2) are supported")
+        numerator, denominator = (_coefficients_by_power(part, scale=2.0) for part in parts)
+        return {'equation_type': EquationType.RATIONAL.value,
+                'coefficients': numerator + denominator,
+                'numerator_coefficients': numerator,
+                'denominator_coefficients': denominator}
+
+    variable = _variable(expanded)
+    if _is_plain_polynomial(expanded):
+        if variable in ('L', None) and log_output:
+            # The packaged database spells this type out in full
+            return {'equation_type': 'logarithmic_polynomial',
+                    'coefficients': _coefficients_by_power(expanded)}
+        if variable in ('T', None) and not log_output:
+            return {'equation_type': EquationType.POLYNOMIAL.value,
+                    'coefficients': _coefficients_by_power(expanded)}
+
+    segments: List[Dict[str, Any]] = []
+    window_sets: List[tuple] = []
+    for coefficient, factors in expanded:
+        windows = tuple(sorted(key for key, count in factors if key[0] == 'win'
+                               for _ in range(int(count))))
+        if any(key[0] == 'erf' for key, _ in factors):
+            raise ConversionError("erf() outside a (1 +/- erf) / 2 window")
+        powers = [(key, power) for key, power in factors if key[0] == 'pow']
+        rates = [rate for key, rate in factors if key[0] == 'exp']
+        if len(powers) > 1:
+            raise ConversionError("Products of shifted powers are not supported")
+        term: Dict[str, float] = {'coefficient': coefficient}
+        if powers:
+            (key, power), = powers
+            term['power'] = power
+            if key[2]:
+                term['offset'] = key[2]
+        if rates:
+            term['decay'] = -1.0 / rates[0]
+        if windows not in window_sets:
+            window_sets.append(windows)
+            segments.append({'terms': [], 'windows': [
+                {'center': center, 'slope': slope, 'side': 'above' if sign > 0 else 'below'}
+                for _, _, slope, center, sign in windows
+            ]})
+        segments[window_sets.index(windows)]['terms'].append(term)
+    return {'equation_type': EquationType.ERF_COMPOSITE.value,
+            'variable': 'log10' if variable == 'L' else 'linear',
+            'log_output': log_output,
+            'segments': segments}
+
+
+def _is_plain_polynomial_half(terms: List[Term]) -> bool:
+    for _, factors in terms:
+        for (key, power) in factors:
+            if key[0] != 'pow' or key[2] != 0 or power < 0 or not float(2 * power).is_integer():
+                return False
+    return True
+
+
+def _needs_positive_temperature(entry: Dict[str, Any]) -> bool:
+    equation_type = entry['equation_type']
+    return equation_type in ('logarithmic_polynomial', EquationType.ERF_COMPOSITE.value)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def material_id_for(material: str) -> str:
+    """Database ID for a header material name, e.g. 'Lead' -> 'lead'."""
+    return _slug(re.sub(r'\(UNS[^)]*\)', '', material))
+
+
+def qualifier_for(js_case: JSCase) -> str:
+    """Distinguishing words after the range in a header (e.g. 'grain', 'rrr_150')."""
+    span = re.search(r'to\s*[\d.]+\s*K', js_case.header)
+    text = js_case.header[span.end():] if span else ''
+    text = re.sub(r'\d+(\.\d+)?\s*%', ' ', text)
+    text = re.sub(r'density:?\s*\(?\s*([\d.]+)\s*kg/m\^3\s*=\s*[\d.]+\s*lb/ft\^3',
+                  lambda m: f" {m.group(1).replace('.', 'p')} kgm3 ", text)
+    text = text.replace('/', ' ').replace('=', ' ')
+    words = [word for word in _slug(text).split('_') if word and word not in _NOISE_WORDS]
+    return '_'.join(words)
+
+
+def convert_cases(cases: List[JSCase],
+                  case_map: Optional[Dict[int, Tuple[str, str]]] = None,
+                  base: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Convert parsed cases into database entries (not yet validated).
+
+    Cases listed in ``case_map`` keep their existing material and property
+    names. Others are named from the header: the material without its UNS
+    number, the property from its code, and, where one material has several
+    fits for a property, a suffix from the header's trailing words.
+
+    Args:
+        cases: Cases from ``parse_js_cases``
+        case_map: JS case -> (material_id, property_name). Defaults to
+            ``validation_test.JS_CASE_MAP``.
+        base: Existing materials dictionary; supplies the temperature range of
+            mapped cases whose header gives none
+
+    Returns:
+        One row per case with 'case', 'header', 'material_id', 'material_name',
+        'property_name', 'entry' (property dictionary or None) and 'status'
+        ('converted' or the reason it was not)
+    """
+    case_map = JS_CASE_MAP if case_map is None else case_map
+    by_label: Dict[int, List[JSCase]] = {}
+    for js_case in cases:
+        by_label.setdefault(js_case.case, []).append(js_case)
+
+    rows = []
+    for js_case in cases:
+        row = {'case': js_case.case, 'header': js_case.header, 'material_id': None,
+               'material_name': js_case.material, 'property_name': None, 'entry': None}
+        rows.append(row)
+        if not js_case.reachable:
+            row['status'] = 'unreachable (duplicate case label)'
+            continue
+        # A bare header may be completed by a later block with the same label
+        described = next((c for c in by_label[js_case.case] if c.property_code), js_case)
+        temperature_range = js_case.temperature_range or described.temperature_range
+        try:
+            values, formula, log_output = extract_formula(js_case)
+            entry = classify_formula(formula, values, log_output)
+        except ConversionError as e:
+            row['status'] = f"not converted: {e}"
+            continue
+
+        if js_case.case in case_map:
+            row['material_id'], row['property_name'] = case_map[js_case.case]
+            if temperature_range is None and base:
+                known = base.get(row['material_id'], {}).get('properties', {})
+                temperature_range = known.get(row['property_name'], {}).get('temperature_range')
+        elif described.property_code:
+            row['material_id'] = material_id_for(described.material)
+            row['material_name'] = described.material
+            row['property_name'] = PROPERTY_NAMES[described.property_code[:2]]
+            if described.property_code[2:]:
+                row['property_name'] += f"_{described.property_code[2:]}"
+            row['qualifier'] = qualifier_for(described)
+        else:
+            row['status'] = "not converted: header names no property"
+            continue
+        if temperature_range is None:
+            row['status'] = "not converted: header gives no temperature range"
+            continue
+
+        low, high = temperature_range
+        if low <= 0 and _needs_positive_temperature(entry):
+            low = 1.0
+        entry['temperature_range'] = [_compact(low), _compact(high)]
+        if described.units:
+            entry['units'] = described.units
+        entry['source'] = f"propcalc.js case {js_case.case}"
+        row['entry'] = entry
+        row['status'] = 'converted'
+
+    _disambiguate(rows, case_map)
+    return rows
+
+
+def _disambiguate(rows: List[Dict[str, Any]], case_map: Dict[int, Tuple[str, str]]) -> None:
+    """Give fits that share a material and property distinct property names."""
+    taken = {pair for pair in case_map.values()}
+    groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        if row['entry'] is not None and row['case'] not in case_map:
+            groups.setdefault((row['material_id'], row['property_name']), []).append(row)
+    for (material_id, property_name), group in groups.items():
+        if len(group) == 1 and (material_id, property_name) not in taken:
+            taken.add((material_id, property_name))
+            continue
+        for row in group:
+            name = f"{property_name}_{row['qualifier']}" if row['qualifier'] else property_name
+            if (material_id, name) in taken:
+                name = f"{property_name}_case{row['case']}"
+            row['property_name'] = name
+            taken.add((material_id, name))
+
+
+def _compact(value: float):
+    return int(value) if float(value).is_integer() else float(value)
+
+
+def validate_rows(rows: List[Dict[str, Any]], js_file_path: str, num_points: int = 100,
+                  tolerance: float = 1e-9, node: str = 'node') -> None:
+    """
+    Compare every converted entry with propcalc.js in one batch.
+
+    Sets 'max_rel_error' on converted rows and changes their status to
+    'rejected: ...' when the error exceeds ``tolerance`` or the JavaScript
+    gives no value somewhere in the range.
+    """
+    converted = [row for row in rows if row['entry'] is not None]
+    grids, evaluations = [], []
+    for row in converted:
+        evaluator = compile_evaluator(row['material_id'], row['property_name'], row['entry'])
+        temperatures = case_temperatures(evaluator.temperature_range, num_points)
+        grids.append(temperatures)
+        evaluations.append(evaluator)
+
+    node_process = NodePropcalc(js_file_path, node)
+    try:
+        node_process.submit([(row['case'], grid) for row, grid in zip(converted, grids)])
+        py_results = []
+        for evaluator, grid in zip(evaluations, grids):
+            with np.errstate(all='ignore'):
+                try:
+                    py_results.append(evaluator.evaluate_array(grid))
+                except ValueError as e:
+                    py_results.append(e)
+        js_results = node_process.receive()
+    finally:
+        node_process.close()
+
+    for row, grid, js_values, py_values in zip(converted, grids, js_results, py_results):
+        if isinstance(py_values, ValueError):
+            row['status'] = f"rejected: {py_values}"
+        elif np.isnan(js_values).any():
+            row['status'] = (f"rejected: JavaScript gives no value at "
+                             f"{grid[np.isnan(js_values)][0]:g} K")
+        else:
+            errors = np.nan_to_num(relative_errors(js_values, py_values), nan=np.inf)
+            row['max_rel_error'] = float(errors.max())
+            if row['max_rel_error'] > tolerance:
+                row['status'] = f"rejected: max relative error {row['max_rel_error']:.2e}"
+        if row['status'] != 'converted':
+            row['entry'] = None
+
+
+def build_database(rows: List[Dict[str, Any]],
+                   base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Assemble converted rows into a materials dictionary.
+
+    Args:
+        rows: Rows from ``convert_cases`` (after ``validate_rows``)
+        base: Existing materials dictionary to merge into; its entries are kept
+            and converted fits are only added where a property is missing
+
+    Returns:
+        Mapping of material IDs to material data
+    """
+    materials = json.loads(json.dumps(base)) if base else {}
+    for row in rows:
+        if row['entry'] is None:
+            continue
+        material = materials.setdefault(row['material_id'],
+                                        {'name': row['material_name'], 'properties': {}})
+        material['properties'].setdefault(row['property_name'], row['entry'])
+    return materials
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    """Format conversion rows as a table with a summary line."""
+    lines = [f"{'case':>5}  {'entry':<62} {'type':<23} {'max rel err':>11}  status", '-' * 120]
+    for row in rows:
+        entry = (f"{row['material_id']}/{row['property_name']}" if row['material_id']
+                 else row['header'][:62])
+        equation = row['entry']['equation_type'] if row['entry'] else '-'
+        error = f"{row['max_rel_error']:.2e}" if row.get('max_rel_error') is not None else '-'
+        lines.append(f"{row['case']:>5}  {entry:<62} {equation:<23} {error:>11}  {row['status']}")
+    converted = sum(1 for row in rows if row['entry'] is not None)
+    lines.append('-' * 120)
+    lines.append(f"{converted} of {len(rows)} cases converted")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Convert propcalc.js fits to materials.json')
+    parser.add_argument('--js', default=DEFAULT_JS_FILE, help='Path to propcalc.js')
+    parser.add_argument('-o', '--output', help='Write the database to this JSON file')
+    parser.add_argument('--base', default=str(DEFAULT_DATA_FILE),
+                        help='Database to merge into (default: the packaged materials.json)')
+    parser.add_argument('--no-merge', action='store_true',
+                        help='Write only the converted entries')
+    parser.add_argument('--tolerance', type=float, default=1e-9,
+                        help='Maximum relative error against the JavaScript')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='Skip the comparison with Node.js (entries are unverified)')
+    parser.add_argument('--node', default='node', help='Node.js executable')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.js):
+        print(f"JavaScript file not found: {args.js}", file=sys.stderr)
+        return 2
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)['materials']
+    with open(args.js, encoding='utf-8') as f:
+        rows = convert_cases(parse_js_cases(f.read()), base=base)
+
+    if args.no_validate:
+        print("Warning: entries were not compared with propcalc.js", file=sys.stderr)
+    elif shutil.which(args.node) is None:
+        print("Node.js not found; install it or pass --no-validate", file=sys.stderr)
+        return 2
+    else:
+        validate_rows(rows, args.js, tolerance=args.tolerance, node=args.node)
+    print(format_report(rows))
+
+    if args.output:
+        materials = build_database(rows, None if args.no_merge else base)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'materials': materials}, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {len(materials)} materials to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
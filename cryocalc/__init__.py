@@ -12,19 +12,60 @@ License: MIT
 from .properties import PropertyType, EquationType, PropertyCalculator
 from .materials import MaterialDatabase
 from .calculator import MaterialCalculator
-from .thermal import (
-    ThermalCalculator,
-    Geometry,
-    RodGeometry,
-    TubeGeometry,
-    BarGeometry,
-    CustomGeometry,
-    create_rod,
-    create_wire,
-    create_tube,
-    create_bar,
-    create_custom
-)
+from .evaluators import PropertyEvaluator
+
+# Thermal analysis and surrogate models are imported on first attribute
+# access, so the scalar property path and the CLI start without loading them.
+_LAZY_ATTRIBUTES = {
+    'ChebyshevEvaluator': 'surrogates',
+    'AsyncThermalCalculator': 'aio',
+    'ThermalNetwork': 'network',
+    'TransientSolver': 'transient',
+    'CalculationStats': 'instrumentation',
+    'instrument': 'instrumentation',
+    'ThermalCalculator': 'thermal',
+    'Geometry': 'thermal',
+    'RodGeometry': 'thermal',
+    'TubeGeometry': 'thermal',
+    'BarGeometry': 'thermal',
+    'CustomGeometry': 'thermal',
+    'create_rod': 'thermal',
+    'create_wire': 'thermal',
+    'create_tube': 'thermal',
+    'create_bar': 'thermal',
+    'create_custom': 'thermal',
+    'VariableGeometry': 'thermal',
+    'FrustumGeometry': 'thermal',
+    'SteppedGeometry': 'thermal',
+    'ProfileGeometry': 'thermal',
+    'create_frustum': 'thermal',
+    'create_stepped': 'thermal',
+    'create_profile': 'thermal',
+    'GeometryArray': 'thermal',
+    'RodArray': 'thermal',
+    'TubeArray': 'thermal',
+    'BarArray': 'thermal',
+    'CustomArray': 'thermal',
+    'create_rod_array': 'thermal',
+    'create_tube_array': 'thermal',
+    'create_bar_array': 'thermal',
+    'create_custom_array': 'thermal',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __version__ = "1.0.0"
 __author__ = "CryoCalc Development Team"
@@ -36,9 +77,16 @@ __all__ = [
     'EquationType', 
     'MaterialCalculator',
     'MaterialDatabase',
+    'PropertyEvaluator',
+    'ChebyshevEvaluator',
     'PropertyType',
     'EquationType',
     'ThermalCalculator',
+    'AsyncThermalCalculator',
+    'ThermalNetwork',
+    'TransientSolver',
+    'CalculationStats',
+    'instrument',
     'Geometry',
     'RodGeometry',
     'TubeGeometry', 
@@ -48,5 +96,21 @@ __all__ = [
     'create_wire',
     'create_tube',
     'create_bar',
-    'create_custom'
+    'create_custom',
+    'VariableGeometry',
+    'FrustumGeometry',
+    'SteppedGeometry',
+    'ProfileGeometry',
+    'create_frustum',
+    'create_stepped',
+    'create_profile',
+    'GeometryArray',
+    'RodArray',
+    'TubeArray',
+    'BarArray',
+    'CustomArray',
+    'create_rod_array',
+    'create_tube_array',
+    'create_bar_array',
+    'create_custom_array'
 ]
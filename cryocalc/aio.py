@@ -0,0 +1,211 @@
+"""
+asyncio facade for thermal calculations.
+
+``AsyncThermalCalculator`` exposes the ``ThermalCalculator`` methods as
+coroutines that run in a thread or process pool, so integrations and profile
+solves do not block the event loop. Identical requests that are in flight at
+the same time share one computation.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from .thermal import ThermalCalculator
+
+
+# Per-process calculator used by process pool workers
+_worker_calculator: Optional[ThermalCalculator] = None
+
+
+def _call_in_worker(method_name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Run a ThermalCalculator method in a process pool worker."""
+    global _worker_calculator
+    if _worker_calculator is None:
+        _worker_calculator = ThermalCalculator()
+    return getattr(_worker_calculator, method_name)(*args, **kwargs)
+
+
+def _freeze(value: Any) -> Any:
+    """Build a hashable key for an argument; geometries compare by their fields."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, type):
+        return value
+    if hasattr(value, '__dict__'):
+        return (type(value).__qualname__, _freeze(vars(value)))
+    slots = [name for cls in type(value).__mro__ for name in getattr(cls, '__slots__', ())]
+    if slots:
+        return (type(value).__qualname__,
+                tuple((name, _freeze(getattr(value, name, None))) for name in slots))
+    hash(value)
+    return value
+
+
+class _InFlight:
+    """A running computation and the number of callers awaiting it."""
+
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+
+
+class AsyncThermalCalculator:
+    """
+    Non-blocking facade over ThermalCalculator.
+
+    Every coroutine method takes the same arguments as the ThermalCalculator
+    method of the same name. Results of coalesced requests are the same
+    object for every caller and should be treated as read-only.
+
+    Cancelling an awaiting task detaches that caller. When the last caller of
+    a request is cancelled, the pending job is cancelled too; a job that has
+    already started in a worker runs to completion and its result is dropped.
+
+    With ``executor='process'``, each worker process keeps its own default
+    ThermalCalculator, so calculators built on a custom database are only
+    supported with thread pools.
+    """
+
+    def __init__(self, thermal_calculator: Optional[ThermalCalculator] = None,
+                 executor: Any = 'thread', max_workers: Optional[int] = None):
+        """
+        Initialize the facade.
+
+        Args:
+            thermal_calculator: ThermalCalculator used by thread pool jobs. If
+                None, creates a default one.
+            executor: 'thread', 'process', or an existing
+                ``concurrent.futures.Executor`` (not shut down by ``close``)
+            max_workers: Worker count for executors created here
+
+        Raises:
+            ValueError: If ``executor`` is not recognized
+        """
+        self.thermal = thermal_calculator or ThermalCalculator()
+        if isinstance(executor, Executor):
+            self._executor = executor
+            self._owns_executor = False
+            self._use_processes = isinstance(executor, ProcessPoolExecutor)
+        elif executor == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix='cryocalc')
+            self._owns_executor = True
+            self._use_processes = False
+        elif executor == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            self._owns_executor = True
+            self._use_processes = True
+        else:
+            raise ValueError(
+                f"Unknown executor '{executor}'. Use 'thread', 'process' or an Executor"
+            )
+        self._in_flight: Dict[Tuple, _InFlight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently being computed."""
+        return len(self._in_flight)
+
+    async def run(self, method_name: str, *args, **kwargs) -> Any:
+        """
+        Run any ThermalCalculator method in the executor.
+
+        Args:
+            method_name: ThermalCalculator method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's return value
+        """
+        if not callable(getattr(ThermalCalculator, method_name, None)) or method_name.startswith('_'):
+            raise ValueError(f"Unknown ThermalCalculator method: {method_name}")
+
+        try:
+            key = (method_name, _freeze(args), _freeze(kwargs))
+        except TypeError:
+            key = None  # unhashable arguments: run without coalescing
+
+        entry = self._in_flight.get(key) if key is not None else None
+        if entry is None:
+            entry = _InFlight(self._submit(method_name, args, kwargs))
+            if key is not None:
+                self._in_flight[key] = entry
+                entry.future.add_done_callback(functools.partial(self._forget, key, entry))
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.future)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.future.done():
+                entry.future.cancel()
+
+    def _submit(self, method_name: str, args: tuple, kwargs: Dict[str, Any]) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if self._use_processes:
+            job = functools.partial(_call_in_worker, method_name, args, kwargs)
+        else:
+            job = functools.partial(getattr(self.thermal, method_name), *args, **kwargs)
+        return loop.run_in_executor(self._executor, job)
+
+    def _forget(self, key: Tuple, entry: _InFlight, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
+
+    def cancel_all(self) -> int:
+        """
+        Cancel every in-flight request.
+
+        Callers awaiting them receive ``asyncio.CancelledError``.
+
+        Returns:
+            Number of requests cancelled
+        """
+        entries = list(self._in_flight.values())
+        for entry in entries:
+            entry.future.cancel()
+        return len(entries)
+
+    async def integrate_thermal_conductivity(self, *args, **kwargs):
+        """Async ``ThermalCalculator.integrate_thermal_conductivity``."""
+        return await self.run('integrate_thermal_conductivity', *args, **kwargs)
+
+    async def calculate_thermal_conductivity_integral(self, *args, **kwargs):
+        """Async ``ThermalCalculator.calculate_thermal_conductivity_integral``."""
+        return await self.run('calculate_thermal_conductivity_integral', *args, **kwargs)
+
+    async def calculate_thermal_power(self, *args, **kwargs):
+        """Async ``ThermalCalculator.calculate_thermal_power``."""
+        return await self.run('calculate_thermal_power', *args, **kwargs)
+
+    async def calculate_temperature_profile(self, *args, **kwargs):
+        """Async ``ThermalCalculator.calculate_temperature_profile``."""
+        return await self.run('calculate_temperature_profile', *args, **kwargs)
+
+    async def get_calculation_summary(self, *args, **kwargs):
+        """Async ``ThermalCalculator.get_calculation_summary``."""
+        return await self.run('get_calculation_summary', *args, **kwargs)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Cancel in-flight requests and shut down an executor created here.
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        self.cancel_all()
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> 'AsyncThermalCalculator':
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        self.close(wait=False)
@@ -0,0 +1,228 @@
+"""
+Streaming batch evaluation of (material, property, temperature) queries.
+
+Rows are read in fixed-size chunks. Within a chunk, rows are grouped by
+(material, property) so that each group is evaluated with one vectorized call,
+and results are written back in input order before the next chunk is read.
+Memory use is bounded by the chunk size, not by the input length.
+"""
+
+import csv
+import json
+import math
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .calculator import MaterialCalculator
+
+
+#: Supported input/output formats
+FORMATS = ('csv', 'jsonl')
+
+#: Columns written for every result row
+OUTPUT_FIELDS = ['material', 'property', 'temperature', 'value', 'units', 'error']
+
+
+def detect_format(path: Optional[str], default: str = 'csv') -> str:
+    """
+    Guess the file format from a path's extension.
+
+    Args:
+        path: File path, or None/'-' for standard streams
+        default: Format used when the extension is not recognized
+
+    Returns:
+        'csv' or 'jsonl'
+    """
+    if path and path != '-':
+        lowered = path.lower()
+        if lowered.endswith(('.jsonl', '.ndjson', '.json')):
+            return 'jsonl'
+        if lowered.endswith(('.csv', '.txt')):
+            return 'csv'
+    return default
+
+
+class MalformedRow:
+    """Placeholder for an input line that could not be decoded into a row."""
+
+    __slots__ = ('message',)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read query rows from a CSV (with header) or JSONL stream.
+
+    Each row needs ``material``, ``property`` and ``temperature``; ``variant``
+    is optional and appended to the property name as in the CLI. JSONL lines
+    that are not valid JSON are yielded as ``MalformedRow`` so that
+    ``evaluate_rows`` reports them in place.
+
+    Args:
+        stream: Text stream
+        fmt: 'csv' or 'jsonl'
+
+    Yields:
+        Row dictionaries
+    """
+    if fmt == 'csv':
+        yield from csv.DictReader(stream)
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield MalformedRow(f"Line {line_number}: invalid JSON: {e}")
+    else:
+        raise ValueError(f"Unknown format '{fmt}'. Available: {', '.join(FORMATS)}")
+
+
+def _query(row: Dict[str, Any]) -> tuple:
+    """Extract (material, property, temperature) from a row; raises on bad rows."""
+    if isinstance(row, MalformedRow):
+        raise ValueError(row.message)
+    if not isinstance(row, dict):
+        raise ValueError(f"Row must be an object, got {type(row).__name__}")
+    material_id = row.get('material')
+    property_name = row.get('property')
+    if not material_id or not property_name:
+        raise ValueError("Row needs 'material' and 'property'")
+    if not isinstance(material_id, str) or not isinstance(property_name, str):
+        raise ValueError("Row 'material' and 'property' must be strings")
+    if row.get('variant'):
+        if not isinstance(row['variant'], str):
+            raise ValueError("Row 'variant' must be a string")
+        property_name = f"{property_name}_{row['variant']}"
+    temperature = row.get('temperature')
+    if temperature is None or temperature == '':
+        raise ValueError("Row needs 'temperature'")
+    return material_id, property_name, float(temperature)
+
+
+def evaluate_rows(rows: Iterable[Dict[str, Any]],
+                  calculator: Optional[MaterialCalculator] = None,
+                  precision: Optional[int] = 6,
+                  chunk_size: int = 8192) -> Iterator[Dict[str, Any]]:
+    """
+    Evaluate query rows, yielding one result per row in input order.
+
+    Errors (unknown material, out-of-range temperature, malformed row) are
+    reported in the row's ``error`` field instead of stopping the batch.
+
+    Args:
+        rows: Iterable of row dictionaries (see ``read_rows``)
+        calculator: MaterialCalculator to use. If None, creates a default one.
+        precision: Decimal places for values, or None for full precision
+        chunk_size: Number of rows evaluated together
+
+    Yields:
+        Result dictionaries with the ``OUTPUT_FIELDS`` keys
+    """
+    calculator = calculator or MaterialCalculator()
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield from _evaluate_chunk(chunk, calculator, precision)
+
+
+def _evaluate_chunk(chunk: List[Dict[str, Any]], calculator: MaterialCalculator,
+                    precision: Optional[int]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    groups: Dict[tuple, List[int]] = {}
+    temperatures: List[float] = []
+
+    for index, row in enumerate(chunk):
+        fields = row if isinstance(row, dict) else {}
+        result = {
+            'material': fields.get('material'),
+            'property': fields.get('property'),
+            'temperature': fields.get('temperature'),
+            'value': None,
+            'units': None,
+            'error': None,
+        }
+        try:
+            material_id, property_name, temperature = _query(row)
+        except (TypeError, ValueError) as e:
+            result['error'] = str(e)
+            temperature = math.nan
+        else:
+            result['property'] = property_name
+            result['temperature'] = temperature
+            groups.setdefault((material_id, property_name), []).append(index)
+        results.append(result)
+        temperatures.append(temperature)
+
+    for (material_id, property_name), indices in groups.items():
+        try:
+            evaluator = calculator.get_evaluator(material_id, property_name)
+        except ValueError as e:
+            for index in indices:
+                results[index]['error'] = str(e)
+            continue
+
+        temps = np.array([temperatures[i] for i in indices])
+        try:
+            values = evaluator.evaluate_many(temps, nan_out_of_range=True)
+        except ValueError:
+            # Some temperature in the group cannot be evaluated (e.g. T <= 0 in
+            # a log fit); fall back to one row at a time to isolate it
+            values = np.array([_evaluate_one(evaluator, temperature)
+                               for temperature in temps.tolist()], dtype=object)
+        for index, temperature, value in zip(indices, temps.tolist(), values.tolist()):
+            result = results[index]
+            result['units'] = evaluator.units
+            if isinstance(value, ValueError):
+                result['error'] = str(value)
+            elif not evaluator.min_temp <= temperature <= evaluator.max_temp:
+                result['error'] = (f"Temperature {temperature}K is outside valid range "
+                                   f"[{evaluator.min_temp}K, {evaluator.max_temp}K]")
+            elif math.isnan(value):
+                result['error'] = f"Property evaluates to NaN at {temperature}K"
+            else:
+                result['value'] = value if precision is None else float(np.round(value, precision))
+    return results
+
+
+def _evaluate_one(evaluator, temperature: float):
+    """Evaluate a single temperature, returning the ValueError instead of raising it."""
+    try:
+        return float(evaluator.evaluate_many(np.array([temperature]), nan_out_of_range=True)[0])
+    except ValueError as e:
+        return e
+
+
+def write_results(results: Iterable[Dict[str, Any]], stream: IO[str], fmt: str) -> int:
+    """
+    Write result rows as CSV (with header) or JSONL.
+
+    Args:
+        results: Result dictionaries from ``evaluate_rows``
+        stream: Output text stream
+        fmt: 'csv' or 'jsonl'
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=OUTPUT_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+            count += 1
+    elif fmt == 'jsonl':
+        for result in results:
+            stream.write(json.dumps(result) + '\n')
+            count += 1
+    else:
+        raise ValueError(f"Unknown format '{fmt}'. Available: {', '.join(FORMATS)}")
+    return count
@@ -0,0 +1,316 @@
+"""
+Compact binary format for material databases.
+
+A binary database holds the same data as materials.json in a layout that can
+be memory-mapped instead of parsed:
+
+    header       magic, version, material count and section offsets
+    strings      count, offset table and UTF-8 data for every key and text
+                 value, each stored once
+    floats       float64 array holding every all-number list (coefficients,
+                 ranges), 8-byte aligned; integers in such lists are flagged
+                 in the node so they load back as ints
+    nodes        tagged encoding of each material's nested data, with
+                 strings and float lists referenced by index
+    index        (material ID string, node offset) per material, in order
+
+All integers are little-endian. ``BinaryMaterials`` maps the file read-only
+and decodes a material only when it is first looked up, so opening a
+database costs only its index. The mapped pages come from the page cache and
+are shared by every process that opens the file. A material that is looked
+up is decoded into ordinary dicts and lists owned by the process, the same
+objects the JSON loader produces (evaluators compile their own arrays from
+them either way); the savings therefore come from materials a process never
+touches, not from the ones it uses.
+"""
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import mmap
+import os
+import struct
+
+#: File extension that ``MaterialDatabase.save_materials`` writes in binary
+BINARY_SUFFIX = ".cdb"
+
+MAGIC = b"CRYOCDB\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQQQ")
+_INDEX_ENTRY = struct.Struct("<IQ")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_FLOAT_REF = struct.Struct("<II")
+
+# Node tags
+_NULL, _TRUE, _FALSE = b"N", b"T", b"F"
+_INT, _FLOAT, _STRING, _FLOATS, _LIST, _DICT = b"i", b"f", b"s", b"a", b"l", b"d"
+_NUMBERS = b"n"  # float pool reference followed by a bitmask of int entries
+
+# Largest integer magnitude a float64 holds exactly
+_MAX_EXACT_INT = 2 ** 53
+
+
+def is_binary_materials_file(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file starts with the binary database signature.
+
+    Args:
+        path: File path
+
+    Returns:
+        True for binary databases, False for anything else (e.g. JSON)
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class _Encoder:
+    """Accumulates the string table, float pool and node stream."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.floats: List[float] = []
+        self.nodes = bytearray()
+
+    def string(self, text: str) -> int:
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def encode(self, value: Any) -> None:
+        nodes = self.nodes
+        if value is None:
+            nodes += _NULL
+        elif value is True:
+            nodes += _TRUE
+        elif value is False:
+            nodes += _FALSE
+        elif isinstance(value, int):
+            try:
+                nodes += _INT + _I64.pack(value)
+            except struct.error:
+                raise ValueError(f"Integer {value} does not fit in 64 bits")
+        elif isinstance(value, float):
+            nodes += _FLOAT + _F64.pack(value)
+        elif isinstance(value, str):
+            nodes += _STRING + _U32.pack(self.string(value))
+        elif isinstance(value, (list, tuple)):
+            types = {type(item) for item in value}
+            if value and types == {float}:
+                nodes += _FLOATS + _FLOAT_REF.pack(len(self.floats), len(value))
+                self.floats.extend(value)
+            elif value and types <= {int, float} and all(
+                    abs(item) <= _MAX_EXACT_INT for item in value if type(item) is int):
+                mask = bytearray((len(value) + 7) // 8)
+                for position, item in enumerate(value):
+                    if type(item) is int:
+                        mask[position // 8] |= 1 << (position % 8)
+                nodes += _NUMBERS + _FLOAT_REF.pack(len(self.floats), len(value)) + mask
+                self.floats.extend(float(item) for item in value)
+            else:
+                nodes += _LIST + _U32.pack(len(value))
+                for item in value:
+                    self.encode(item)
+        elif isinstance(value, Mapping):
+            nodes += _DICT + _U32.pack(len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise ValueError(f"Material data keys must be strings, got {key!r}")
+                nodes += _U32.pack(self.string(key))
+                self.encode(item)
+        else:
+            raise ValueError(f"Cannot store {type(value).__name__} in a binary database")
+
+
+def write_binary_materials(materials: Mapping, path: Union[str, Path]) -> None:
+    """
+    Write a materials mapping as a binary database.
+
+    The file is written to a temporary name and moved into place, so
+    processes that have the old file mapped keep reading consistent data.
+
+    Args:
+        materials: Mapping of material IDs to material data (JSON-compatible)
+        path: Output file path
+
+    Raises:
+        ValueError: If the data contains values JSON could not hold
+    """
+    encoder = _Encoder()
+    index = []
+    for material_id, material in materials.items():
+        offset = len(encoder.nodes)
+        encoder.encode(material)
+        index.append((encoder.string(material_id), offset))
+
+    encoded = [text.encode("utf-8") for text in encoder.strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    strings = (_U32.pack(len(encoded)) + struct.pack(f"<{len(offsets)}I", *offsets)
+               + b"".join(encoded))
+
+    strings_offset = _HEADER.size
+    floats_offset = strings_offset + len(strings)
+    floats_offset += -floats_offset % 8
+    nodes_offset = floats_offset + 8 * len(encoder.floats)
+    index_offset = nodes_offset + len(encoder.nodes)
+    header = _HEADER.pack(MAGIC, VERSION, len(index), strings_offset, floats_offset,
+                          len(encoder.floats), nodes_offset, index_offset)
+
+    path = Path(path)
+    temp_name = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_name, "wb") as f:
+            f.write(header)
+            f.write(strings)
+            f.write(b"\x00" * (floats_offset - strings_offset - len(strings)))
+            f.write(struct.pack(f"<{len(encoder.floats)}d", *encoder.floats))
+            f.write(encoder.nodes)
+            for string_index, offset in index:
+                f.write(_INDEX_ENTRY.pack(string_index, offset))
+        os.replace(temp_name, path)
+    except BaseException:
+        if temp_name.exists():
+            temp_name.unlink()
+        raise
+
+
+class BinaryMaterials(Mapping):
+    """
+    Read-only materials mapping over a memory-mapped binary database.
+
+    Behaves like the dictionary parsed from materials.json: values are plain
+    dicts and lists, decoded on first access and cached. Pickling reopens the
+    file by path, so process pools receive the path rather than the data.
+
+    Attributes:
+        path: Path of the mapped file
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Map a binary database file.
+
+        Args:
+            path: File written by ``write_binary_materials``
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a binary database of this version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Empty binary materials file: {self.path}")
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError(f"Truncated binary materials file: {self.path}")
+        (magic, version, count, self._strings_offset, self._floats_offset,
+         self._float_count, self._nodes_offset, index_offset) = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError(f"Not a binary materials file: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary materials version {version} in {self.path}")
+        if index_offset + count * _INDEX_ENTRY.size > len(self._buffer):
+            raise ValueError(f"Truncated binary materials file: {self.path}")
+
+        self._string_count = _U32.unpack_from(self._buffer, self._strings_offset)[0]
+        self._string_data = self._strings_offset + 4 * (self._string_count + 2)
+        self._strings: List[Optional[str]] = [None] * self._string_count
+        self._offsets: Dict[str, int] = {}
+        for position in range(index_offset, index_offset + count * _INDEX_ENTRY.size,
+                              _INDEX_ENTRY.size):
+            string_index, offset = _INDEX_ENTRY.unpack_from(self._buffer, position)
+            self._offsets[self._string(string_index)] = self._nodes_offset + offset
+        self._cache: Dict[str, Any] = {}
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
+    def __getitem__(self, material_id: str) -> Dict[str, Any]:
+        material = self._cache.get(material_id)
+        if material is None:
+            material = self._decode(self._offsets[material_id])[0]
+            self._cache[material_id] = material
+        return material
+
+    def __contains__(self, material_id: object) -> bool:
+        return material_id in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __repr__(self) -> str:
+        return f"BinaryMaterials({str(self.path)!r}, {len(self)} materials)"
+
+    def close(self) -> None:
+        """Unmap the file. Materials already decoded remain available."""
+        self._buffer.close()
+
+    def _string(self, index: int) -> str:
+        text = self._strings[index]
+        if text is None:
+            start, end = struct.unpack_from("<II", self._buffer,
+                                            self._strings_offset + 4 * (index + 1))
+            text = str(self._buffer[self._string_data + start:self._string_data + end],
+                       "utf-8")
+            self._strings[index] = text
+        return text
+
+    def _decode(self, position: int) -> Tuple[Any, int]:
+        """Decode the node at ``position``; returns (value, next position)."""
+        buffer = self._buffer
+        tag = buffer[position:position + 1]
+        position += 1
+        if tag == _DICT:
+            count = _U32.unpack_from(buffer, position)[0]
+            position += 4
+            result = {}
+            for _ in range(count):
+                key = self._string(_U32.unpack_from(buffer, position)[0])
+                result[key], position = self._decode(position + 4)
+            return result, position
+        if tag == _FLOATS:
+            start, count = _FLOAT_REF.unpack_from(buffer, position)
+            values = struct.unpack_from(f"<{count}d", buffer, self._floats_offset + 8 * start)
+            return list(values), position + _FLOAT_REF.size
+        if tag == _NUMBERS:
+            start, count = _FLOAT_REF.unpack_from(buffer, position)
+            values = list(struct.unpack_from(f"<{count}d", buffer,
+                                             self._floats_offset + 8 * start))
+            position += _FLOAT_REF.size
+            mask = buffer[position:position + (count + 7) // 8]
+            for index in range(count):
+                if mask[index // 8] >> (index % 8) & 1:
+                    values[index] = int(values[index])
+            return values, position + len(mask)
+        if tag == _LIST:
+            count = _U32.unpack_from(buffer, position)[0]
+            position += 4
+            result = []
+            for _ in range(count):
+                item, position = self._decode(position)
+                result.append(item)
+            return result, position
+        if tag == _STRING:
+            return self._string(_U32.unpack_from(buffer, position)[0]), position + 4
+        if tag == _FLOAT:
+            return _F64.unpack_from(buffer, position)[0], position + 8
+        if tag == _INT:
+            return _I64.unpack_from(buffer, position)[0], position + 8
+        if tag == _NULL:
+            return None, position
+        if tag == _TRUE:
+            return True, position
+        if tag == _FALSE:
+            return False, position
+        raise ValueError(f"Corrupt binary materials file {self.path}: bad tag {tag!r}")
@@ -2,11 +2,17 @@
 Main calculator class for cryogenic material property calculations.
 """
 
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import (TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple,
+                    Union)
 import math
 
+if TYPE_CHECKING:
+    import numpy as np
+
 from .materials import MaterialDatabase
 from .properties import PropertyType, PropertyCalculator, EquationType
+from .evaluators import PropertyEvaluator, compile_evaluator
 
 
 class MaterialCalculator:
@@ -17,15 +23,154 @@ class MaterialCalculator:
     and linear expansion for various materials at cryogenic temperatures.
     """
     
-    def __init__(self, database: Optional[MaterialDatabase] = None):
+    #: Available evaluation backends
+    BACKENDS = ('reference', 'chebyshev')
+    
+    def __init__(self, database: Optional[MaterialDatabase] = None,
+                 evaluator_cache_size: int = 256, backend: str = 'reference'):
         """
         Initialize the calculator.
         
         Args:
             database: MaterialDatabase instance. If None, creates default database.
+            evaluator_cache_size: Maximum number of compiled (material, property)
+                evaluators kept in the LRU cache
+            backend: Evaluation backend, 'reference' (the published fit equations)
+                or 'chebyshev' (verified Chebyshev surrogates, see ``set_backend``)
         """
         self.database = database or MaterialDatabase()
         self.property_calculator = PropertyCalculator()
+        self._evaluator_cache = lru_cache(maxsize=evaluator_cache_size)(self._compile_evaluator)
+        self._database_revision = self.database.revision
+        self._enthalpy_tables: Dict[str, Any] = {}
+        #: (material_id, property_name) -> why the 'chebyshev' backend kept
+        #: (part of) the reference equation, for evaluators compiled so far
+        self.surrogate_fallbacks: Dict[Tuple[str, str], str] = {}
+        self.instrumentation = None
+        self.backend = 'reference'
+        self.set_backend(backend)
+    
+    def set_backend(self, backend: str) -> None:
+        """
+        Select the evaluation backend.
+        
+        With 'chebyshev', each property is replaced by a Chebyshev expansion in
+        log T fitted over its valid range and verified against the reference
+        equation to a relative error of 1e-9; piecewise properties are fitted
+        piece by piece. Properties (or pieces) whose surrogate cannot reach
+        that tolerance keep the reference evaluator and are listed in
+        ``surrogate_fallbacks`` once compiled (see ``precompile_evaluators``).
+        
+        Args:
+            backend: 'reference' or 'chebyshev'
+            
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}'. Available: {', '.join(self.BACKENDS)}"
+            )
+        self.backend = backend
+        self.clear_evaluator_cache()
+    
+    def _compile_evaluator(self, material_id: str, property_name: str) -> PropertyEvaluator:
+        """Build a compiled evaluator from the database entry (cache miss path)."""
+        prop_data = self.database.get_material_property(material_id, property_name)
+        evaluator = compile_evaluator(material_id, property_name, prop_data)
+        if self.backend == 'chebyshev':
+            from .surrogates import fit_surrogate
+            evaluator, failures = fit_surrogate(evaluator)
+            if failures:
+                self.surrogate_fallbacks[(material_id, property_name)] = "; ".join(failures)
+        return evaluator
+    
+    def precompile_evaluators(self, material_ids: Optional[Sequence[str]] = None) -> int:
+        """
+        Build evaluators for every property up front instead of on first use.
+        
+        Useful with the 'chebyshev' backend, where fitting the surrogates is the
+        expensive step.
+        
+        Args:
+            material_ids: Materials to compile. If None, compiles all materials.
+            
+        Returns:
+            Number of evaluators compiled
+        """
+        if material_ids is None:
+            material_ids = self.database.get_available_materials()
+        count = 0
+        for material_id in material_ids:
+            for property_name in self.database.get_material_info(material_id)['properties']:
+                self.get_evaluator(material_id, property_name)
+                count += 1
+        return count
+    
+    def get_evaluator(self, material_id: str, property_name: str) -> PropertyEvaluator:
+        """
+        Get the compiled evaluator for a material property.
+        
+        Evaluators are built on first use and kept in an LRU cache. The cache is
+        dropped automatically whenever the database is reloaded or a material is
+        added.
+        
+        Args:
+            material_id: Material identifier
+            property_name: Property name
+            
+        Returns:
+            PropertyEvaluator for the property
+            
+        Raises:
+            ValueError: If material/property not found or equation type unsupported
+        """
+        if self._database_revision != self.database.revision:
+            self.clear_evaluator_cache()
+        evaluator = self._evaluator_cache(material_id, property_name)
+        # The first compile may lazily load the shared default data, which
+        # bumps the revision without changing anything already cached
+        self._database_revision = self.database.revision
+        return evaluator
+    
+    def clear_evaluator_cache(self) -> None:
+        """
+        Drop all compiled evaluators.
+        
+        Only needed after modifying property dictionaries in place; reloading
+        the database or calling ``add_material`` invalidates the cache automatically.
+        """
+        self._evaluator_cache.cache_clear()
+        self._enthalpy_tables.clear()
+        self.surrogate_fallbacks.clear()
+        self._database_revision = self.database.revision
+    
+    def enable_instrumentation(self, stats=None):
+        """
+        Start counting property evaluations and timing calculations.
+        
+        Evaluations are counted per (material, property), evaluator and
+        enthalpy table cache hits are recorded, and the main calculation
+        methods are timed. Instrumentation lives on this instance only; while
+        disabled (the default) none of it is on the call path.
+        
+        Args:
+            stats: ``cryocalc.instrumentation.CalculationStats`` to add to.
+                If None, a new one is created.
+                
+        Returns:
+            The CalculationStats being filled (also ``self.instrumentation``)
+        """
+        from .instrumentation import CalculationStats, enable_material_instrumentation
+        stats = stats if stats is not None else CalculationStats()
+        enable_material_instrumentation(self, stats)
+        return stats
+    
+    def disable_instrumentation(self) -> None:
+        """Stop instrumentation and restore the uninstrumented methods."""
+        if self.instrumentation is not None:
+            from .instrumentation import disable_material_instrumentation
+            disable_material_instrumentation(self)
     
     def calculate_property(self, material_id: str, property_name: str, 
                           temperature: float, precision: int = 6) -> float:
@@ -44,31 +189,42 @@ class MaterialCalculator:
         Raises:
             ValueError: If material/property not found or temperature out of range
         """
-        # Get property data
-        prop_data = self.database.get_material_property(material_id, property_name)
+        result = self.get_evaluator(material_id, property_name)(temperature)
+        return round(result, precision)
+    
+    def calculate_property_many(self, material_id: str, property_name: str,
+                                temperatures: Union[Sequence[float], "np.ndarray"],
+                                nan_out_of_range: bool = False,
+                                precision: Optional[int] = None) -> "np.ndarray":
+        """
+        Calculate a material property at many temperatures at once.
         
-        # Validate temperature range
-        min_temp, max_temp = self.database.get_temperature_range(material_id, property_name)
-        PropertyCalculator.validate_temperature_range(temperature, min_temp, max_temp)
-        
-        # Get calculation parameters
-        equation_type = prop_data['equation_type']
-        coefficients = prop_data['coefficients']
-        
-        # Calculate based on equation type
-        if equation_type == "logarithmic_polynomial" or equation_type == EquationType.LOGARITHMIC_POLYNOMIAL.value:
-            result = self.property_calculator.logarithmic_polynomial(temperature, coefficients)
-        elif equation_type == "polynomial" or equation_type == EquationType.POLYNOMIAL.value:
-            result = self.property_calculator.polynomial(temperature, coefficients)
-        elif equation_type == "rational" or equation_type == EquationType.RATIONAL.value:
-            # For rational functions, coefficients are split between numerator and denominator
-            num_coeffs = prop_data.get('numerator_coefficients', coefficients[:len(coefficients)//2])
-            den_coeffs = prop_data.get('denominator_coefficients', coefficients[len(coefficients)//2:])
-            result = self.property_calculator.rational(temperature, num_coeffs, den_coeffs)
-        else:
-            raise ValueError(f"Unsupported equation type: {equation_type}")
+        Material data and the valid temperature range are resolved once, the
+        range is checked with a vectorized mask and the equation is evaluated
+        over the whole array in a single pass.
         
-        return round(result, precision)
+        Args:
+            material_id: Material identifier
+            property_name: Property name
+            temperatures: Temperatures in Kelvin (any array-like shape)
+            nan_out_of_range: If True, return NaN for temperatures outside the
+                valid range instead of raising
+            precision: Number of decimal places for results. If None, results
+                are not rounded.
+            
+        Returns:
+            Array of property values with the same shape as ``temperatures``
+            
+        Raises:
+            ValueError: If material/property not found, or if any temperature is
+                out of range and ``nan_out_of_range`` is False
+        """
+        evaluator = self.get_evaluator(material_id, property_name)
+        result = evaluator.evaluate_many(temperatures, nan_out_of_range=nan_out_of_range)
+        
+        if precision is not None:
+            result = result.round(precision)
+        return result
     
     def calculate_thermal_conductivity(self, material_id: str, temperature: float, 
                                      variant: Optional[str] = None) -> float:
@@ -102,6 +258,105 @@ class MaterialCalculator:
         """
         return self.calculate_property(material_id, "specific_heat", temperature)
     
+    def get_enthalpy_table(self, material_id: str):
+        """
+        Get the cumulative ∫c_p dT table for a material, building it on first use.
+        
+        Tables are cached on the calculator and dropped together with the
+        evaluator cache (database changes, backend switches).
+        
+        Args:
+            material_id: Material identifier
+            
+        Returns:
+            CumulativeIntegralTable over the material's specific heat range
+        """
+        evaluator = self.get_evaluator(material_id, 'specific_heat')
+        table = self._enthalpy_tables.get(material_id)
+        if table is None:
+            from .integration import CumulativeIntegralTable
+            table = CumulativeIntegralTable(evaluator)
+            self._enthalpy_tables[material_id] = table
+        return table
+    
+    def enthalpy_change(self, material_id: str,
+                        temp_from: Union[float, Sequence[float], "np.ndarray"],
+                        temp_to: Union[float, Sequence[float], "np.ndarray"],
+                        nan_out_of_range: bool = False) -> Union[float, "np.ndarray"]:
+        """
+        Specific enthalpy change H(temp_to) - H(temp_from) = ∫ c_p dT.
+        
+        The change is negative when cooling; the heat to remove from a mass m
+        going from 300 K to 4 K is -m * enthalpy_change(material, 300, 4).
+        Bounds are broadcast against each other and evaluated as two lookups
+        in the cached cumulative table.
+        
+        Args:
+            material_id: Material identifier
+            temp_from: Initial temperature(s) in Kelvin
+            temp_to: Final temperature(s) in Kelvin
+            nan_out_of_range: If True, return NaN for pairs outside the valid
+                range instead of raising
+            
+        Returns:
+            Enthalpy change in J/kg (float for scalar inputs, else an array)
+            
+        Raises:
+            ValueError: If the material has no specific heat, or a temperature
+                is out of range and ``nan_out_of_range`` is False
+        """
+        import numpy as np
+        
+        table = self.get_enthalpy_table(material_id)
+        min_temp, max_temp = table.temperature_range
+        lows, highs = np.broadcast_arrays(np.asarray(temp_from, dtype=float),
+                                          np.asarray(temp_to, dtype=float))
+        valid = ((lows >= min_temp) & (lows <= max_temp)
+                 & (highs >= min_temp) & (highs <= max_temp))
+        if not nan_out_of_range and not valid.all():
+            raise ValueError(
+                f"Temperature outside valid range [{min_temp}K, {max_temp}K] "
+                f"for {material_id} specific_heat"
+            )
+        
+        result = np.where(valid, table(highs) - table(lows), np.nan)
+        return float(result) if result.ndim == 0 else result
+    
+    def cooldown_energy(self, bill_of_materials: Union[Mapping[str, float],
+                                                       Sequence[Tuple[str, float]]],
+                        temp_from: float = 300.0, temp_to: float = 4.0) -> Dict[str, Any]:
+        """
+        Heat to remove from a set of masses to take them between two temperatures.
+        
+        Args:
+            bill_of_materials: {material_id: mass_kg} or (material_id, mass_kg)
+                pairs; repeated materials are listed separately
+            temp_from: Initial temperature in Kelvin
+            temp_to: Final temperature in Kelvin
+            
+        Returns:
+            Dictionary with 'items' (material, mass_kg, specific enthalpy
+            change in J/kg and energy_J removed per entry) and 'total_J'
+        """
+        if isinstance(bill_of_materials, Mapping):
+            bill_of_materials = list(bill_of_materials.items())
+        
+        items = []
+        for material_id, mass in bill_of_materials:
+            change = self.enthalpy_change(material_id, temp_from, temp_to)
+            items.append({
+                'material': material_id,
+                'mass_kg': float(mass),
+                'enthalpy_change_J_per_kg': change,
+                'energy_J': -float(mass) * change,
+            })
+        return {
+            'temp_from_K': temp_from,
+            'temp_to_K': temp_to,
+            'items': items,
+            'total_J': sum(item['energy_J'] for item in items),
+        }
+    
     def calculate_youngs_modulus(self, material_id: str, temperature: float,
                                 variant: Optional[str] = None) -> float:
         """
@@ -165,21 +420,18 @@ class MaterialCalculator:
             raise ValueError("Invalid temperature range after validation")
         
         # Generate temperature points
-        temp_step = (max_temp - min_temp) / (num_points - 1)
-        temperatures = [min_temp + i * temp_step for i in range(num_points)]
+        import numpy as np
         
-        # Calculate values
-        values = []
-        for temp in temperatures:
-            try:
-                value = self.calculate_property(material_id, property_name, temp)
-                values.append(value)
-            except ValueError:
-                values.append(None)  # Skip invalid points
+        temperatures = np.linspace(min_temp, max_temp, num_points)
+        
+        # Calculate values; invalid points come back as NaN and are reported as None
+        values = self.calculate_property_many(
+            material_id, property_name, temperatures, nan_out_of_range=True, precision=6
+        )
         
         return {
-            'temperature': temperatures,
-            'values': values
+            'temperature': temperatures.tolist(),
+            'values': [None if math.isnan(v) else v for v in values.tolist()]
         }
     
     def get_material_summary(self, material_id: str) -> Dict[str, any]:
@@ -205,12 +457,20 @@ class MaterialCalculator:
                     'units': prop_data.get('units', 'Unknown'),
                     'equation_type': prop_data.get('equation_type', 'Unknown')
                 }
+                if prop_data.get('notes'):
+                    properties_with_ranges[prop_name]['notes'] = prop_data['notes']
             except ValueError:
                 continue
         
+        try:
+            density = self.database.get_density(material_id)
+        except ValueError:
+            density = None
+        
         return {
             'name': info['name'],
             'material_id': material_id,
+            'density': density,
             'properties': properties_with_ranges
         }
     
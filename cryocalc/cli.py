@@ -20,6 +20,8 @@ Examples:
   cryocalc list-materials
   cryocalc calculate aluminum_6061_t6 thermal_conductivity 77
   cryocalc info stainless_steel_304
+  cryocalc batch queries.csv -o results.csv
+  cryocalc serve --socket /tmp/cryocalc.sock
         """
     )
     
@@ -42,6 +44,29 @@ Examples:
     calc_parser.add_argument('--variant', help='Property variant (if applicable)')
     calc_parser.add_argument('--precision', type=int, default=6, help='Decimal precision')
     
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        'batch', help='Evaluate a CSV/JSONL file of material, property, temperature rows'
+    )
+    batch_parser.add_argument('input', nargs='?', default='-',
+                              help='Input file (default: stdin)')
+    batch_parser.add_argument('-o', '--output', default='-',
+                              help='Output file (default: stdout)')
+    batch_parser.add_argument('--format', choices=['csv', 'jsonl'],
+                              help='Input format (default: from extension, else csv)')
+    batch_parser.add_argument('--output-format', choices=['csv', 'jsonl'],
+                              help='Output format (default: same as input)')
+    batch_parser.add_argument('--precision', type=int, default=6, help='Decimal precision')
+    batch_parser.add_argument('--chunk-size', type=int, default=8192,
+                              help='Rows evaluated together')
+    
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        'serve', help='Answer line-delimited JSON requests with warm calculators'
+    )
+    serve_parser.add_argument('--socket', metavar='PATH',
+                              help='Listen on a Unix domain socket instead of stdin/stdout')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -69,11 +94,15 @@ Examples:
             summary = calculator.get_material_summary(args.material)
             print(f"\nMaterial: {summary['name']}")
             print(f"ID: {summary['material_id']}")
+            if summary['density'] is not None:
+                print(f"Density: {summary['density']} kg/m³")
             print("\nAvailable properties:")
             for prop_name, prop_info in summary['properties'].items():
                 temp_range = prop_info['temperature_range']
                 units = prop_info['units']
                 print(f"  {prop_name}: {temp_range[0]}-{temp_range[1]}K ({units})")
+                if 'notes' in prop_info:
+                    print(f"    Note: {prop_info['notes']}")
         
         elif args.command == 'calculate':
             if args.variant:
@@ -93,7 +122,33 @@ Examples:
             print(f"Material: {args.material}")
             print(f"Property: {property_name}")
             print(f"Temperature: {args.temperature} K")
+        
+        elif args.command == 'batch':
+            from .batch import detect_format, evaluate_rows, read_rows, write_results
+            input_format = args.format or detect_format(args.input)
+            output_format = args.output_format or detect_format(args.output, input_format)
+            infile = sys.stdin if args.input == '-' else open(args.input, newline='')
+            outfile = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+            try:
+                results = evaluate_rows(read_rows(infile, input_format), calculator,
+                                        args.precision, args.chunk_size)
+                write_results(results, outfile, output_format)
+            finally:
+                if infile is not sys.stdin:
+                    infile.close()
+                if outfile is not sys.stdout:
+                    outfile.close()
+        
+        elif args.command == 'serve':
+            from .server import RequestHandler, serve_stdio, serve_unix_socket
+            handler = RequestHandler(calculator)
+            if args.socket:
+                serve_unix_socket(args.socket, handler)
+            else:
+                serve_stdio(handler)
     
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,403 @@
+"""
+Compiled property evaluators for fast repeated calculations.
+
+A property evaluator is built once from the raw database entry for a single
+(material, property) pair. Coefficients are frozen into tuples, the equation
+type is resolved to a concrete class and the valid temperature range is
+captured, so evaluating the property afterwards costs one range check and
+one polynomial evaluation.
+"""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Union
+import math
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from .properties import ArrayLike, EquationType, PropertyCalculator, horner, _is_scalar
+
+
+class PropertyEvaluator:
+    """
+    Base class for compiled (material, property) evaluators.
+
+    Subclasses implement ``evaluate`` for scalar temperatures and
+    ``evaluate_array`` for NumPy arrays. Neither method validates the
+    temperature range; use ``__call__`` or ``evaluate_many`` for checked
+    evaluation.
+    """
+
+    equation_type: EquationType
+    #: True if ``integrate`` can compute the integral in closed form
+    has_antiderivative = False
+
+    def __init__(self, material_id: str, property_name: str,
+                 min_temp: float, max_temp: float, units: str = ''):
+        self.material_id = material_id
+        self.property_name = property_name
+        self.min_temp = float(min_temp)
+        self.max_temp = float(max_temp)
+        self.units = units
+
+    @property
+    def temperature_range(self) -> tuple:
+        """Valid temperature range as (min_temp, max_temp) in Kelvin."""
+        return (self.min_temp, self.max_temp)
+
+    def __call__(self, temperature: float) -> float:
+        """
+        Evaluate the property at a single temperature with range validation.
+
+        Args:
+            temperature: Temperature in Kelvin
+
+        Returns:
+            Property value
+
+        Raises:
+            ValueError: If temperature is outside the valid range
+        """
+        if not self.min_temp <= temperature <= self.max_temp:
+            PropertyCalculator.validate_temperature_range(temperature, self.min_temp, self.max_temp)
+        return self.evaluate(temperature)
+
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single, already validated temperature."""
+        raise NotImplementedError("Subclasses must implement evaluate")
+
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of already validated temperatures."""
+        raise NotImplementedError("Subclasses must implement evaluate_array")
+
+    def evaluate_many(self, temperatures: Union[Sequence[float], "np.ndarray"],
+                      nan_out_of_range: bool = False) -> "np.ndarray":
+        """
+        Evaluate the property over an array of temperatures with range validation.
+
+        Args:
+            temperatures: Temperatures in Kelvin (any array-like shape)
+            nan_out_of_range: If True, return NaN for out-of-range temperatures
+                instead of raising
+
+        Returns:
+            Array of property values with the same shape as ``temperatures``
+
+        Raises:
+            ValueError: If any temperature is out of range and
+                ``nan_out_of_range`` is False
+        """
+        import numpy as np
+
+        temperatures = np.asarray(temperatures, dtype=float)
+        in_range = PropertyCalculator.temperature_range_mask(
+            temperatures, self.min_temp, self.max_temp
+        )
+
+        if in_range.all():
+            return self.evaluate_array(temperatures)
+
+        if not nan_out_of_range:
+            # Raises with the same message as the scalar path
+            bad_temperature = float(temperatures[~in_range].flat[0])
+            PropertyCalculator.validate_temperature_range(bad_temperature, self.min_temp, self.max_temp)
+        result = np.full(temperatures.shape, np.nan)
+        result[in_range] = self.evaluate_array(temperatures[in_range])
+        return result
+
+    def integrate(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        """
+        Integrate the property in closed form over [temp_low, temp_high].
+
+        Only available when ``has_antiderivative`` is True. Bounds are not
+        range-validated.
+
+        Args:
+            temp_low: Lower temperature bound(s) in Kelvin
+            temp_high: Upper temperature bound(s) in Kelvin
+
+        Returns:
+            Integral value(s) in property units times Kelvin
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} has no closed-form antiderivative"
+        )
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}({self.material_id!r}, {self.property_name!r}, "
+                f"range=[{self.min_temp}, {self.max_temp}]K)")
+
+
+class LogPolynomialEvaluator(PropertyEvaluator):
+    """Evaluator for log10(property) = sum(a_i * log10(T)^i)."""
+
+    equation_type = EquationType.LOGARITHMIC_POLYNOMIAL
+
+    def __init__(self, material_id: str, property_name: str, min_temp: float,
+                 max_temp: float, coefficients: Sequence[float], units: str = ''):
+        super().__init__(material_id, property_name, min_temp, max_temp, units)
+        self.coefficients = tuple(float(c) for c in coefficients)
+
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single temperature."""
+        if temperature <= 0:
+            raise ValueError("Temperature must be positive")
+        return 10 ** horner(math.log10(temperature), self.coefficients)
+
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of temperatures."""
+        return PropertyCalculator.logarithmic_polynomial(temperatures, self.coefficients)
+
+
+class PolynomialEvaluator(PropertyEvaluator):
+    """
+    Evaluator for property = sum(a_i * T^i).
+
+    The antiderivative sum(a_i * T^(i+1) / (i+1)) is precomputed so that
+    integrals cost one Horner evaluation per bound.
+    """
+
+    equation_type = EquationType.POLYNOMIAL
+    has_antiderivative = True
+
+    def __init__(self, material_id: str, property_name: str, min_temp: float,
+                 max_temp: float, coefficients: Sequence[float], units: str = ''):
+        super().__init__(material_id, property_name, min_temp, max_temp, units)
+        self.coefficients = tuple(float(c) for c in coefficients)
+        self.antiderivative_coefficients = (0.0,) + tuple(
+            c / (i + 1) for i, c in enumerate(self.coefficients)
+        )
+
+    def integrate(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        """
+        Integrate the polynomial exactly over [temp_low, temp_high].
+
+        Args:
+            temp_low: Lower temperature bound(s) in Kelvin
+            temp_high: Upper temperature bound(s) in Kelvin
+
+        Returns:
+            Integral value(s) in property units times Kelvin
+        """
+        if not _is_scalar(temp_low) or not _is_scalar(temp_high):
+            import numpy as np
+
+            temp_low = np.asarray(temp_low, dtype=float)
+            temp_high = np.asarray(temp_high, dtype=float)
+        return (horner(temp_high, self.antiderivative_coefficients)
+                - horner(temp_low, self.antiderivative_coefficients))
+
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single temperature."""
+        if temperature < 0:
+            raise ValueError("Temperature must be non-negative")
+        return horner(temperature, self.coefficients)
+
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of temperatures."""
+        return PropertyCalculator.polynomial(temperatures, self.coefficients)
+
+
+class RationalEvaluator(PropertyEvaluator):
+    """Evaluator for log10(property) = sum(a_i * T^(i/2)) / sum(b_i * T^(i/2))."""
+
+    equation_type = EquationType.RATIONAL
+
+    def __init__(self, material_id: str, property_name: str, min_temp: float,
+                 max_temp: float, numerator_coeffs: Sequence[float],
+                 denominator_coeffs: Sequence[float], units: str = ''):
+        super().__init__(material_id, property_name, min_temp, max_temp, units)
+        self.numerator_coeffs = tuple(float(c) for c in numerator_coeffs)
+        self.denominator_coeffs = tuple(float(c) for c in denominator_coeffs)
+
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single temperature."""
+        return PropertyCalculator.rational(temperature, self.numerator_coeffs,
+                                           self.denominator_coeffs)
+
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of temperatures."""
+        return PropertyCalculator.rational(temperatures, self.numerator_coeffs,
+                                           self.denominator_coeffs)
+
+
+class ErfCompositeEvaluator(PropertyEvaluator):
+    """
+    Evaluator for error-function composite fits.
+    
+    See ``PropertyCalculator.erf_composite`` for the equation form. Segments
+    are parsed once into plain tuples by ``parse_erf_segments``.
+    """
+    
+    equation_type = EquationType.ERF_COMPOSITE
+    
+    def __init__(self, material_id: str, property_name: str, min_temp: float,
+                 max_temp: float, segments: Sequence[Tuple[tuple, tuple]],
+                 variable: str = "linear", log_output: bool = False, units: str = ''):
+        super().__init__(material_id, property_name, min_temp, max_temp, units)
+        if variable not in ("linear", "log10"):
+            raise ValueError(f"Unsupported erf composite variable: {variable}")
+        self.segments = tuple(segments)
+        self.variable = variable
+        self.log_output = bool(log_output)
+    
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single temperature."""
+        return PropertyCalculator.erf_composite(temperature, self.segments,
+                                                self.variable, self.log_output)
+    
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of temperatures."""
+        return PropertyCalculator.erf_composite(temperatures, self.segments,
+                                                self.variable, self.log_output)
+
+
+class PiecewiseEvaluator(PropertyEvaluator):
+    """
+    Evaluator for properties made of several fits over adjacent ranges.
+    
+    Each piece is used from the start of its own range up to the start of the
+    next piece, so overlapping ranges switch at the later lower bound.
+    """
+    
+    equation_type = EquationType.PIECEWISE
+    
+    def __init__(self, material_id: str, property_name: str, min_temp: float,
+                 max_temp: float, pieces: Sequence[PropertyEvaluator], units: str = ''):
+        super().__init__(material_id, property_name, min_temp, max_temp, units)
+        if not pieces:
+            raise ValueError("Piecewise property requires at least one piece")
+        self.pieces = tuple(sorted(pieces, key=lambda piece: piece.min_temp))
+        for lower, upper in zip(self.pieces, self.pieces[1:]):
+            if upper.min_temp > lower.max_temp:
+                raise ValueError(
+                    f"Gap between pieces at {lower.max_temp}K-{upper.min_temp}K "
+                    f"for {material_id}/{property_name}"
+                )
+        self.breakpoints = tuple(piece.min_temp for piece in self.pieces[1:])
+        self.has_antiderivative = all(piece.has_antiderivative for piece in self.pieces)
+    
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the property at a single temperature."""
+        return self.pieces[bisect_right(self.breakpoints, temperature)].evaluate(temperature)
+    
+    def evaluate_array(self, temperatures: "np.ndarray") -> "np.ndarray":
+        """Evaluate the property over an array of temperatures."""
+        import numpy as np
+        
+        temperatures = np.asarray(temperatures, dtype=float)
+        indices = np.searchsorted(self.breakpoints, temperatures, side='right')
+        result = np.empty(temperatures.shape)
+        for index, piece in enumerate(self.pieces):
+            selected = indices == index
+            if selected.any():
+                result[selected] = piece.evaluate_array(temperatures[selected])
+        return result
+    
+    def integrate(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        """
+        Integrate piece by piece in closed form over [temp_low, temp_high].
+        
+        Args:
+            temp_low: Lower temperature bound(s) in Kelvin
+            temp_high: Upper temperature bound(s) in Kelvin
+            
+        Returns:
+            Integral value(s) in property units times Kelvin
+        """
+        if not self.has_antiderivative:
+            return super().integrate(temp_low, temp_high)
+        
+        import numpy as np
+        
+        edges = (-math.inf,) + self.breakpoints + (math.inf,)
+        total = 0.0
+        for piece, start, end in zip(self.pieces, edges, edges[1:]):
+            total = total + piece.integrate(np.clip(temp_low, start, end),
+                                            np.clip(temp_high, start, end))
+        return total
+
+
+def parse_erf_segments(segment_specs: List[Dict[str, Any]]) -> Tuple[Tuple[tuple, tuple], ...]:
+    """
+    Convert erf composite segment dictionaries into evaluation tuples.
+    
+    Each segment has a list of ``terms`` (``coefficient`` with optional
+    ``power``, ``offset`` and ``decay``) and a list of ``windows``
+    (``center``, ``slope`` and ``side``, either "above" or "below").
+    
+    Args:
+        segment_specs: Segment dictionaries from the material database
+        
+    Returns:
+        Tuple of (terms, windows) pairs for ``PropertyCalculator.erf_composite``
+        
+    Raises:
+        ValueError: If a window side is not "above" or "below"
+    """
+    segments = []
+    for spec in segment_specs:
+        terms = tuple(
+            (float(term['coefficient']), float(term.get('power', 0)),
+             float(term.get('offset', 0)), float(term.get('decay', 0)))
+            for term in spec.get('terms', [])
+        )
+        windows = []
+        for window in spec.get('windows', []):
+            side = window.get('side', 'above')
+            if side not in ('above', 'below'):
+                raise ValueError(f"Unsupported erf window side: {side}")
+            windows.append((float(window['center']), float(window.get('slope', 1)),
+                            1.0 if side == 'above' else -1.0))
+        segments.append((terms, tuple(windows)))
+    return tuple(segments)
+
+
+def compile_evaluator(material_id: str, property_name: str,
+                      prop_data: Dict[str, Any]) -> PropertyEvaluator:
+    """
+    Build a compiled evaluator from a raw property data dictionary.
+
+    Args:
+        material_id: Material identifier
+        property_name: Property name
+        prop_data: Property data dictionary from the material database
+
+    Returns:
+        PropertyEvaluator for the property
+
+    Raises:
+        ValueError: If the equation type is not supported
+    """
+    equation_type = prop_data['equation_type']
+    min_temp, max_temp = prop_data.get('temperature_range', [4, 300])
+    units = prop_data.get('units', '')
+    coefficients = prop_data.get('coefficients', [])
+
+    if equation_type == "logarithmic_polynomial" or equation_type == EquationType.LOGARITHMIC_POLYNOMIAL.value:
+        return LogPolynomialEvaluator(material_id, property_name, min_temp, max_temp,
+                                      coefficients, units)
+    elif equation_type == "polynomial" or equation_type == EquationType.POLYNOMIAL.value:
+        return PolynomialEvaluator(material_id, property_name, min_temp, max_temp,
+                                   coefficients, units)
+    elif equation_type == "rational" or equation_type == EquationType.RATIONAL.value:
+        # For rational functions, coefficients are split between numerator and denominator
+        num_coeffs = prop_data.get('numerator_coefficients', coefficients[:len(coefficients)//2])
+        den_coeffs = prop_data.get('denominator_coefficients', coefficients[len(coefficients)//2:])
+        return RationalEvaluator(material_id, property_name, min_temp, max_temp,
+                                 num_coeffs, den_coeffs, units)
+    elif equation_type == EquationType.ERF_COMPOSITE.value:
+        return ErfCompositeEvaluator(material_id, property_name, min_temp, max_temp,
+                                     parse_erf_segments(prop_data.get('segments', [])),
+                                     prop_data.get('variable', 'linear'),
+                                     prop_data.get('log_output', False), units)
+    elif equation_type == EquationType.PIECEWISE.value:
+        pieces = [compile_evaluator(material_id, property_name, dict(piece, units=units))
+                  for piece in prop_data.get('pieces', [])]
+        if 'temperature_range' not in prop_data and pieces:
+            min_temp = min(piece.min_temp for piece in pieces)
+            max_temp = max(piece.max_temp for piece in pieces)
+        return PiecewiseEvaluator(material_id, property_name, min_temp, max_temp,
+                                  pieces, units)
+    else:
+        raise ValueError(f"Unsupported equation type: {equation_type}")
@@ -0,0 +1,307 @@
+"""
+Opt-in counters and timers for calculator hot paths.
+
+Instrumentation is attached to a calculator instance by shadowing a few of
+its methods with wrappers stored on the instance. Disabling removes the
+wrappers again, so an uninstrumented calculator runs the plain class methods
+with no extra cost.
+
+While enabled, evaluators handed out by ``MaterialCalculator.get_evaluator``
+and the evaluators of already cached integral tables are wrapped to count
+the temperatures they evaluate, and calculator entry points such as
+integration, power and profile calls are timed. Evaluators fetched before
+instrumentation was enabled (e.g. held by a TransientSolver) are not counted.
+
+    >>> with instrument(thermal) as stats:
+    ...     thermal.calculate_thermal_power("stainless_steel_304", rod, 300.0, 4.0)
+    >>> stats.as_dict()['caches']['MaterialCalculator.evaluators']['hit_rate']
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .evaluators import PropertyEvaluator
+from .properties import ArrayLike
+
+
+# ThermalCalculator methods timed while instrumented
+THERMAL_TIMED_METHODS = (
+    'integrate_thermal_conductivity',
+    'calculate_conductivity_integrals',
+    'calculate_thermal_power',
+    'calculate_temperature_profile',
+    'sweep_thermal_power',
+    'get_calculation_summary',
+    '_invert_profile',
+    '_thermal_conductivity',
+)
+
+# MaterialCalculator methods timed while instrumented
+MATERIAL_TIMED_METHODS = (
+    'calculate_property',
+    'calculate_property_many',
+    'calculate_temperature_series',
+    'enthalpy_change',
+)
+
+
+class CalculationStats:
+    """
+    Counters and timers collected from instrumented calculators.
+
+    Attributes:
+        evaluations: (material_id, property_name) -> [calls, points, seconds]
+            spent inside evaluator ``evaluate``/``evaluate_array``
+        integrals: (material_id, property_name) -> closed-form integral calls
+        timers: method label -> [calls, seconds] (nested calls count in both)
+        caches: cache name -> [hits, misses]
+    """
+
+    def __init__(self):
+        self.evaluations: Dict[Tuple[str, str], list] = {}
+        self.integrals: Dict[Tuple[str, str], int] = {}
+        self.timers: Dict[str, list] = {}
+        self.caches: Dict[str, list] = {}
+
+    def reset(self) -> None:
+        """Clear all counters and timers."""
+        self.evaluations.clear()
+        self.integrals.clear()
+        self.timers.clear()
+        self.caches.clear()
+
+    def record_evaluation(self, key: Tuple[str, str], points: int, seconds: float) -> None:
+        entry = self.evaluations.get(key)
+        if entry is None:
+            entry = self.evaluations[key] = [0, 0, 0.0]
+        entry[0] += 1
+        entry[1] += points
+        entry[2] += seconds
+
+    def record_time(self, label: str, seconds: float) -> None:
+        entry = self.timers.get(label)
+        if entry is None:
+            entry = self.timers[label] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def record_cache(self, name: str, hit: bool) -> None:
+        entry = self.caches.setdefault(name, [0, 0])
+        entry[0 if hit else 1] += 1
+
+    def timed(self, label: str, func: Callable) -> Callable:
+        """Wrap a callable so that each call is added to timer ``label``."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record_time(label, time.perf_counter() - start)
+        return wrapper
+
+    @property
+    def total_evaluations(self) -> int:
+        """Total number of temperatures evaluated across all properties."""
+        return sum(entry[1] for entry in self.evaluations.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the statistics as plain (JSON-serializable) data.
+
+        Returns:
+            Dictionary with 'evaluations' (material -> property -> calls,
+            points, time_s, closed_form_integrals), 'timers' (label -> calls,
+            total_s, mean_s) and 'caches' (name -> hits, misses, hit_rate)
+        """
+        evaluations: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (material_id, property_name), (calls, points, seconds) in self.evaluations.items():
+            evaluations.setdefault(material_id, {})[property_name] = {
+                'calls': calls, 'points': points, 'time_s': seconds,
+                'closed_form_integrals': self.integrals.get((material_id, property_name), 0),
+            }
+        for (material_id, property_name), count in self.integrals.items():
+            evaluations.setdefault(material_id, {}).setdefault(property_name, {
+                'calls': 0, 'points': 0, 'time_s': 0.0, 'closed_form_integrals': count,
+            })
+        return {
+            'evaluations': evaluations,
+            'timers': {
+                label: {'calls': calls, 'total_s': seconds, 'mean_s': seconds / calls}
+                for label, (calls, seconds) in self.timers.items()
+            },
+            'caches': {
+                name: {'hits': hits, 'misses': misses,
+                       'hit_rate': hits / (hits + misses) if hits + misses else None}
+                for name, (hits, misses) in self.caches.items()
+            },
+        }
+
+    def report(self) -> str:
+        """Format the timers, cache hit rates and busiest evaluators as text."""
+        lines = ["Timers (cumulative, nested calls included):"]
+        for label, (calls, seconds) in sorted(self.timers.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {label:<58} {calls:>8} calls {seconds * 1e3:>10.3f} ms")
+        lines.append("Caches:")
+        for name, (hits, misses) in sorted(self.caches.items()):
+            rate = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f"  {name:<58} {hits:>8} hits {misses:>6} misses ({rate:.1%})")
+        lines.append("Property evaluations:")
+        for (material_id, property_name), (calls, points, seconds) in sorted(
+                self.evaluations.items(), key=lambda item: -item[1][2]):
+            lines.append(f"  {material_id + '/' + property_name:<58} {calls:>8} calls "
+                         f"{points:>10} points {seconds * 1e3:>10.3f} ms")
+        return "\n".join(lines)
+
+
+class CountingEvaluator(PropertyEvaluator):
+    """Evaluator wrapper that records evaluations in a CalculationStats."""
+
+    def __init__(self, evaluator: PropertyEvaluator, stats: CalculationStats):
+        super().__init__(evaluator.material_id, evaluator.property_name,
+                         evaluator.min_temp, evaluator.max_temp, evaluator.units)
+        self.wrapped = evaluator
+        self.stats = stats
+        self.equation_type = evaluator.equation_type
+        self.has_antiderivative = evaluator.has_antiderivative
+        self._key = (evaluator.material_id, evaluator.property_name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set here (e.g. coefficients)
+        if name == 'wrapped':
+            raise AttributeError(name)
+        return getattr(self.wrapped, name)
+
+    def evaluate(self, temperature: float) -> float:
+        start = time.perf_counter()
+        result = self.wrapped.evaluate(temperature)
+        self.stats.record_evaluation(self._key, 1, time.perf_counter() - start)
+        return result
+
+    def evaluate_array(self, temperatures: np.ndarray) -> np.ndarray:
+        start = time.perf_counter()
+        result = self.wrapped.evaluate_array(temperatures)
+        self.stats.record_evaluation(self._key, int(np.size(temperatures)),
+                                     time.perf_counter() - start)
+        return result
+
+    def integrate(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        self.stats.integrals[self._key] = self.stats.integrals.get(self._key, 0) + 1
+        return self.wrapped.integrate(temp_low, temp_high)
+
+
+def _wrap_tables(tables: Dict[str, Any], stats: CalculationStats) -> None:
+    """Count evaluations made through already cached integral tables."""
+    for table in tables.values():
+        if not isinstance(table.evaluator, CountingEvaluator):
+            table.evaluator = CountingEvaluator(table.evaluator, stats)
+
+
+def _unwrap_tables(tables: Dict[str, Any]) -> None:
+    """Point cached integral tables back at the uninstrumented evaluators."""
+    for table in tables.values():
+        if isinstance(table.evaluator, CountingEvaluator):
+            table.evaluator = table.evaluator.wrapped
+
+
+def enable_material_instrumentation(calculator, stats: CalculationStats) -> None:
+    """Attach ``stats`` to a MaterialCalculator (see ``MaterialCalculator.enable_instrumentation``)."""
+    disable_material_instrumentation(calculator)
+    cls = type(calculator)
+    plain_get_evaluator = cls.get_evaluator.__get__(calculator)
+    plain_get_enthalpy_table = cls.get_enthalpy_table.__get__(calculator)
+
+    def get_evaluator(material_id: str, property_name: str) -> PropertyEvaluator:
+        hits = calculator._evaluator_cache.cache_info().hits
+        start = time.perf_counter()
+        evaluator = plain_get_evaluator(material_id, property_name)
+        hit = calculator._evaluator_cache.cache_info().hits > hits
+        stats.record_cache('MaterialCalculator.evaluators', hit)
+        if not hit:
+            stats.record_time('MaterialCalculator.compile_evaluator', time.perf_counter() - start)
+        return CountingEvaluator(evaluator, stats)
+
+    def get_enthalpy_table(material_id: str):
+        cached = calculator._enthalpy_tables.get(material_id)
+        table = plain_get_enthalpy_table(material_id)
+        stats.record_cache('MaterialCalculator.enthalpy_tables', table is cached)
+        return table
+
+    calculator.get_evaluator = functools.wraps(plain_get_evaluator)(get_evaluator)
+    calculator.get_enthalpy_table = functools.wraps(plain_get_enthalpy_table)(get_enthalpy_table)
+    for name in MATERIAL_TIMED_METHODS:
+        setattr(calculator, name, stats.timed(f"MaterialCalculator.{name}",
+                                              getattr(cls, name).__get__(calculator)))
+    _wrap_tables(calculator._enthalpy_tables, stats)
+    calculator.instrumentation = stats
+
+
+def disable_material_instrumentation(calculator) -> None:
+    """Remove instrumentation wrappers from a MaterialCalculator."""
+    for name in ('get_evaluator', 'get_enthalpy_table') + MATERIAL_TIMED_METHODS:
+        calculator.__dict__.pop(name, None)
+    _unwrap_tables(calculator._enthalpy_tables)
+    calculator.instrumentation = None
+
+
+def enable_thermal_instrumentation(thermal, stats: CalculationStats) -> None:
+    """Attach ``stats`` to a ThermalCalculator and its MaterialCalculator."""
+    disable_thermal_instrumentation(thermal)
+    enable_material_instrumentation(thermal.calculator, stats)
+    cls = type(thermal)
+    plain_get_table = cls.get_conductivity_integral_table.__get__(thermal)
+
+    def get_conductivity_integral_table(material_id: str,
+                                        property_name: str = 'thermal_conductivity'):
+        if thermal._tables_revision == thermal.calculator.database.revision:
+            cached = thermal._integral_tables.get((material_id, property_name))
+        else:
+            cached = None
+        start = time.perf_counter()
+        table = plain_get_table(material_id, property_name)
+        stats.record_cache('ThermalCalculator.conductivity_tables', table is cached)
+        if table is not cached:
+            stats.record_time('ThermalCalculator.build_conductivity_table',
+                              time.perf_counter() - start)
+        return table
+
+    thermal.get_conductivity_integral_table = functools.wraps(plain_get_table)(
+        get_conductivity_integral_table
+    )
+    for name in THERMAL_TIMED_METHODS:
+        setattr(thermal, name, stats.timed(f"ThermalCalculator.{name}",
+                                           getattr(cls, name).__get__(thermal)))
+    _wrap_tables(thermal._integral_tables, stats)
+    thermal.instrumentation = stats
+
+
+def disable_thermal_instrumentation(thermal) -> None:
+    """Remove instrumentation wrappers from a ThermalCalculator and its MaterialCalculator."""
+    for name in ('get_conductivity_integral_table',) + THERMAL_TIMED_METHODS:
+        thermal.__dict__.pop(name, None)
+    _unwrap_tables(thermal._integral_tables)
+    disable_material_instrumentation(thermal.calculator)
+    thermal.instrumentation = None
+
+
+@contextmanager
+def instrument(calculator, stats: Optional[CalculationStats] = None) -> Iterator[CalculationStats]:
+    """
+    Instrument a MaterialCalculator or ThermalCalculator for a block of code.
+
+    Args:
+        calculator: MaterialCalculator or ThermalCalculator
+        stats: CalculationStats to add to. If None, a new one is created.
+
+    Yields:
+        The CalculationStats being filled; it stays readable after the block
+    """
+    stats = calculator.enable_instrumentation(stats)
+    try:
+        yield stats
+    finally:
+        calculator.disable_instrumentation()
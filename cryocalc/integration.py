@@ -0,0 +1,483 @@
+"""
+Numerical integration utilities for temperature-dependent material properties.
+
+The main building block is ``CumulativeIntegralTable``: the running integral
+F(T) = ∫[T_min to T] f(T') dT' of a property, sampled densely once and
+interpolated with a monotone cubic Hermite spline. Any definite integral over
+the property's valid range then reduces to two table lookups.
+
+For one-off integrals the module also provides quadrature rules (trapezoid,
+Simpson, Gauss-Legendre and adaptive Gauss-Kronrod) that work on vectorized
+integrands and report how many property evaluations they used. Except for
+the trapezoid rule, they integrate in log T when the lower bound is positive,
+which smooths the steep low-temperature behaviour of most cryogenic fits.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .evaluators import PropertyEvaluator
+from .properties import ArrayLike, _is_scalar
+
+
+# Gauss-Legendre rule used to integrate each table interval
+_TABLE_GAUSS_ORDER = 5
+
+# Vectorized integrand: maps an array of temperatures to property values
+Integrand = Callable[[np.ndarray], np.ndarray]
+
+# 7-point Gauss / 15-point Kronrod abscissae and weights (QUADPACK QK15)
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+_GAUSS7_WEIGHTS = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+])
+
+_GK15_NODES = np.concatenate((-_KRONROD_NODES[:7], [0.0], _KRONROD_NODES[6::-1]))
+_GK15_KRONROD_WEIGHTS = np.concatenate((_KRONROD_WEIGHTS[:7], [_KRONROD_WEIGHTS[7]],
+                                        _KRONROD_WEIGHTS[6::-1]))
+_GK15_GAUSS_WEIGHTS = np.zeros(15)
+_GK15_GAUSS_WEIGHTS[[1, 13]] = _GAUSS7_WEIGHTS[0]
+_GK15_GAUSS_WEIGHTS[[3, 11]] = _GAUSS7_WEIGHTS[1]
+_GK15_GAUSS_WEIGHTS[[5, 9]] = _GAUSS7_WEIGHTS[2]
+_GK15_GAUSS_WEIGHTS[7] = _GAUSS7_WEIGHTS[3]
+
+# Error below this multiple of eps times the interval's ∫|f| is roundoff
+# (the QUADPACK criterion); refining such an interval cannot improve it
+_ROUNDOFF_FACTOR = 50 * np.finfo(float).eps
+
+
+@dataclass
+class IntegrationResult:
+    """
+    Result of a numerical integration.
+
+    Attributes:
+        value: Integral value
+        method: Integration method used
+        evaluations: Number of property evaluations performed
+        error_estimate: Absolute error estimate, if the method provides one
+        converged: False if an adaptive method ran out of its evaluation
+            budget or refinement levels before meeting its tolerance
+    """
+    value: float
+    method: str
+    evaluations: int
+    error_estimate: Optional[float] = None
+    converged: bool = True
+
+
+@lru_cache(maxsize=32)
+def gauss_legendre_rule(order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gauss-Legendre nodes and weights on [-1, 1], cached per order.
+
+    Args:
+        order: Number of nodes
+
+    Returns:
+        Tuple of read-only (nodes, weights) arrays
+    """
+    if order < 1:
+        raise ValueError("Gauss-Legendre order must be at least 1")
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def _log_substitution(func: Integrand, temp_low: float,
+                      temp_high: float) -> Tuple[Integrand, float, float]:
+    """
+    Rewrite ∫ f(T) dT as ∫ f(e^u) e^u du when the lower bound is positive.
+
+    Returns:
+        Tuple of (integrand, lower bound, upper bound) in the new variable
+    """
+    if temp_low <= 0:
+        return func, temp_low, temp_high
+
+    def log_integrand(u: np.ndarray) -> np.ndarray:
+        temperatures = np.exp(u)
+        return func(temperatures) * temperatures
+
+    return log_integrand, float(np.log(temp_low)), float(np.log(temp_high))
+
+
+def integrate_trapezoid(func: Integrand, temp_low: float, temp_high: float,
+                        num_points: int = 100) -> IntegrationResult:
+    """
+    Trapezoidal rule on ``num_points`` linearly spaced temperatures.
+
+    Args:
+        func: Vectorized integrand
+        temp_low: Lower bound (K)
+        temp_high: Upper bound (K)
+        num_points: Number of sample points
+
+    Returns:
+        IntegrationResult
+    """
+    temperatures = np.linspace(temp_low, temp_high, num_points)
+    value = float(np.trapezoid(func(temperatures), temperatures))
+    return IntegrationResult(value, 'trapezoid', num_points)
+
+
+def integrate_simpson(func: Integrand, temp_low: float, temp_high: float,
+                      num_points: int = 33) -> IntegrationResult:
+    """
+    Composite Simpson rule on logarithmically spaced temperatures.
+
+    Args:
+        func: Vectorized integrand
+        temp_low: Lower bound (K)
+        temp_high: Upper bound (K)
+        num_points: Number of sample points; rounded up to an odd number
+
+    Returns:
+        IntegrationResult
+    """
+    if num_points < 3:
+        raise ValueError("Simpson's rule needs at least 3 points")
+    if num_points % 2 == 0:
+        num_points += 1
+
+    integrand, lower, upper = _log_substitution(func, temp_low, temp_high)
+    grid = np.linspace(lower, upper, num_points)
+    weights = np.ones(num_points)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    step = (upper - lower) / (num_points - 1)
+    value = float(np.dot(weights, integrand(grid)) * step / 3)
+    return IntegrationResult(value, 'simpson', num_points)
+
+
+def integrate_gauss_legendre(func: Integrand, temp_low: float, temp_high: float,
+                             order: int = 16) -> IntegrationResult:
+    """
+    Fixed-order Gauss-Legendre quadrature.
+
+    Args:
+        func: Vectorized integrand
+        temp_low: Lower bound (K)
+        temp_high: Upper bound (K)
+        order: Number of quadrature nodes
+
+    Returns:
+        IntegrationResult
+    """
+    integrand, lower, upper = _log_substitution(func, temp_low, temp_high)
+    nodes, weights = gauss_legendre_rule(order)
+    half_width = (upper - lower) / 2
+    samples = integrand(half_width * nodes + (upper + lower) / 2)
+    value = float(np.dot(weights, samples) * half_width)
+    return IntegrationResult(value, 'gauss', order)
+
+
+def integrate_gauss_kronrod(func: Integrand, temp_low: float, temp_high: float,
+                            tolerance: float = 1e-8, max_levels: int = 30,
+                            max_evaluations: int = 100000) -> IntegrationResult:
+    """
+    Adaptive 7/15-point Gauss-Kronrod quadrature.
+
+    Every refinement level evaluates all unconverged intervals in a single
+    vectorized call. An interval is accepted when its Kronrod-Gauss difference
+    is below its share (by width) of the requested relative tolerance, or
+    when it is down to floating-point roundoff, so tolerances tighter than
+    float64 can deliver stop early instead of bisecting without end.
+
+    Args:
+        func: Vectorized integrand
+        temp_low: Lower bound (K)
+        temp_high: Upper bound (K)
+        tolerance: Requested relative accuracy
+        max_levels: Maximum number of bisection levels
+        max_evaluations: Integrand evaluation budget. A level that would
+            exceed it is not started.
+
+    Returns:
+        IntegrationResult with the summed Kronrod-Gauss error estimate. If
+        the levels or the budget run out first, the best estimate so far is
+        returned with ``converged=False``.
+    """
+    integrand, lower, upper = _log_substitution(func, temp_low, temp_high)
+    total_width = upper - lower
+    lows = np.array([lower])
+    highs = np.array([upper])
+
+    accepted_value = 0.0
+    accepted_error = 0.0
+    evaluations = 0
+
+    for level in range(max_levels):
+        half_width = (highs - lows) / 2
+        samples = integrand(half_width[:, None] * _GK15_NODES + ((highs + lows) / 2)[:, None])
+        evaluations += samples.size
+
+        kronrod = samples @ _GK15_KRONROD_WEIGHTS * half_width
+        errors = np.abs(kronrod - samples @ _GK15_GAUSS_WEIGHTS * half_width)
+        roundoff = _ROUNDOFF_FACTOR * (np.abs(samples) @ _GK15_KRONROD_WEIGHTS * half_width)
+
+        estimate = accepted_value + kronrod.sum()
+        allowed = tolerance * abs(estimate) * (highs - lows) / total_width
+        converged = (errors <= allowed) | (errors <= roundoff)
+
+        accepted_value += kronrod[converged].sum()
+        accepted_error += errors[converged].sum()
+        if converged.all():
+            break
+
+        # Bisecting doubles the remaining intervals; stop with the current
+        # estimates if that would exceed the levels or the budget
+        remaining = ~converged
+        if (level == max_levels - 1
+                or evaluations + 2 * samples.shape[1] * remaining.sum() > max_evaluations):
+            accepted_value += kronrod[remaining].sum()
+            accepted_error += errors[remaining].sum()
+            return IntegrationResult(float(accepted_value), 'adaptive', evaluations,
+                                     float(accepted_error), converged=False)
+
+        # Bisect the intervals that have not converged yet
+        lows, highs = lows[remaining], highs[remaining]
+        mids = (lows + highs) / 2
+        lows, highs = np.concatenate((lows, mids)), np.concatenate((mids, highs))
+
+    return IntegrationResult(float(accepted_value), 'adaptive', evaluations, float(accepted_error))
+
+
+def _hermite_eval(x_nodes: np.ndarray, y_nodes: np.ndarray, slopes: np.ndarray,
+                  x: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a piecewise cubic Hermite interpolant.
+
+    Args:
+        x_nodes: Strictly increasing node positions
+        y_nodes: Function values at the nodes
+        slopes: Derivatives at the nodes
+        x: Evaluation points (clipped to the node range)
+
+    Returns:
+        Interpolated values with the shape of ``x``
+    """
+    x = np.clip(x, x_nodes[0], x_nodes[-1])
+    index = np.clip(np.searchsorted(x_nodes, x, side='right') - 1, 0, len(x_nodes) - 2)
+
+    x0 = x_nodes[index]
+    h = x_nodes[index + 1] - x0
+    t = (x - x0) / h
+    t2 = t * t
+    t3 = t2 * t
+
+    h00 = 2 * t3 - 3 * t2 + 1
+    h10 = t3 - 2 * t2 + t
+    h01 = -2 * t3 + 3 * t2
+    h11 = t3 - t2
+    return (h00 * y_nodes[index] + h10 * h * slopes[index]
+            + h01 * y_nodes[index + 1] + h11 * h * slopes[index + 1])
+
+
+def _limit_slopes(x_nodes: np.ndarray, y_nodes: np.ndarray,
+                  slopes: np.ndarray) -> np.ndarray:
+    """
+    Apply the Fritsch-Carlson condition so a Hermite spline through
+    non-decreasing data stays monotone.
+
+    Args:
+        x_nodes: Node positions
+        y_nodes: Non-decreasing values at the nodes
+        slopes: Candidate non-negative derivatives at the nodes
+
+    Returns:
+        Derivatives, scaled down only on intervals that would overshoot
+    """
+    slopes = slopes.copy()
+    secant = np.diff(y_nodes) / np.diff(x_nodes)
+    flat = secant <= 0
+    slopes[:-1][flat] = 0.0
+    slopes[1:][flat] = 0.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = slopes[:-1] / secant
+        beta = slopes[1:] / secant
+    radius = np.hypot(alpha, beta)
+    overshoot = ~flat & (radius > 3)
+    if np.any(overshoot):
+        tau = 3 / radius[overshoot]
+        left = np.nonzero(overshoot)[0]
+        slopes[left] = np.minimum(slopes[left], tau * alpha[overshoot] * secant[overshoot])
+        slopes[left + 1] = np.minimum(slopes[left + 1], tau * beta[overshoot] * secant[overshoot])
+    return slopes
+
+
+class CumulativeIntegralTable:
+    """
+    Cumulative integral table for a single material property.
+
+    The running integral F(T) of the property is computed once on a dense grid
+    over the evaluator's valid range (Gauss-Legendre per grid interval) and
+    interpolated with a cubic Hermite spline whose node derivatives are the
+    property values themselves. For non-negative properties the spline is
+    limited to be monotone, and for strictly positive ones F can be inverted
+    with ``inverse``.
+
+    Attributes:
+        temperatures: Grid temperatures in Kelvin
+        values: Property values on the grid
+        cumulative: F(T) on the grid
+        accuracy: Error estimates gathered when the table was built
+    """
+
+    def __init__(self, evaluator: PropertyEvaluator, num_points: int = 1025):
+        """
+        Build the table.
+
+        Args:
+            evaluator: Compiled evaluator of the property to integrate
+            num_points: Number of grid points. The grid is logarithmically
+                spaced when the lower range bound is positive.
+        """
+        if num_points < 2:
+            raise ValueError("num_points must be at least 2")
+
+        self.evaluator = evaluator
+        self.min_temp, self.max_temp = evaluator.temperature_range
+
+        if self.min_temp > 0:
+            temperatures = np.geomspace(self.min_temp, self.max_temp, num_points)
+        else:
+            temperatures = np.linspace(self.min_temp, self.max_temp, num_points)
+        temperatures[0], temperatures[-1] = self.min_temp, self.max_temp
+
+        self.temperatures = temperatures
+        self.values = evaluator.evaluate_array(temperatures)
+        interval_integrals = self._integrate_intervals(temperatures[:-1], temperatures[1:])
+        self.cumulative = np.concatenate(([0.0], np.cumsum(interval_integrals)))
+
+        self.monotone = bool(np.all(self.values >= 0))
+        if self.monotone:
+            self._slopes = _limit_slopes(self.temperatures, self.cumulative, self.values)
+        else:
+            self._slopes = self.values
+        self._inverse_slopes = None
+
+        self.accuracy = self._estimate_accuracy()
+
+    def _integrate_intervals(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Integrate the property over each [lower, upper] interval."""
+        nodes, weights = np.polynomial.legendre.leggauss(_TABLE_GAUSS_ORDER)
+        half_width = (upper - lower)[:, None] / 2
+        midpoint = (upper + lower)[:, None] / 2
+        samples = self.evaluator.evaluate_array(midpoint + half_width * nodes)
+        return (samples * weights).sum(axis=1) * half_width[:, 0]
+
+    def _estimate_accuracy(self) -> Dict[str, float]:
+        """
+        Estimate the interpolation error of the table.
+
+        The spline is compared against directly integrated values at every
+        interval midpoint, and the full-range integral is compared against the
+        100-point trapezoid rule used by ``ThermalCalculator`` before tables
+        existed.
+        """
+        lower = self.temperatures[:-1]
+        midpoints = (lower + self.temperatures[1:]) / 2
+        reference = self.cumulative[:-1] + self._integrate_intervals(lower, midpoints)
+        interpolated = _hermite_eval(self.temperatures, self.cumulative, self._slopes, midpoints)
+        abs_error = float(np.max(np.abs(interpolated - reference)))
+
+        total = float(self.cumulative[-1])
+        trapezoid_grid = np.linspace(self.min_temp, self.max_temp, 100)
+        trapezoid = float(np.trapezoid(self.evaluator.evaluate_array(trapezoid_grid), trapezoid_grid))
+
+        return {
+            'max_abs_error': abs_error,
+            'max_rel_error': abs_error / abs(total) if total else float('inf'),
+            'full_range_integral': total,
+            'trapezoid_100_integral': trapezoid,
+            'trapezoid_100_rel_difference': abs(trapezoid - total) / abs(total) if total else float('inf')
+        }
+
+    @property
+    def temperature_range(self) -> Tuple[float, float]:
+        """Temperature range covered by the table as (min_temp, max_temp)."""
+        return (self.min_temp, self.max_temp)
+
+    def __call__(self, temperature: ArrayLike) -> ArrayLike:
+        """
+        Evaluate F(T) = ∫[T_min to T] f dT.
+
+        Args:
+            temperature: Temperature(s) in Kelvin; values outside the table
+                range are clipped to it
+
+        Returns:
+            Cumulative integral value(s)
+        """
+        result = _hermite_eval(self.temperatures, self.cumulative, self._slopes,
+                               np.asarray(temperature, dtype=float))
+        return float(result) if _is_scalar(temperature) else result
+
+    def integral(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        """
+        Definite integral ∫[temp_low to temp_high] f dT as a difference of lookups.
+
+        Args:
+            temp_low: Lower bound(s) in Kelvin
+            temp_high: Upper bound(s) in Kelvin
+
+        Returns:
+            Integral value(s)
+        """
+        return self(temp_high) - self(temp_low)
+
+    def inverse(self, cumulative: ArrayLike) -> ArrayLike:
+        """
+        Invert the table: find T such that F(T) equals the given value(s).
+
+        Uses a Hermite spline of T against F (node slopes 1/f) followed by one
+        vectorized Newton step on the exact property, so a whole temperature
+        profile is recovered in a single pass.
+
+        Args:
+            cumulative: Target value(s) of F; values outside [0, F(T_max)] are
+                clipped, mapping to the range bounds
+
+        Returns:
+            Temperature(s) in Kelvin
+
+        Raises:
+            ValueError: If the property is not strictly positive on the grid
+        """
+        if self._inverse_slopes is None:
+            if not np.all(self.values > 0):
+                raise ValueError(
+                    f"Cannot invert cumulative integral of {self.evaluator.property_name}: "
+                    f"property is not strictly positive over its range"
+                )
+            self._inverse_slopes = _limit_slopes(self.cumulative, self.temperatures,
+                                                 1.0 / self.values)
+
+        target = np.clip(np.asarray(cumulative, dtype=float),
+                         self.cumulative[0], self.cumulative[-1])
+        temperatures = _hermite_eval(self.cumulative, self.temperatures,
+                                     self._inverse_slopes, target)
+
+        # Newton polish against the forward spline: F'(T) = f(T)
+        residual = self(temperatures) - target
+        temperatures = np.clip(temperatures - residual / self.evaluator.evaluate_array(temperatures),
+                               self.min_temp, self.max_temp)
+        return float(temperatures) if _is_scalar(cumulative) else temperatures
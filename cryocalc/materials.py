@@ -4,15 +4,63 @@ Material database management for cryogenic property calculations.
 
 import json
 import os
+import threading
+from collections.abc import Mapping
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from .binary_format import (BINARY_SUFFIX, BinaryMaterials, is_binary_materials_file,
+                            write_binary_materials)
 from .properties import PropertyType, EquationType
 
 
+#: Materials data file shipped with the package
+DEFAULT_DATA_FILE = Path(__file__).parent / "data" / "materials.json"
+
+# Process-wide parsed copy of the default data file, shared read-only by every
+# MaterialDatabase created without a data_file. Loaded on first access.
+_default_materials: Optional[Dict[str, Any]] = None
+_default_generation = 0
+_default_lock = threading.Lock()
+
+
+def _read_materials_file(data_file: Path) -> Mapping:
+    """Map a binary data file, or parse the 'materials' section of a JSON one."""
+    try:
+        if is_binary_materials_file(data_file):
+            return BinaryMaterials(data_file)
+        with open(data_file, 'r') as f:
+            data = json.load(f)
+            return data.get('materials', {})
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Materials data file not found: {data_file}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in materials data file: {e}")
+
+
+def _get_default_materials(reload: bool = False) -> tuple:
+    """Return (materials, generation) for the shared default data, loading it if needed."""
+    global _default_materials, _default_generation
+    with _default_lock:
+        if _default_materials is None or reload:
+            _default_materials = _read_materials_file(DEFAULT_DATA_FILE)
+            _default_generation += 1
+        return _default_materials, _default_generation
+
+
 class MaterialDatabase:
     """
     Database of cryogenic material properties and calculation parameters.
+    
+    Databases created without a ``data_file`` share one lazily parsed copy of
+    the packaged materials.json: the file is read on first property access in
+    the process and reused by every calculator afterwards. The shared data is
+    read-only; ``add_material`` first gives the database its own copy.
+    
+    A ``data_file`` may be JSON or the binary format written by
+    ``save_materials`` (see ``cryocalc.binary_format``); the format is detected
+    from the file contents. Binary files are memory-mapped and each material is
+    decoded on first lookup.
     """
     
     def __init__(self, data_file: Optional[str] = None):
@@ -20,27 +68,98 @@ class MaterialDatabase:
         Initialize the material database.
         
         Args:
-            data_file: Path to JSON data file. If None, uses default materials.json
+            data_file: Path to a JSON or binary data file. If None, uses the
+                shared default materials.json, which is loaded on first access.
+        """
+        self._is_default = data_file is None
+        self.data_file = DEFAULT_DATA_FILE if data_file is None else Path(data_file)
+        self._data: Optional[Dict[str, Any]] = None
+        self._shared = self._is_default
+        self._generation = 0
+        self._revision = 0
+        if not self._is_default:
+            self.load_materials()
+    
+    @classmethod
+    def from_data(cls, materials: Dict[str, Any]) -> 'MaterialDatabase':
         """
-        if data_file is None:
-            # Use default data file in package
-            package_dir = Path(__file__).parent
-            data_file = package_dir / "data" / "materials.json"
+        Create a database from an already parsed materials dictionary.
         
-        self.data_file = Path(data_file)
-        self._materials_data = {}
-        self.load_materials()
+        The dictionary is used as is, without copying or re-reading any file,
+        which makes it cheap to hand a loaded database to worker processes.
+        
+        Args:
+            materials: Mapping of material IDs to material data
+            
+        Returns:
+            MaterialDatabase over ``materials``
+        """
+        database = cls.__new__(cls)
+        database._is_default = False
+        database.data_file = None
+        database._data = materials
+        database._shared = False
+        database._generation = 0
+        database._revision = 0
+        return database
+    
+    @property
+    def _materials_data(self) -> Mapping:
+        """Materials dictionary, synchronized with the shared default data."""
+        if self._shared and (self._data is None or self._generation != _default_generation):
+            self._data, self._generation = _get_default_materials()
+        return self._data
+    
+    @_materials_data.setter
+    def _materials_data(self, value: Mapping) -> None:
+        self._data = value
+    
+    @property
+    def materials_data(self) -> Mapping:
+        """
+        All materials data, keyed by material ID.
+        
+        This is the loaded mapping itself, not a copy, so it can be handed to
+        ``from_data`` (e.g. in worker processes) cheaply. Treat it as
+        read-only; use ``add_material`` to change the database.
+        """
+        return self._materials_data
+    
+    @property
+    def revision(self) -> int:
+        """
+        Counter incremented whenever the materials data changes.
+        
+        Calculators use this to invalidate cached evaluators.
+        """
+        if self._shared:
+            return self._revision + _default_generation
+        return self._revision + self._generation
     
     def load_materials(self) -> None:
-        """Load materials data from JSON file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                self._materials_data = data.get('materials', {})
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Materials data file not found: {self.data_file}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in materials data file: {e}")
+        """
+        Load materials data from the data file (JSON or binary).
+        
+        For the default database this re-reads the packaged file into the
+        shared copy, so every default database in the process sees the new data.
+        """
+        if self._is_default:
+            self._data, self._generation = _get_default_materials(reload=True)
+            self._shared = True
+        elif self.data_file is None:
+            raise ValueError("Database was created from data and has no file to load")
+        else:
+            self._data = _read_materials_file(self.data_file)
+        self._revision += 1
+    
+    def reload(self) -> None:
+        """
+        Re-read the data file after it has changed on disk.
+        
+        Discards materials added with ``add_material``. Calculators using this
+        database drop their cached evaluators on next use.
+        """
+        self.load_materials()
     
     def get_available_materials(self) -> List[str]:
         """
@@ -73,6 +192,27 @@ class MaterialDatabase:
             'properties': list(material.get('properties', {}).keys())
         }
     
+    def get_density(self, material_id: str) -> float:
+        """
+        Get the density of a material.
+        
+        Args:
+            material_id: Material identifier
+            
+        Returns:
+            Density in kg/m³ (room temperature value)
+            
+        Raises:
+            ValueError: If material not found or has no density
+        """
+        if material_id not in self._materials_data:
+            raise ValueError(f"Material '{material_id}' not found in database")
+        
+        density = self._materials_data[material_id].get('density')
+        if density is None:
+            raise ValueError(f"No density for material '{material_id}'")
+        return float(density)
+    
     def get_material_property(self, material_id: str, property_name: str) -> Dict[str, Any]:
         """
         Get property data for a specific material and property.
@@ -180,6 +320,14 @@ class MaterialDatabase:
                                      isinstance(prop_data['denominator_coefficients'], list))
                 if not (has_coefficients or has_separate_coeffs):
                     return False
+            elif equation_type == EquationType.ERF_COMPOSITE.value:
+                segments = prop_data.get('segments')
+                if not isinstance(segments, list) or len(segments) == 0:
+                    return False
+            elif equation_type == EquationType.PIECEWISE.value:
+                pieces = prop_data.get('pieces')
+                if not isinstance(pieces, list) or len(pieces) == 0:
+                    return False
             else:
                 # For other equation types, check for coefficients
                 if 'coefficients' not in prop_data:
@@ -208,18 +356,39 @@ class MaterialDatabase:
             material_id: Unique identifier for the material
             material_data: Material data dictionary
         """
+        if self._shared or not isinstance(self._materials_data, dict):
+            # Copy on write: never modify the process-wide default data or a
+            # mapped binary file
+            self._materials_data = dict(self._materials_data)
+            self._shared = False
         self._materials_data[material_id] = material_data
+        self._revision += 1
     
-    def save_materials(self, output_file: Optional[str] = None) -> None:
+    def save_materials(self, output_file: Optional[str] = None,
+                       binary: Optional[bool] = None) -> None:
         """
-        Save materials data to JSON file.
+        Save materials data to a JSON or binary file.
         
         Args:
             output_file: Output file path. If None, saves to original data file
+            binary: Write the memory-mappable binary format. If None, binary is
+                used for paths ending in ``.cdb`` and JSON otherwise.
+        
+        Raises:
+            ValueError: If ``output_file`` is omitted for a database created
+                with ``from_data``
         """
+        if not output_file and self.data_file is None:
+            raise ValueError("output_file is required for databases not loaded from a file")
         output_path = Path(output_file) if output_file else self.data_file
+        if binary is None:
+            binary = output_path.suffix.lower() == BINARY_SUFFIX
+        
+        if binary:
+            write_binary_materials(self._materials_data, output_path)
+            return
         
-        data = {'materials': self._materials_data}
+        data = {'materials': dict(self._materials_data)}
         
         with open(output_path, 'w') as f:
             json.dump(data, f, indent=2)
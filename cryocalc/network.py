@@ -0,0 +1,405 @@
+"""
+Steady-state thermal networks of conducting segments.
+
+A network is a graph whose edges are segments (a material and a geometry)
+joining named nodes. Some nodes have fixed
+temperatures (e.g. the 300 K flange and the 4 K plate); the solver finds the
+temperatures of the others so that heat is conserved at every free node.
+
+The heat flow through a segment is exact for temperature-dependent k:
+
+    Q = (A/L) * (F(T_a) - F(T_b)),   F(T) = ∫[T_min to T] k dT
+
+(with the geometry's shape factor in place of A/L for variable sections)
+with F taken from the ThermalCalculator's cached cumulative tables, and
+dQ/dT_a = (A/L) * k(T_a). Each Newton iteration therefore costs two table
+lookups and two k(T) evaluations per segment, vectorized per material property.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .thermal import Geometry, ThermalCalculator
+
+
+@dataclass
+class NetworkSegment:
+    """
+    A conducting segment between two nodes.
+
+    Attributes:
+        node_a: First node
+        node_b: Second node; positive heat flow runs from node_a to node_b
+        material_id: Material identifier
+        geometry: Segment geometry
+        count: Number of identical segments in parallel (e.g. wires in a bundle)
+        name: Optional label used in solutions
+        property_name: Conductivity property of the material, e.g.
+            'thermal_conductivity_normal' for directional materials
+    """
+    node_a: Hashable
+    node_b: Hashable
+    material_id: str
+    geometry: Geometry
+    count: int = 1
+    name: Optional[str] = None
+    property_name: str = 'thermal_conductivity'
+
+    @property
+    def shape_factor(self) -> float:
+        """Total shape factor (A/L) of the segment in m, including ``count``."""
+        return self.count * self.geometry.shape_factor()
+
+
+@dataclass
+class NetworkSolution:
+    """
+    Solved state of a thermal network.
+
+    Attributes:
+        temperatures: Temperature of every node (K)
+        heat_flows: Heat flow through each segment from node_a to node_b (W),
+            in the order the segments were added
+        boundary_heat: Net heat delivered by the network to each fixed node (W);
+            positive at a cold stage means a heat load on that stage
+        iterations: Newton iterations used
+        residual: Largest heat imbalance left at a free node (W)
+    """
+    temperatures: Dict[Hashable, float]
+    heat_flows: List[float]
+    boundary_heat: Dict[Hashable, float]
+    iterations: int
+    residual: float
+
+    def heat_load(self, node: Hashable) -> float:
+        """Heat delivered to a fixed-temperature node (W)."""
+        return self.boundary_heat[node]
+
+
+class ThermalNetwork:
+    """
+    Series/parallel network of thermal links solved with Newton's method.
+
+    Example:
+        >>> network = ThermalNetwork()
+        >>> network.add_segment('300K', 'clamp', 'stainless_steel_304', create_tube(10, 0.5, 200))
+        >>> network.add_segment('clamp', '4K', 'teflon', create_rod(5, 20))
+        >>> network.fix_temperature('300K', 300.0)
+        >>> network.fix_temperature('4K', 4.0)
+        >>> network.solve().heat_load('4K')
+    """
+
+    def __init__(self, thermal_calculator: Optional[ThermalCalculator] = None):
+        """
+        Initialize an empty network.
+
+        Args:
+            thermal_calculator: ThermalCalculator whose cumulative tables are
+                used. If None, creates a default one.
+        """
+        self.thermal = thermal_calculator or ThermalCalculator()
+        self.segments: List[NetworkSegment] = []
+        self.fixed_temperatures: Dict[Hashable, float] = {}
+        self.heat_inputs: Dict[Hashable, float] = {}
+        self._nodes: Dict[Hashable, int] = {}
+
+    @classmethod
+    def series(cls, links: Sequence[Tuple], temp_hot: float, temp_cold: float,
+               thermal_calculator: Optional[ThermalCalculator] = None) -> 'ThermalNetwork':
+        """
+        Build a chain of segments from a hot node to a cold node.
+
+        Nodes are named 'hot', 'joint 1', ..., 'joint N-1' and 'cold'.
+
+        Args:
+            links: (material_id, geometry) or (material_id, geometry, variant)
+                tuples from the hot end to the cold end
+            temp_hot: Hot end temperature (K)
+            temp_cold: Cold end temperature (K)
+            thermal_calculator: ThermalCalculator to use
+
+        Returns:
+            ThermalNetwork ready to solve
+        """
+        if not links:
+            raise ValueError("A series link needs at least one segment")
+        network = cls(thermal_calculator)
+        nodes = ['hot'] + [f"joint {i}" for i in range(1, len(links))] + ['cold']
+        for (material_id, geometry, *variant), node_a, node_b in zip(links, nodes, nodes[1:]):
+            network.add_segment(node_a, node_b, material_id, geometry,
+                                variant=variant[0] if variant else None)
+        network.fix_temperature('hot', temp_hot)
+        network.fix_temperature('cold', temp_cold)
+        return network
+
+    @property
+    def nodes(self) -> List[Hashable]:
+        """Nodes in the order they were first referenced."""
+        return list(self._nodes)
+
+    def _node_index(self, node: Hashable) -> int:
+        if node not in self._nodes:
+            self._nodes[node] = len(self._nodes)
+        return self._nodes[node]
+
+    def add_segment(self, node_a: Hashable, node_b: Hashable, material_id: str,
+                    geometry: Geometry, count: int = 1,
+                    name: Optional[str] = None,
+                    variant: Optional[str] = None) -> NetworkSegment:
+        """
+        Connect two nodes with a conducting segment.
+
+        Parallel paths are separate segments between the same nodes; ``count``
+        is a shortcut for identical parallel segments.
+
+        Args:
+            node_a: First node
+            node_b: Second node
+            material_id: Material with a 'thermal_conductivity' property
+            geometry: Segment geometry
+            count: Number of identical segments in parallel
+            name: Optional label
+            variant: Conductivity variant for directional materials, e.g.
+                'normal' uses 'thermal_conductivity_normal' (as in the CLI)
+
+        Returns:
+            The new NetworkSegment
+        """
+        if node_a == node_b:
+            raise ValueError("A segment must join two different nodes")
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        property_name = f"thermal_conductivity_{variant}" if variant else 'thermal_conductivity'
+        # Fail early on unknown materials or missing conductivity data
+        self.thermal.calculator.get_evaluator(material_id, property_name)
+        segment = NetworkSegment(node_a, node_b, material_id, geometry, int(count), name,
+                                 property_name)
+        self._node_index(node_a)
+        self._node_index(node_b)
+        self.segments.append(segment)
+        return segment
+
+    def fix_temperature(self, node: Hashable, temperature: float) -> None:
+        """
+        Hold a node at a fixed temperature (a bath or cold stage).
+
+        Args:
+            node: Node name
+            temperature: Temperature in Kelvin
+        """
+        self._node_index(node)
+        self.fixed_temperatures[node] = float(temperature)
+
+    def add_heat_input(self, node: Hashable, power: float) -> None:
+        """
+        Inject heat at a free node, e.g. a dissipating component.
+
+        Args:
+            node: Node name
+            power: Heat input in Watts (added to any previous input)
+        """
+        self._node_index(node)
+        self.heat_inputs[node] = self.heat_inputs.get(node, 0.0) + float(power)
+
+    def _check_connected(self) -> None:
+        """Every node must be linked to some fixed-temperature node."""
+        neighbours: Dict[Hashable, List[Hashable]] = {node: [] for node in self._nodes}
+        for segment in self.segments:
+            neighbours[segment.node_a].append(segment.node_b)
+            neighbours[segment.node_b].append(segment.node_a)
+        reached = set(self.fixed_temperatures)
+        stack = list(reached)
+        while stack:
+            for neighbour in neighbours[stack.pop()]:
+                if neighbour not in reached:
+                    reached.add(neighbour)
+                    stack.append(neighbour)
+        for node in self._nodes:
+            if node not in reached:
+                raise ValueError(f"Node '{node}' is not connected to a fixed-temperature node")
+
+    def solve(self, tolerance: float = 1e-10, max_iterations: int = 50,
+              initial_temperatures: Optional[Dict[Hashable, float]] = None) -> NetworkSolution:
+        """
+        Solve for the free node temperatures and the heat flows.
+
+        Args:
+            tolerance: Convergence threshold on the largest heat imbalance at
+                a free node, relative to the largest segment heat flow
+            max_iterations: Maximum number of Newton iterations
+            initial_temperatures: Optional starting guesses for free nodes.
+                By default the network is first solved with constant k.
+
+        Returns:
+            NetworkSolution
+
+        Raises:
+            ValueError: If the network is incomplete, a temperature lies outside
+                a connected material's valid range, or Newton does not converge
+        """
+        if not self.segments:
+            raise ValueError("Network has no segments")
+        if not self.fixed_temperatures:
+            raise ValueError("Network needs at least one fixed-temperature node")
+        self._check_connected()
+
+        num_nodes = len(self._nodes)
+        node_a = np.array([self._nodes[s.node_a] for s in self.segments])
+        node_b = np.array([self._nodes[s.node_b] for s in self.segments])
+        factors = np.array([s.shape_factor for s in self.segments], dtype=float)
+
+        indices_by_property: Dict[Tuple[str, str], List[int]] = {}
+        for index, segment in enumerate(self.segments):
+            key = (segment.material_id, segment.property_name)
+            indices_by_property.setdefault(key, []).append(index)
+        groups = {key: np.array(indices) for key, indices in indices_by_property.items()}
+        tables = {key: self.thermal.get_conductivity_integral_table(*key) for key in groups}
+
+        # Each node must stay inside the valid range of every material touching it
+        lower = np.full(num_nodes, -np.inf)
+        upper = np.full(num_nodes, np.inf)
+        for key, indices in groups.items():
+            min_temp, max_temp = tables[key].temperature_range
+            for ends in (node_a[indices], node_b[indices]):
+                np.maximum.at(lower, ends, min_temp)
+                np.minimum.at(upper, ends, max_temp)
+
+        fixed = np.zeros(num_nodes, dtype=bool)
+        temperatures = np.zeros(num_nodes)
+        for node, temperature in self.fixed_temperatures.items():
+            index = self._nodes[node]
+            if not lower[index] <= temperature <= upper[index]:
+                raise ValueError(
+                    f"Temperature {temperature}K at node '{node}' is outside the valid range "
+                    f"[{lower[index]}K, {upper[index]}K] of its segments"
+                )
+            fixed[index] = True
+            temperatures[index] = temperature
+        free = ~fixed
+        if np.any(lower[free] > upper[free]):
+            node = self.nodes[int(np.flatnonzero(free & (lower > upper))[0])]
+            raise ValueError(f"Segments meeting at node '{node}' have no common temperature range")
+
+        heat_inputs = np.zeros(num_nodes)
+        for node, power in self.heat_inputs.items():
+            heat_inputs[self._nodes[node]] = power
+
+        def flows(temps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            """Segment heat flows and conductances dQ/dT_a, -dQ/dT_b."""
+            q = np.empty(len(self.segments))
+            g_a = np.empty(len(self.segments))
+            g_b = np.empty(len(self.segments))
+            for key, indices in groups.items():
+                table = tables[key]
+                t_a, t_b = temps[node_a[indices]], temps[node_b[indices]]
+                q[indices] = table(t_a) - table(t_b)
+                k = table.evaluator.evaluate_array(
+                    np.clip(np.concatenate((t_a, t_b)), table.min_temp, table.max_temp)
+                )
+                g_a[indices], g_b[indices] = k[:len(indices)], k[len(indices):]
+            return factors * q, factors * g_a, factors * g_b
+
+        def imbalance(q: np.ndarray) -> np.ndarray:
+            """Net heat into each node."""
+            return (np.bincount(node_b, q, num_nodes) - np.bincount(node_a, q, num_nodes)
+                    + heat_inputs)
+
+        if initial_temperatures:
+            for node, temperature in initial_temperatures.items():
+                if node in self._nodes and not fixed[self._nodes[node]]:
+                    temperatures[self._nodes[node]] = temperature
+        else:
+            temperatures[free] = self._linear_guess(node_a, node_b, factors, temperatures, free)
+        temperatures[free] = np.clip(temperatures[free], lower[free], upper[free])
+
+        q, g_a, g_b = flows(temperatures)
+        residual = imbalance(q)[free]
+        iterations = 0
+        while True:
+            scale = max(np.max(np.abs(q)), np.max(np.abs(heat_inputs)), np.finfo(float).tiny)
+            error = float(np.max(np.abs(residual), initial=0.0))
+            if error <= tolerance * scale:
+                break
+            if iterations >= max_iterations:
+                raise ValueError(
+                    f"Thermal network did not converge in {max_iterations} iterations "
+                    f"(heat imbalance {error:.3e} W)"
+                )
+            iterations += 1
+
+            jacobian = np.zeros((num_nodes, num_nodes))
+            np.add.at(jacobian, (node_a, node_a), -g_a)
+            np.add.at(jacobian, (node_a, node_b), g_b)
+            np.add.at(jacobian, (node_b, node_a), g_a)
+            np.add.at(jacobian, (node_b, node_b), -g_b)
+            step = np.linalg.solve(jacobian[np.ix_(free, free)], -residual)
+
+            # Backtrack until the imbalance decreases, staying inside valid ranges
+            damping = 1.0
+            while True:
+                trial = temperatures.copy()
+                trial[free] = np.clip(temperatures[free] + damping * step, lower[free], upper[free])
+                trial_q, trial_g_a, trial_g_b = flows(trial)
+                trial_residual = imbalance(trial_q)[free]
+                if np.max(np.abs(trial_residual)) < error or damping < 1e-6:
+                    break
+                damping /= 2
+            if np.array_equal(trial, temperatures):
+                raise ValueError(
+                    f"Thermal network did not converge: stuck at a material's valid range "
+                    f"limit (heat imbalance {error:.3e} W)"
+                )
+            temperatures = trial
+            q, g_a, g_b, residual = trial_q, trial_g_a, trial_g_b, trial_residual
+
+        net = imbalance(q) - heat_inputs
+        return NetworkSolution(
+            temperatures={node: float(temperatures[i]) for node, i in self._nodes.items()},
+            heat_flows=q.tolist(),
+            boundary_heat={node: float(net[self._nodes[node]]) for node in self.fixed_temperatures},
+            iterations=iterations,
+            residual=error,
+        )
+
+    @staticmethod
+    def _linear_guess(node_a: np.ndarray, node_b: np.ndarray, factors: np.ndarray,
+                      temperatures: np.ndarray, free: np.ndarray) -> np.ndarray:
+        """Free node temperatures of the same network with k = 1 W/m-K."""
+        num_nodes = len(temperatures)
+        laplacian = np.zeros((num_nodes, num_nodes))
+        np.add.at(laplacian, (node_a, node_a), factors)
+        np.add.at(laplacian, (node_b, node_b), factors)
+        np.add.at(laplacian, (node_a, node_b), -factors)
+        np.add.at(laplacian, (node_b, node_a), -factors)
+        fixed = ~free
+        rhs = -laplacian[np.ix_(free, fixed)] @ temperatures[fixed]
+        return np.linalg.solve(laplacian[np.ix_(free, free)], rhs)
+
+    def summary(self, solution: NetworkSolution) -> List[Dict[str, Any]]:
+        """
+        Describe each segment of a solved network.
+
+        Args:
+            solution: Result of ``solve``
+
+        Returns:
+            One dictionary per segment with its nodes, material, geometry,
+            end temperatures and heat flow
+        """
+        return [
+            {
+                'name': segment.name,
+                'node_a': segment.node_a,
+                'node_b': segment.node_b,
+                'material': segment.material_id,
+                'property': segment.property_name,
+                'geometry': segment.geometry.description(),
+                'count': segment.count,
+                'temp_a_K': solution.temperatures[segment.node_a],
+                'temp_b_K': solution.temperatures[segment.node_b],
+                'heat_flow_W': flow,
+            }
+            for segment, flow in zip(self.segments, solution.heat_flows)
+        ]
@@ -3,9 +3,17 @@ Property types and calculation methods for cryogenic materials.
 """
 
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union
 import math
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Scalar temperatures or arrays of temperatures. NumPy is imported only by
+# the array paths, so scalar calculations never load it.
+ArrayLike = Union[float, "np.ndarray"]
+
 
 class PropertyType(Enum):
     """Enumeration of supported material properties."""
@@ -25,105 +33,243 @@ class EquationType(Enum):
     PIECEWISE = "piecewise"  # Piecewise functions
 
 
-def erf(x: float) -> float:
+# Constant of the closed-form erf approximation shared with propcalc.js
+ERF_A = 0.147
+
+
+def erf(x: ArrayLike) -> ArrayLike:
     """
     Error function approximation.
     
+    Uses erf(x) ~ sign(x) * sqrt(1 - exp(-x^2 (4/pi + a x^2) / (1 + a x^2)))
+    with a = 0.147, the same approximation as the published fit code, so
+    erf-composite fits reproduce their reference values.
+    
     Args:
-        x: Input value
+        x: Input value (scalar or array)
         
     Returns:
-        Approximated error function value
+        Approximated error function value(s)
     """
-    if x == 0:
-        return 0
+    if _is_scalar(x):
+        if x == 0:
+            return 0
+        
+        sign = 1 if x > 0 else -1
+        x = abs(x)
+        
+        one_plus_axsqrd = 1 + ERF_A * x * x
+        four_ovr_pi_etc = 4 / math.pi + ERF_A * x * x
+        ratio = four_ovr_pi_etc / one_plus_axsqrd
+        ratio *= -x * x
+        # 1 - exp(ratio) via expm1 to avoid cancellation for small x
+        radical = math.sqrt(-math.expm1(ratio))
+        
+        return radical * sign
+    
+    import numpy as np
     
-    ERF_A = 0.147
-    sign = 1 if x > 0 else -1
-    x = abs(x)
+    x = np.asarray(x, dtype=float)
+    x_squared = x * x
+    a_x_squared = ERF_A * x_squared
+    ratio = -x_squared * (4 / math.pi + a_x_squared) / (1 + a_x_squared)
+    return np.sign(x) * np.sqrt(-np.expm1(ratio))
+
+
+def horner(x: ArrayLike, coefficients: Sequence[float]) -> ArrayLike:
+    """
+    Evaluate sum(c_i * x^i) using Horner's rule.
     
-    one_plus_axsqrd = 1 + ERF_A * x * x
-    four_ovr_pi_etc = 4 / math.pi + ERF_A * x * x
-    ratio = four_ovr_pi_etc / one_plus_axsqrd
-    ratio *= -x * x
-    expofun = math.exp(ratio)
-    radical = math.sqrt(1 - expofun)
+    Works unchanged for Python floats and NumPy arrays, so the scalar and
+    vectorized paths share one implementation.
     
-    return radical * sign
+    Args:
+        x: Evaluation point(s)
+        coefficients: Polynomial coefficients [c0, c1, c2, ...]
+        
+    Returns:
+        Polynomial value(s)
+    """
+    result = x * 0.0
+    for coeff in reversed(coefficients):
+        result = result * x + coeff
+    return result
+
+
+def _is_scalar(temperature) -> bool:
+    """Check whether a temperature argument should take the scalar path."""
+    return isinstance(temperature, (int, float))
 
 
 class PropertyCalculator:
-    """Base class for property calculations."""
+    """
+    Base class for property calculations.
+    
+    All equation forms accept either a single temperature (returning a float)
+    or an array of temperatures (returning an ``np.ndarray`` of the same shape).
+    """
     
     @staticmethod
-    def logarithmic_polynomial(temperature: float, coefficients: List[float]) -> float:
+    def logarithmic_polynomial(temperature: ArrayLike, coefficients: List[float]) -> ArrayLike:
         """
         Calculate property using logarithmic polynomial equation.
         
         log10(property) = sum(a_i * log10(T)^i)
         
         Args:
-            temperature: Temperature in Kelvin
+            temperature: Temperature in Kelvin (scalar or array)
             coefficients: List of polynomial coefficients [a0, a1, a2, ...]
             
         Returns:
-            Calculated property value
+            Calculated property value(s)
         """
-        if temperature <= 0:
+        if _is_scalar(temperature):
+            if temperature <= 0:
+                raise ValueError("Temperature must be positive")
+            return 10 ** horner(math.log10(temperature), coefficients)
+        
+        import numpy as np
+        
+        temperature = np.asarray(temperature, dtype=float)
+        if np.any(temperature <= 0):
             raise ValueError("Temperature must be positive")
-            
-        log_temp = math.log10(temperature)
-        log_result = sum(coeff * (log_temp ** i) for i, coeff in enumerate(coefficients))
-        return 10 ** log_result
+        return np.power(10.0, horner(np.log10(temperature), coefficients))
     
     @staticmethod
-    def polynomial(temperature: float, coefficients: List[float]) -> float:
+    def polynomial(temperature: ArrayLike, coefficients: List[float]) -> ArrayLike:
         """
         Calculate property using polynomial equation.
         
         property = sum(a_i * T^i)
         
         Args:
-            temperature: Temperature in Kelvin
+            temperature: Temperature in Kelvin (scalar or array)
             coefficients: List of polynomial coefficients [a0, a1, a2, ...]
             
         Returns:
-            Calculated property value
+            Calculated property value(s)
         """
-        if temperature < 0:
+        if _is_scalar(temperature):
+            if temperature < 0:
+                raise ValueError("Temperature must be non-negative")
+            return horner(temperature, coefficients)
+        
+        import numpy as np
+        
+        temperature = np.asarray(temperature, dtype=float)
+        if np.any(temperature < 0):
             raise ValueError("Temperature must be non-negative")
-            
-        return sum(coeff * (temperature ** i) for i, coeff in enumerate(coefficients))
+        return horner(temperature, coefficients)
     
     @staticmethod
-    def rational(temperature: float, numerator_coeffs: List[float], 
-                denominator_coeffs: List[float]) -> float:
+    def rational(temperature: ArrayLike, numerator_coeffs: List[float], 
+                denominator_coeffs: List[float]) -> ArrayLike:
         """
         Calculate property using rational function.
         
-        property = (sum(a_i * T^(i/2))) / (sum(b_i * T^(i/2)))
+        property = 10^((sum(a_i * T^(i/2))) / (sum(b_i * T^(i/2))))
         
         Args:
-            temperature: Temperature in Kelvin
+            temperature: Temperature in Kelvin (scalar or array)
             numerator_coeffs: Numerator coefficients
             denominator_coeffs: Denominator coefficients
             
         Returns:
-            Calculated property value
+            Calculated property value(s)
         """
-        if temperature < 0:
+        if _is_scalar(temperature):
+            if temperature < 0:
+                raise ValueError("Temperature must be non-negative")
+            sqrt_temp = math.sqrt(temperature)
+            numerator = horner(sqrt_temp, numerator_coeffs)
+            denominator = horner(sqrt_temp, denominator_coeffs)
+            if denominator == 0:
+                raise ValueError("Denominator is zero")
+            return 10 ** (numerator / denominator)
+        
+        import numpy as np
+        
+        temperature = np.asarray(temperature, dtype=float)
+        if np.any(temperature < 0):
             raise ValueError("Temperature must be non-negative")
+        sqrt_temp = np.sqrt(temperature)
+        numerator = horner(sqrt_temp, numerator_coeffs)
+        denominator = horner(sqrt_temp, denominator_coeffs)
+        if np.any(denominator == 0):
+            raise ValueError("Denominator is zero")
+        return np.power(10.0, numerator / denominator)
+    
+    @staticmethod
+    def erf_composite(temperature: ArrayLike, segments: Sequence[Tuple[tuple, tuple]],
+                      variable: str = "linear", log_output: bool = False) -> ArrayLike:
+        """
+        Calculate property using an error-function composite.
+        
+        Each segment is a sum of terms c * (x - x0)^p * exp(-x / d) multiplied by
+        smooth erf windows (1 +/- erf(s * (x - x_c))) / 2 that switch it on
+        above or below x_c. The property is the sum of all segments, or
+        10 raised to that sum when ``log_output`` is set.
+        
+        Args:
+            temperature: Temperature in Kelvin (scalar or array)
+            segments: Sequence of (terms, windows) pairs. Terms are
+                (coefficient, power, offset, decay) tuples, with decay 0 for no
+                exponential factor. Windows are (center, slope, sign) tuples,
+                with sign +1 for "above" and -1 for "below".
+            variable: "linear" to use x = T, or "log10" to use x = log10(T)
+            log_output: If True, the sum is log10 of the property
+            
+        Returns:
+            Calculated property value(s)
+        """
+        if _is_scalar(temperature):
+            if temperature <= 0:
+                raise ValueError("Temperature must be positive")
+            x = math.log10(temperature) if variable == "log10" else float(temperature)
+            exp = math.exp
+        else:
+            import numpy as np
             
-        numerator = sum(coeff * (temperature ** (i * 0.5)) 
-                       for i, coeff in enumerate(numerator_coeffs))
-        denominator = sum(coeff * (temperature ** (i * 0.5)) 
-                         for i, coeff in enumerate(denominator_coeffs))
+            temperature = np.asarray(temperature, dtype=float)
+            if np.any(temperature <= 0):
+                raise ValueError("Temperature must be positive")
+            x = np.log10(temperature) if variable == "log10" else temperature
+            exp = np.exp
         
-        if denominator == 0:
-            raise ValueError("Denominator is zero")
+        total = x * 0.0
+        for terms, windows in segments:
+            value = x * 0.0
+            for coefficient, power, offset, decay in terms:
+                term = coefficient * (x - offset) ** power if power else coefficient
+                if decay:
+                    term = term * exp(-x / decay)
+                value = value + term
+            for center, slope, sign in windows:
+                value = value * (1 + sign * erf(slope * (x - center))) / 2
+            total = total + value
+        
+        if log_output:
+            return 10 ** total if _is_scalar(total) else np.power(10.0, total)
+        return total
+    
+    @staticmethod
+    def temperature_range_mask(temperatures: "np.ndarray", min_temp: float,
+                               max_temp: float) -> "np.ndarray":
+        """
+        Vectorized temperature range check.
+        
+        Args:
+            temperatures: Array of temperatures
+            min_temp: Minimum valid temperature
+            max_temp: Maximum valid temperature
             
-        result = numerator / denominator
-        return 10 ** result
+        Returns:
+            Boolean array, True where the temperature is within [min_temp, max_temp]
+        """
+        import numpy as np
+        
+        temperatures = np.asarray(temperatures, dtype=float)
+        return (temperatures >= min_temp) & (temperatures <= max_temp)
     
     @staticmethod
     def validate_temperature_range(temperature: float, min_temp: float, max_temp: float) -> None:
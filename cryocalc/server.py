@@ -0,0 +1,263 @@
+"""
+Persistent calculation server with a line-delimited JSON protocol.
+
+One request per line, one response per line, in order. Each request is a JSON
+object with an ``op`` field and an optional ``id`` that is echoed back:
+
+    {"id": 1, "op": "calculate", "material": "aluminum_1100",
+     "property": "thermal_conductivity", "temperature": [4, 77, 300]}
+    {"id": 1, "ok": true, "result": {"values": [...], "units": "W/m-K"}}
+
+Failed requests produce ``{"id": ..., "ok": false, "error": "..."}`` and the
+server keeps running, whatever the failure. The calculators stay warm between requests, so each
+query costs one evaluation rather than a process start and a database parse.
+"""
+
+import json
+import math
+import os
+import socketserver
+import stat
+import sys
+from typing import Any, Callable, Dict, IO, Optional
+
+from .calculator import MaterialCalculator
+from .properties import PropertyType
+
+
+# Geometry factory names and their keyword arguments (dimensions in mm)
+GEOMETRY_FACTORIES = ('rod', 'wire', 'tube', 'bar', 'custom', 'frustum', 'stepped', 'profile')
+
+
+def _to_json_value(value):
+    """Convert NumPy results to JSON values, with NaN reported as None."""
+    if hasattr(value, 'tolist'):
+        value = value.tolist()
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class RequestHandler:
+    """
+    Dispatches protocol requests to warm calculator instances.
+
+    The ThermalCalculator is created on the first thermal request, so servers
+    that only evaluate properties never import the thermal module.
+    """
+
+    def __init__(self, calculator: Optional[MaterialCalculator] = None):
+        """
+        Initialize the handler.
+
+        Args:
+            calculator: MaterialCalculator to serve. If None, creates a default one.
+        """
+        self.calculator = calculator or MaterialCalculator()
+        self._thermal = None
+        self._operations: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'ping': lambda request: 'pong',
+            'list-materials': self._list_materials,
+            'info': self._info,
+            'calculate': self._calculate,
+            'conductivity-integral': self._conductivity_integral,
+            'thermal-power': self._thermal_power,
+            'reload': self._reload,
+        }
+
+    @property
+    def thermal(self):
+        """ThermalCalculator sharing this handler's MaterialCalculator."""
+        if self._thermal is None:
+            from .thermal import ThermalCalculator
+            self._thermal = ThermalCalculator(self.calculator)
+        return self._thermal
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a single decoded request.
+
+        Args:
+            request: Request object
+
+        Returns:
+            Response object with ``ok`` and either ``result`` or ``error``
+        """
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            op = request.get('op')
+            if op not in self._operations:
+                raise ValueError(
+                    f"Unknown op '{op}'. Available: {', '.join(self._operations)}"
+                )
+            result = self._operations[op](request)
+        except (ValueError, KeyError, TypeError, NotImplementedError) as e:
+            message = f"Missing field {e}" if isinstance(e, KeyError) else str(e)
+            return {'id': request_id, 'ok': False, 'error': message}
+        except Exception as e:
+            # Anything else (e.g. a zero-length geometry) fails this request only
+            return {'id': request_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        return {'id': request_id, 'ok': True, 'result': result}
+
+    def handle_line(self, line: str) -> str:
+        """
+        Answer one protocol line.
+
+        Args:
+            line: JSON-encoded request
+
+        Returns:
+            JSON-encoded response, without a trailing newline
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {'id': None, 'ok': False, 'error': f"Invalid JSON: {e}"}
+        else:
+            response = self.handle(request)
+        return json.dumps(response)
+
+    def serve_stream(self, infile: IO[str], outfile: IO[str]) -> None:
+        """
+        Answer requests from ``infile`` until end of file.
+
+        Blank lines are ignored. Every response is flushed immediately.
+
+        Args:
+            infile: Text stream of requests
+            outfile: Text stream for responses
+        """
+        for line in infile:
+            if not line.strip():
+                continue
+            outfile.write(self.handle_line(line) + '\n')
+            outfile.flush()
+
+    def _property_name(self, request: Dict[str, Any]) -> str:
+        property_name = request['property']
+        if request.get('variant'):
+            property_name += f"_{request['variant']}"
+        return property_name
+
+    def _list_materials(self, request: Dict[str, Any]) -> Any:
+        if request.get('property'):
+            return self.calculator.list_materials_with_property(PropertyType(request['property']))
+        return self.calculator.list_all_materials()
+
+    def _info(self, request: Dict[str, Any]) -> Any:
+        return self.calculator.get_material_summary(request['material'])
+
+    def _calculate(self, request: Dict[str, Any]) -> Any:
+        material_id = request['material']
+        property_name = self._property_name(request)
+        temperature = request['temperature']
+        precision = request.get('precision', 6)
+        if not isinstance(precision, int) or isinstance(precision, bool):
+            raise ValueError("precision must be an integer")
+        units = self.calculator.database.get_material_property(material_id, property_name).get('units', '')
+
+        if isinstance(temperature, list):
+            values = self.calculator.calculate_property_many(
+                material_id, property_name, temperature,
+                nan_out_of_range=bool(request.get('nan_out_of_range', False)),
+                precision=precision
+            )
+            return {'values': _to_json_value(values), 'units': units}
+
+        value = self.calculator.calculate_property(material_id, property_name,
+                                                   temperature, precision)
+        return {'value': value, 'units': units}
+
+    def _conductivity_integral(self, request: Dict[str, Any]) -> Any:
+        result = self.thermal.integrate_thermal_conductivity(
+            request['material'], request['temp_low'], request['temp_high'],
+            method=request.get('method')
+        )
+        return {'value': result.value, 'method': result.method, 'units': 'W/m'}
+
+    def _thermal_power(self, request: Dict[str, Any]) -> Any:
+        geometry = self._geometry(request['geometry'])
+        power = self.thermal.calculate_thermal_power(
+            request['material'], geometry, request['temp_hot'], request['temp_cold'],
+            method=request.get('method')
+        )
+        return {'value': power, 'units': 'W', 'geometry': geometry.description()}
+
+    def _geometry(self, spec: Dict[str, Any]):
+        """Build a geometry from {"type": ..., <create_* keyword arguments>}."""
+        from . import thermal
+
+        if not isinstance(spec, dict):
+            raise ValueError("geometry must be an object")
+        spec = dict(spec)
+        geometry_type = spec.pop('type', None)
+        if geometry_type not in GEOMETRY_FACTORIES:
+            raise ValueError(
+                f"Unknown geometry type '{geometry_type}'. "
+                f"Available: {', '.join(GEOMETRY_FACTORIES)}"
+            )
+        return getattr(thermal, f"create_{geometry_type}")(**spec)
+
+    def _reload(self, request: Dict[str, Any]) -> Any:
+        self.calculator.database.reload()
+        return {'materials': len(self.calculator.database.get_available_materials())}
+
+
+class _UnixStreamHandler(socketserver.StreamRequestHandler):
+    """Serves one socket connection with the server's shared RequestHandler."""
+
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.decode('utf-8')
+            if not line.strip():
+                continue
+            self.wfile.write((self.server.request_handler.handle_line(line) + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_stdio(handler: Optional[RequestHandler] = None) -> None:
+    """
+    Answer requests on stdin/stdout until stdin is closed.
+
+    Args:
+        handler: RequestHandler to use. If None, creates a default one.
+    """
+    (handler or RequestHandler()).serve_stream(sys.stdin, sys.stdout)
+
+
+def serve_unix_socket(path: str, handler: Optional[RequestHandler] = None) -> None:
+    """
+    Answer requests on a Unix domain socket until interrupted.
+
+    Each connection speaks the same line protocol as stdin/stdout. All
+    connections share one set of warm calculators.
+
+    Args:
+        path: Socket file path; a stale socket file is replaced
+        handler: RequestHandler to use. If None, creates a default one.
+
+    Raises:
+        ValueError: If something other than a socket exists at ``path``
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise ValueError(f"{path} exists and is not a socket")
+        os.unlink(path)
+    with _UnixServer(path, _UnixStreamHandler) as server:
+        server.request_handler = handler or RequestHandler()
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
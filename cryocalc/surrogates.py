@@ -0,0 +1,183 @@
+"""
+Chebyshev surrogate models for material property fits.
+
+A surrogate replaces the reference equation of a (material, property) pair
+with a Chebyshev expansion in log T over the property's valid range. The
+expansion is fitted once, checked against the reference evaluator on a dense
+grid and then evaluated with the Clenshaw recurrence, which costs the same
+for every equation type and vectorizes without branches. Piecewise
+properties are fitted piece by piece, so a jump at a breakpoint does not
+defeat the expansion.
+"""
+
+from typing import List, Sequence, Tuple
+import math
+
+import numpy as np
+
+from .evaluators import PiecewiseEvaluator, PropertyEvaluator
+from .properties import ArrayLike
+
+
+def clenshaw(x: ArrayLike, coefficients: Sequence[float]) -> ArrayLike:
+    """
+    Evaluate sum(c_i * T_i(x)) with the Clenshaw recurrence.
+
+    Works unchanged for Python floats and NumPy arrays.
+
+    Args:
+        x: Evaluation point(s) in [-1, 1]
+        coefficients: Chebyshev coefficients [c0, c1, c2, ...]
+
+    Returns:
+        Series value(s)
+    """
+    b1 = x * 0.0
+    b2 = x * 0.0
+    two_x = 2 * x
+    for coeff in coefficients[:0:-1]:
+        b1, b2 = two_x * b1 - b2 + coeff, b1
+    return x * b1 - b2 + coefficients[0]
+
+
+class ChebyshevEvaluator(PropertyEvaluator):
+    """
+    Chebyshev surrogate for a reference property evaluator.
+
+    The variable is log T when the valid range starts above 0 K and T
+    otherwise. Strictly positive properties are fitted in log10 space, so the
+    tolerance bounds the pointwise relative error; properties that change sign
+    are fitted directly and the tolerance is relative to the largest magnitude
+    over the range.
+
+    Attributes:
+        reference: Evaluator the surrogate was fitted to
+        coefficients: Chebyshev coefficients of the fitted expansion
+        degree: Degree of the expansion
+        max_rel_error: Maximum error measured on the verification grid
+    """
+
+    def __init__(self, reference: PropertyEvaluator, tolerance: float = 1e-9,
+                 max_degree: int = 256, verification_points: int = 2001):
+        """
+        Fit the surrogate.
+
+        Args:
+            reference: Evaluator to approximate
+            tolerance: Required maximum relative error on the verification grid
+            max_degree: Largest expansion degree tried before giving up
+            verification_points: Number of points used to verify the fit
+
+        Raises:
+            ValueError: If the tolerance cannot be met with ``max_degree``
+        """
+        super().__init__(reference.material_id, reference.property_name,
+                         reference.min_temp, reference.max_temp, reference.units)
+        self.reference = reference
+        self.equation_type = reference.equation_type
+        self.has_antiderivative = reference.has_antiderivative
+        self.log_variable = self.min_temp > 0
+
+        lower, upper = self._variable(self.min_temp), self._variable(self.max_temp)
+        self._center = (upper + lower) / 2
+        self._half_width = (upper - lower) / 2
+
+        check_x = np.cos(np.linspace(0.0, math.pi, verification_points))
+        check_values = reference.evaluate_array(self._temperature(check_x))
+        self.log_output = bool(np.all(check_values > 0))
+        if self.log_output:
+            check_target = np.log10(check_values)
+        else:
+            check_target = check_values
+            scale = np.max(np.abs(check_values)) or 1.0
+
+        degree = 8
+        while True:
+            coefficients = np.polynomial.chebyshev.chebinterpolate(self._fit_target, degree)
+            fitted = np.polynomial.chebyshev.chebval(check_x, coefficients)
+            if self.log_output:
+                error = float(np.max(np.abs(np.power(10.0, fitted - check_target) - 1)))
+            else:
+                error = float(np.max(np.abs(fitted - check_target)) / scale)
+            if error <= tolerance:
+                break
+            if degree >= max_degree:
+                raise ValueError(
+                    f"Chebyshev surrogate for {self.material_id}/{self.property_name} "
+                    f"did not reach tolerance {tolerance:g} (error {error:.2e} at degree {degree})"
+                )
+            degree = min(2 * degree, max_degree)
+
+        self.coefficients = tuple(float(c) for c in coefficients)
+        self.degree = degree
+        self.max_rel_error = error
+
+    def _variable(self, temperature):
+        """Map temperature to the expansion variable (log T or T)."""
+        return np.log(temperature) if self.log_variable else temperature
+
+    def _temperature(self, x: np.ndarray) -> np.ndarray:
+        """Map x in [-1, 1] back to temperature."""
+        variable = self._center + self._half_width * x
+        temperatures = np.exp(variable) if self.log_variable else variable
+        return np.clip(temperatures, self.min_temp, self.max_temp)
+
+    def _fit_target(self, x: np.ndarray) -> np.ndarray:
+        """Function sampled by the Chebyshev interpolation."""
+        values = self.reference.evaluate_array(self._temperature(x))
+        return np.log10(values) if self.log_output else values
+
+    def evaluate(self, temperature: float) -> float:
+        """Evaluate the surrogate at a single temperature."""
+        variable = math.log(temperature) if self.log_variable else temperature
+        result = clenshaw((variable - self._center) / self._half_width, self.coefficients)
+        return 10 ** result if self.log_output else result
+
+    def evaluate_array(self, temperatures: np.ndarray) -> np.ndarray:
+        """Evaluate the surrogate over an array of temperatures."""
+        temperatures = np.asarray(temperatures, dtype=float)
+        variable = np.log(temperatures) if self.log_variable else temperatures
+        result = clenshaw((variable - self._center) / self._half_width, self.coefficients)
+        return np.power(10.0, result) if self.log_output else result
+
+    def integrate(self, temp_low: ArrayLike, temp_high: ArrayLike) -> ArrayLike:
+        """Closed-form integral of the reference fit, where it has one."""
+        return self.reference.integrate(temp_low, temp_high)
+
+
+def fit_surrogate(reference: PropertyEvaluator,
+                  tolerance: float = 1e-9) -> Tuple[PropertyEvaluator, List[str]]:
+    """
+    Replace an evaluator by verified Chebyshev surrogates where possible.
+
+    Piecewise evaluators are fitted piece by piece and reassembled with the
+    same breakpoints; pieces that cannot meet the tolerance keep their
+    reference fit. Any other evaluator is fitted as a whole.
+
+    Args:
+        reference: Evaluator to approximate
+        tolerance: Required maximum relative error, see ``ChebyshevEvaluator``
+
+    Returns:
+        (evaluator, failures): the evaluator to use, and one message per fit
+        (or piece) that kept the reference equation. ``evaluator`` is
+        ``reference`` itself when nothing could be replaced.
+    """
+    if isinstance(reference, PiecewiseEvaluator):
+        pieces = []
+        failures = []
+        for piece in reference.pieces:
+            fitted, piece_failures = fit_surrogate(piece, tolerance)
+            pieces.append(fitted)
+            failures.extend(f"piece {piece.min_temp:g}-{piece.max_temp:g}K: {message}"
+                            for message in piece_failures)
+        if all(fitted is piece for fitted, piece in zip(pieces, reference.pieces)):
+            return reference, failures
+        return PiecewiseEvaluator(reference.material_id, reference.property_name,
+                                  reference.min_temp, reference.max_temp, pieces,
+                                  reference.units), failures
+
+    try:
+        return ChebyshevEvaluator(reference, tolerance), []
+    except ValueError as e:
+        return reference, [str(e)]
@@ -3,13 +3,23 @@ Thermal conductance and geometry calculations for cryogenic materials.
 """
 
 import math
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List, Sequence, Union, Callable
 from enum import Enum
 from dataclasses import dataclass
-from scipy import integrate
 import numpy as np
 
 from .calculator import MaterialCalculator
+from .materials import MaterialDatabase
+from .properties import PropertyCalculator
+from .integration import (
+    CumulativeIntegralTable,
+    IntegrationResult,
+    integrate_gauss_kronrod,
+    integrate_gauss_legendre,
+    integrate_simpson,
+    integrate_trapezoid,
+    _hermite_eval
+)
 
 
 class GeometryType(Enum):
@@ -19,11 +29,16 @@ class GeometryType(Enum):
     TUBE = "tube"
     BAR = "bar"
     CUSTOM = "custom"
+    FRUSTUM = "frustum"
+    STEPPED = "stepped"
+    PROFILE = "profile"
 
 
 class Geometry:
     """Base class for thermal geometry definitions."""
     
+    __slots__ = ('length', 'geometry_type')
+    
     def __init__(self, length: float, geometry_type: GeometryType = GeometryType.CUSTOM):
         self.length = length
         self.geometry_type = geometry_type
@@ -35,11 +50,25 @@ class Geometry:
     def description(self) -> str:
         """Get geometry description."""
         raise NotImplementedError("Subclasses must implement description")
+    
+    def area_at(self, positions) -> np.ndarray:
+        """Cross-sectional area in m² at positions (m) along the length."""
+        return np.full(np.shape(positions), self.cross_sectional_area())
+    
+    def shape_factor(self) -> float:
+        """Conductance shape factor 1 / ∫[0 to L] dx/A(x) in m (A/L for constant sections)."""
+        return self.cross_sectional_area() / self.length
+    
+    def resistance(self, positions) -> np.ndarray:
+        """Geometric resistance ∫[0 to x] dξ/A(ξ) in 1/m at positions (m)."""
+        return np.asarray(positions, dtype=float) / self.cross_sectional_area()
 
 
 class RodGeometry(Geometry):
     """Rod or wire geometry (circular cross-section)."""
     
+    __slots__ = ('diameter',)
+    
     def __init__(self, diameter: float, length: float):
         geometry_type = GeometryType.ROD if diameter >= 0.001 else GeometryType.WIRE
         super().__init__(length, geometry_type)
@@ -58,6 +87,8 @@ class RodGeometry(Geometry):
 class TubeGeometry(Geometry):
     """Tube geometry (hollow circular cross-section)."""
     
+    __slots__ = ('outer_diameter', 'wall_thickness')
+    
     def __init__(self, outer_diameter: float, wall_thickness: float, length: float):
         super().__init__(length, GeometryType.TUBE)
         if wall_thickness >= outer_diameter / 2:
@@ -79,6 +110,8 @@ class TubeGeometry(Geometry):
 class BarGeometry(Geometry):
     """Rectangular bar geometry."""
     
+    __slots__ = ('width', 'thickness')
+    
     def __init__(self, width: float, thickness: float, length: float):
         super().__init__(length, GeometryType.BAR)
         self.width = width
@@ -96,6 +129,8 @@ class BarGeometry(Geometry):
 class CustomGeometry(Geometry):
     """Custom geometry with specified cross-sectional area."""
     
+    __slots__ = ('area', 'description_text')
+    
     def __init__(self, area: float, length: float, description_text: str = "custom geometry"):
         super().__init__(length, GeometryType.CUSTOM)
         self.area = area
@@ -110,6 +145,315 @@ class CustomGeometry(Geometry):
         return f"{self.description_text}: A={self.area*1e6:.2f}mm² × {self.length*1000:.1f}mm"
 
 
+class VariableGeometry(Geometry):
+    """
+    Base class for geometries whose cross-section varies along the length.
+    
+    Subclasses provide ``area_at`` and ``resistance``. The shape factor
+    1 / ∫[0 to L] dx/A(x) is computed on first use and cached, so thermal
+    power still costs one conductivity integral. ``cross_sectional_area``
+    returns the equivalent uniform area, shape_factor * L.
+    
+    Position 0 is the end held at ``temp_hot`` in temperature profiles.
+    """
+    
+    __slots__ = ('_shape_factor',)
+    
+    def __init__(self, length: float, geometry_type: GeometryType):
+        if length <= 0:
+            raise ValueError("length must be positive")
+        super().__init__(length, geometry_type)
+        self._shape_factor = None
+    
+    def resistance(self, positions) -> np.ndarray:
+        """Geometric resistance ∫[0 to x] dξ/A(ξ) in 1/m at positions (m)."""
+        raise NotImplementedError("Subclasses must implement resistance")
+    
+    def shape_factor(self) -> float:
+        """Conductance shape factor 1 / ∫[0 to L] dx/A(x) in m (cached)."""
+        if self._shape_factor is None:
+            self._shape_factor = 1.0 / float(self.resistance(self.length))
+        return self._shape_factor
+    
+    def cross_sectional_area(self) -> float:
+        """Equivalent uniform cross-sectional area in m²."""
+        return self.shape_factor() * self.length
+
+
+class FrustumGeometry(VariableGeometry):
+    """Solid conical frustum (tapered rod) with linearly varying diameter."""
+    
+    __slots__ = ('diameter_start', 'diameter_end')
+    
+    def __init__(self, diameter_start: float, diameter_end: float, length: float):
+        super().__init__(length, GeometryType.FRUSTUM)
+        if diameter_start <= 0 or diameter_end <= 0:
+            raise ValueError("Frustum diameters must be positive")
+        self.diameter_start = diameter_start
+        self.diameter_end = diameter_end
+    
+    def _radius(self, positions) -> np.ndarray:
+        fraction = np.asarray(positions, dtype=float) / self.length
+        return (self.diameter_start + (self.diameter_end - self.diameter_start) * fraction) / 2
+    
+    def area_at(self, positions) -> np.ndarray:
+        """Cross-sectional area in m² at positions (m) along the length."""
+        return math.pi * self._radius(positions) ** 2
+    
+    def resistance(self, positions) -> np.ndarray:
+        """Closed form for a linear radius: x / (π r(0) r(x))."""
+        positions = np.asarray(positions, dtype=float)
+        return positions / (math.pi * (self.diameter_start / 2) * self._radius(positions))
+    
+    def description(self) -> str:
+        """Get geometry description."""
+        return (f"frustum: Ø{self.diameter_start*1000:.1f}mm → Ø{self.diameter_end*1000:.1f}mm "
+                f"× {self.length*1000:.1f}mm")
+
+
+class SteppedGeometry(VariableGeometry):
+    """Constant-section geometries joined end to end (e.g. a stepped shaft)."""
+    
+    __slots__ = ('sections', '_boundaries', '_cumulative')
+    
+    def __init__(self, sections: Sequence[Geometry]):
+        if not sections:
+            raise ValueError("A stepped geometry needs at least one section")
+        if any(isinstance(section, VariableGeometry) for section in sections):
+            raise ValueError("Stepped geometry sections must have constant cross-sections")
+        lengths = np.array([section.length for section in sections], dtype=float)
+        super().__init__(float(lengths.sum()), GeometryType.STEPPED)
+        self.sections = tuple(sections)
+        self._boundaries = np.concatenate(([0.0], np.cumsum(lengths)))
+        section_resistance = [section.length / section.cross_sectional_area()
+                              for section in self.sections]
+        self._cumulative = np.concatenate(([0.0], np.cumsum(section_resistance)))
+    
+    def area_at(self, positions) -> np.ndarray:
+        """Cross-sectional area in m² at positions (m) along the length."""
+        areas = np.array([section.cross_sectional_area() for section in self.sections])
+        index = np.searchsorted(self._boundaries, positions, side='right') - 1
+        return areas[np.clip(index, 0, len(areas) - 1)]
+    
+    def resistance(self, positions) -> np.ndarray:
+        """Piecewise linear in x: exact for constant-section steps."""
+        return np.interp(positions, self._boundaries, self._cumulative)
+    
+    def description(self) -> str:
+        """Get geometry description."""
+        return f"stepped: {len(self.sections)} sections × {self.length*1000:.1f}mm"
+
+
+class ProfileGeometry(VariableGeometry):
+    """
+    Geometry with a user-supplied area profile A(x).
+    
+    The profile is a vectorized callable of position in m, or a table of
+    (positions, areas) interpolated linearly. ∫dx/A is integrated once at
+    construction (Gauss-Legendre on each grid interval) and interpolated with
+    a cubic Hermite spline whose slopes are 1/A at the nodes.
+    """
+    
+    __slots__ = ('area_function', 'description_text', '_grid', '_cumulative', '_slopes')
+    
+    def __init__(self, area: Union[Callable[[np.ndarray], np.ndarray], Tuple[Sequence[float], Sequence[float]]],
+                 length: Optional[float] = None, description_text: str = "profile",
+                 num_points: int = 257):
+        """
+        Args:
+            area: Callable A(x) in m², or (positions, areas) table in m and m²
+            length: Length in m; taken from the table when omitted
+            description_text: Label used in descriptions
+            num_points: Integration grid points along the length
+        """
+        breakpoints = np.empty(0)
+        if callable(area):
+            if length is None:
+                raise ValueError("length is required for a callable area profile")
+            self.area_function = area
+        else:
+            table_positions, table_areas = (np.asarray(a, dtype=float) for a in area)
+            if (table_positions.ndim != 1 or table_positions.shape != table_areas.shape
+                    or len(table_positions) < 2 or np.any(np.diff(table_positions) <= 0)
+                    or table_positions[0] != 0):
+                raise ValueError("Area table needs increasing positions starting at 0 and "
+                                 "one area per position")
+            length = float(table_positions[-1]) if length is None else length
+            self.area_function = lambda x: np.interp(x, table_positions, table_areas)
+            breakpoints = table_positions
+        super().__init__(length, GeometryType.PROFILE)
+        self.description_text = description_text
+        
+        grid = np.union1d(np.linspace(0.0, length, num_points), breakpoints[breakpoints < length])
+        nodes, weights = np.polynomial.legendre.leggauss(5)
+        half_width = np.diff(grid)[:, None] / 2
+        samples = self.area_at((grid[:-1, None] + half_width) + half_width * nodes)
+        node_areas = self.area_at(grid)
+        if np.any(samples <= 0) or np.any(node_areas <= 0):
+            raise ValueError("Cross-sectional area must be positive along the length")
+        self._grid = grid
+        self._cumulative = np.concatenate(
+            ([0.0], np.cumsum((weights / samples).sum(axis=1) * half_width[:, 0]))
+        )
+        self._slopes = 1.0 / node_areas
+    
+    def area_at(self, positions) -> np.ndarray:
+        """Cross-sectional area in m² at positions (m) along the length."""
+        return np.asarray(self.area_function(np.asarray(positions, dtype=float)), dtype=float)
+    
+    def resistance(self, positions) -> np.ndarray:
+        """Geometric resistance ∫[0 to x] dξ/A(ξ) in 1/m at positions (m)."""
+        return _hermite_eval(self._grid, self._cumulative, self._slopes,
+                             np.asarray(positions, dtype=float))
+    
+    def description(self) -> str:
+        """Get geometry description."""
+        return (f"{self.description_text}: A_eff={self.cross_sectional_area()*1e6:.2f}mm² "
+                f"× {self.length*1000:.1f}mm")
+
+
+class GeometryArray:
+    """
+    Base class for array-backed collections of geometries of one kind.
+    
+    Dimensions are stored as NumPy arrays (broadcast against each other), so
+    areas and shape factors for thousands of parts are computed in one pass
+    without building per-part objects.
+    """
+    
+    #: Scalar Geometry class produced by indexing
+    geometry_class = Geometry
+    
+    def __init__(self, lengths):
+        self.lengths = np.asarray(lengths, dtype=float)
+    
+    def _broadcast(self, *dimensions) -> Tuple[np.ndarray, ...]:
+        """Broadcast dimension arrays together with ``lengths`` and store lengths."""
+        arrays = np.broadcast_arrays(*(np.asarray(d, dtype=float) for d in dimensions),
+                                     self.lengths)
+        arrays = tuple(np.ascontiguousarray(a).ravel() for a in arrays)
+        self.lengths = arrays[-1]
+        return arrays[:-1]
+    
+    def __len__(self) -> int:
+        return len(self.lengths)
+    
+    def __getitem__(self, index: int) -> Geometry:
+        """Build the scalar geometry at ``index``."""
+        raise NotImplementedError("Subclasses must implement __getitem__")
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def cross_sectional_areas(self) -> np.ndarray:
+        """Calculate cross-sectional areas in m²."""
+        raise NotImplementedError("Subclasses must implement cross_sectional_areas")
+    
+    def shape_factors(self) -> np.ndarray:
+        """Calculate A/L in m for every geometry."""
+        return self.cross_sectional_areas() / self.lengths
+    
+    def descriptions(self) -> List[str]:
+        """Get the description of every geometry."""
+        return [geometry.description() for geometry in self]
+
+
+class RodArray(GeometryArray):
+    """Array of rod or wire geometries (circular cross-section)."""
+    
+    geometry_class = RodGeometry
+    
+    def __init__(self, diameters, lengths):
+        super().__init__(lengths)
+        (self.diameters,) = self._broadcast(diameters)
+    
+    def __getitem__(self, index: int) -> RodGeometry:
+        return RodGeometry(float(self.diameters[index]), float(self.lengths[index]))
+    
+    def cross_sectional_areas(self) -> np.ndarray:
+        """Calculate cross-sectional areas for circular rods/wires."""
+        return np.pi * (self.diameters / 2) ** 2
+
+
+class TubeArray(GeometryArray):
+    """Array of tube geometries (hollow circular cross-section)."""
+    
+    geometry_class = TubeGeometry
+    
+    def __init__(self, outer_diameters, wall_thicknesses, lengths):
+        super().__init__(lengths)
+        self.outer_diameters, self.wall_thicknesses = self._broadcast(outer_diameters,
+                                                                      wall_thicknesses)
+        if np.any(self.wall_thicknesses >= self.outer_diameters / 2):
+            raise ValueError("Wall thickness cannot be >= outer radius")
+    
+    def __getitem__(self, index: int) -> TubeGeometry:
+        return TubeGeometry(float(self.outer_diameters[index]),
+                            float(self.wall_thicknesses[index]), float(self.lengths[index]))
+    
+    def cross_sectional_areas(self) -> np.ndarray:
+        """Calculate cross-sectional areas for tube walls."""
+        outer_radius = self.outer_diameters / 2
+        inner_radius = outer_radius - self.wall_thicknesses
+        return np.pi * (outer_radius**2 - inner_radius**2)
+
+
+class BarArray(GeometryArray):
+    """Array of rectangular bar geometries."""
+    
+    geometry_class = BarGeometry
+    
+    def __init__(self, widths, thicknesses, lengths):
+        super().__init__(lengths)
+        self.widths, self.thicknesses = self._broadcast(widths, thicknesses)
+    
+    def __getitem__(self, index: int) -> BarGeometry:
+        return BarGeometry(float(self.widths[index]), float(self.thicknesses[index]),
+                           float(self.lengths[index]))
+    
+    def cross_sectional_areas(self) -> np.ndarray:
+        """Calculate cross-sectional areas for rectangular bars."""
+        return self.widths * self.thicknesses
+
+
+class CustomArray(GeometryArray):
+    """Array of custom geometries with specified cross-sectional areas."""
+    
+    geometry_class = CustomGeometry
+    
+    def __init__(self, areas, lengths, description_text: str = "custom geometry"):
+        super().__init__(lengths)
+        (self.areas,) = self._broadcast(areas)
+        self.description_text = description_text
+    
+    def __getitem__(self, index: int) -> CustomGeometry:
+        return CustomGeometry(float(self.areas[index]), float(self.lengths[index]),
+                              self.description_text)
+    
+    def cross_sectional_areas(self) -> np.ndarray:
+        """Return the specified cross-sectional areas."""
+        return self.areas.copy()
+
+
+def shape_factors(geometries: Union[Geometry, GeometryArray, Sequence[Geometry]]) -> np.ndarray:
+    """
+    Get shape factors (A/L in m for constant sections) for a geometry, a
+    geometry array or a sequence of geometries.
+    
+    Args:
+        geometries: Geometry, GeometryArray or sequence of Geometry objects
+        
+    Returns:
+        1-D array of shape factors
+    """
+    if isinstance(geometries, GeometryArray):
+        return geometries.shape_factors()
+    if isinstance(geometries, Geometry):
+        geometries = [geometries]
+    return np.array([geometry.shape_factor() for geometry in geometries], dtype=float)
+
+
 class ThermalCalculator:
     """
     Calculator for thermal conductivity integration and thermal resistance analysis.
@@ -127,31 +471,115 @@ class ThermalCalculator:
             material_calculator: MaterialCalculator instance. If None, creates new one.
         """
         self.calculator = material_calculator or MaterialCalculator()
+        self._integral_tables: Dict[Tuple[str, str], CumulativeIntegralTable] = {}
+        self._tables_revision = self.calculator.database.revision
+        self.instrumentation = None
     
-    def calculate_thermal_conductivity_integral(self, material_id: str, 
-                                              temp_low: float, temp_high: float,
-                                              num_points: int = 100) -> float:
+    def enable_instrumentation(self, stats=None):
         """
-        Calculate integral of thermal conductivity over temperature range.
+        Start counting property evaluations and timing calculations.
+        
+        Also instruments the underlying MaterialCalculator. On top of its
+        counters, conductivity table cache hits and the integration, power,
+        sweep and profile methods are recorded. See
+        ``MaterialCalculator.enable_instrumentation``.
+        
+        Args:
+            stats: ``cryocalc.instrumentation.CalculationStats`` to add to.
+                If None, a new one is created.
+                
+        Returns:
+            The CalculationStats being filled (also ``self.instrumentation``)
+        """
+        from .instrumentation import CalculationStats, enable_thermal_instrumentation
+        stats = stats if stats is not None else CalculationStats()
+        enable_thermal_instrumentation(self, stats)
+        return stats
+    
+    def disable_instrumentation(self) -> None:
+        """Stop instrumentation here and on the underlying MaterialCalculator."""
+        if self.instrumentation is not None:
+            from .instrumentation import disable_thermal_instrumentation
+            disable_thermal_instrumentation(self)
+    
+    def get_conductivity_integral_table(self, material_id: str,
+                                        property_name: str = 'thermal_conductivity'
+                                        ) -> CumulativeIntegralTable:
+        """
+        Get the cumulative ∫k dT table for a material, building it on first use.
+        
+        Tables are cached on the calculator per (material, property) and
+        rebuilt after the material database changes.
+        
+        Args:
+            material_id: Material identifier
+            property_name: Conductivity property to integrate, e.g.
+                'thermal_conductivity_normal' for directional materials
+            
+        Returns:
+            CumulativeIntegralTable over the property's temperature range
+        """
+        if self._tables_revision != self.calculator.database.revision:
+            self._integral_tables.clear()
+            self._tables_revision = self.calculator.database.revision
+        
+        table = self._integral_tables.get((material_id, property_name))
+        if table is None:
+            evaluator = self.calculator.get_evaluator(material_id, property_name)
+            table = CumulativeIntegralTable(evaluator)
+            self._integral_tables[material_id, property_name] = table
+            # Fetching the evaluator may have lazily loaded the default data
+            self._tables_revision = self.calculator.database.revision
+        return table
+    
+    def _thermal_conductivity(self, material_id: str, temperatures,
+                              nan_out_of_range: bool = False) -> np.ndarray:
+        """Evaluate k(T) for an array of temperatures in a single batch call."""
+        return self.calculator.calculate_property_many(
+            material_id, 'thermal_conductivity', temperatures,
+            nan_out_of_range=nan_out_of_range
+        )
+    
+    def integrate_thermal_conductivity(self, material_id: str,
+                                       temp_low: float, temp_high: float,
+                                       method: Optional[str] = None,
+                                       num_points: int = 100, order: int = 16,
+                                       tolerance: float = 1e-8) -> IntegrationResult:
+        """
+        Integrate thermal conductivity over a temperature range and report how.
         
         ∫[T1 to T2] k(T) dT
         
+        Integration methods:
+        - 'analytic': exact integral from the coefficients (polynomial fits only)
+        - 'table': difference of two lookups in the cached cumulative table
+        - 'trapezoid': trapezoidal rule on ``num_points`` linear samples
+        - 'simpson': Simpson's rule on ``num_points`` log-spaced samples
+        - 'gauss': fixed-order Gauss-Legendre in log T with ``order`` nodes
+        - 'adaptive': adaptive Gauss-Kronrod to relative ``tolerance``
+        
+        By default polynomial fits are integrated analytically and all other
+        fits use the cumulative table.
+        
         Args:
             material_id: Material identifier
             temp_low: Lower temperature bound (K)
             temp_high: Upper temperature bound (K)
-            num_points: Number of integration points
+            method: Integration method, or None to choose automatically
+            num_points: Number of samples for 'trapezoid' and 'simpson'
+            order: Number of nodes for 'gauss'
+            tolerance: Relative tolerance for 'adaptive'
             
         Returns:
-            Integral value in W·K/m·K
+            IntegrationResult with the integral in W·K/m·K and the number of
+            k(T) evaluations used (0 for 'analytic' and 'table' lookups)
         """
         if temp_low >= temp_high:
             raise ValueError("temp_low must be less than temp_high")
         
         # Validate temperature range
-        min_temp, max_temp = self.calculator.database.get_temperature_range(
-            material_id, 'thermal_conductivity'
-        )
+        evaluator = self.calculator.get_evaluator(material_id, 'thermal_conductivity')
+        min_temp, max_temp = evaluator.temperature_range
         
         if temp_low < min_temp or temp_high > max_temp:
             raise ValueError(
@@ -159,72 +587,274 @@ class ThermalCalculator:
                 f"[{min_temp}, {max_temp}]K for {material_id}"
             )
         
-        # Create temperature array
-        temperatures = np.linspace(temp_low, temp_high, num_points)
+        if method is None:
+            method = 'analytic' if evaluator.has_antiderivative else 'table'
+        
+        if method == 'analytic':
+            if not evaluator.has_antiderivative:
+                raise ValueError(
+                    f"No closed-form integral for {material_id} "
+                    f"({evaluator.equation_type.value} fit)"
+                )
+            return IntegrationResult(float(evaluator.integrate(temp_low, temp_high)), method, 0)
+        elif method == 'table':
+            table = self.get_conductivity_integral_table(material_id)
+            return IntegrationResult(table.integral(temp_low, temp_high), method, 0,
+                                     table.accuracy['max_abs_error'])
+        elif method == 'trapezoid':
+            return integrate_trapezoid(evaluator.evaluate_array, temp_low, temp_high, num_points)
+        elif method == 'simpson':
+            return integrate_simpson(evaluator.evaluate_array, temp_low, temp_high, num_points)
+        elif method == 'gauss':
+            return integrate_gauss_legendre(evaluator.evaluate_array, temp_low, temp_high, order)
+        elif method == 'adaptive':
+            return integrate_gauss_kronrod(evaluator.evaluate_array, temp_low, temp_high, tolerance)
+        else:
+            raise ValueError(f"Unknown integration method: {method}")
+    
+    def calculate_thermal_conductivity_integral(self, material_id: str, 
+                                              temp_low: float, temp_high: float,
+                                              num_points: int = 100,
+                                              method: Optional[str] = None,
+                                              order: int = 16,
+                                              tolerance: float = 1e-8) -> float:
+        """
+        Calculate integral of thermal conductivity over temperature range.
+        
+        ∫[T1 to T2] k(T) dT
+        
+        See ``integrate_thermal_conductivity`` for the available methods. By
+        default polynomial fits are integrated analytically and all other fits
+        use the cached cumulative table.
+        
+        Args:
+            material_id: Material identifier
+            temp_low: Lower temperature bound (K)
+            temp_high: Upper temperature bound (K)
+            num_points: Number of samples for 'trapezoid' and 'simpson'
+            method: Integration method, or None to choose automatically
+            order: Number of nodes for 'gauss'
+            tolerance: Relative tolerance for 'adaptive'
+            
+        Returns:
+            Integral value in W·K/m·K
+        """
+        return self.integrate_thermal_conductivity(
+            material_id, temp_low, temp_high, method=method,
+            num_points=num_points, order=order, tolerance=tolerance
+        ).value
+    
+    def calculate_conductivity_integrals(self, material_id: str, temp_low, temp_high,
+                                         method: Optional[str] = None) -> np.ndarray:
+        """
+        Integrate thermal conductivity over many temperature ranges at once.
+        
+        Analytic and table integrals are evaluated in one vectorized pass; other
+        methods fall back to ``integrate_thermal_conductivity`` per range.
+        Ranges outside the material's valid range, or with
+        temp_low >= temp_high, give NaN instead of raising.
+        
+        Args:
+            material_id: Material identifier
+            temp_low: Lower temperature bound(s) (K)
+            temp_high: Upper temperature bound(s) (K), broadcast against temp_low
+            method: Integration method (see ``integrate_thermal_conductivity``)
+            
+        Returns:
+            Array of integrals in W·K/m·K with the broadcast shape of the bounds
+        """
+        temp_low, temp_high = np.broadcast_arrays(np.asarray(temp_low, dtype=float),
+                                                  np.asarray(temp_high, dtype=float))
+        evaluator = self.calculator.get_evaluator(material_id, 'thermal_conductivity')
+        min_temp, max_temp = evaluator.temperature_range
+        valid = (temp_low >= min_temp) & (temp_high <= max_temp) & (temp_low < temp_high)
+        
+        integrals = np.full(temp_low.shape, np.nan)
+        if not valid.any():
+            return integrals
+        
+        lows, highs = temp_low[valid], temp_high[valid]
+        if method is None:
+            method = 'analytic' if evaluator.has_antiderivative else 'table'
+        if method == 'analytic' and evaluator.has_antiderivative:
+            integrals[valid] = evaluator.integrate(lows, highs)
+        elif method == 'table':
+            integrals[valid] = self.get_conductivity_integral_table(material_id).integral(lows, highs)
+        else:
+            integrals[valid] = [
+                self.integrate_thermal_conductivity(material_id, low, high, method=method).value
+                for low, high in zip(lows.tolist(), highs.tolist())
+            ]
+        return integrals
+    
+    def sweep_thermal_power(self, geometries: Union[GeometryArray, Sequence[Geometry]],
+                            temperature_pairs: Sequence[Tuple[float, float]],
+                            materials: Optional[Sequence[str]] = None,
+                            method: Optional[str] = None,
+                            processes: Optional[int] = None,
+                            chunk_size: int = 4096,
+                            structured: bool = False) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Evaluate thermal power over a material × temperature pair × geometry grid.
+        
+        Since Q = (A/L) * ∫k dT, each integral is computed once per
+        (material, temperature pair) and broadcast over all geometries.
+        With ``processes`` > 1 the integrals are split into chunks of
+        ``chunk_size`` pairs per material and computed in a process pool; the
+        workers receive the already parsed material data instead of re-reading
+        the database file.
+        
+        Pairs outside a material's valid range, or with T_hot <= T_cold, give
+        NaN rather than aborting the sweep.
+        
+        Args:
+            geometries: Geometries to evaluate, as a sequence or a GeometryArray
+            temperature_pairs: Sequence of (temp_hot, temp_cold) pairs in Kelvin
+            materials: Material IDs. If None, every material with a
+                'thermal_conductivity' property.
+            method: Integration method (see ``integrate_thermal_conductivity``)
+            processes: Number of worker processes; None, 0 or 1 runs in-process
+            chunk_size: Temperature pairs per worker task
+            structured: If True, return a NumPy structured array instead of a
+                dictionary of arrays
+            
+        Returns:
+            Flat arrays (or structured array fields) 'material', 'temp_hot',
+            'temp_cold', 'geometry' (index into ``geometries``), 'shape_factor'
+            (A/L in m), 'conductivity_integral' and 'power' (W), ordered by
+            material, then temperature pair, then geometry, so each field
+            reshapes to (materials, pairs, geometries).
+        """
+        pairs = np.asarray(temperature_pairs, dtype=float).reshape(-1, 2)
+        temp_hot, temp_cold = pairs[:, 0].copy(), pairs[:, 1].copy()
+        if materials is None:
+            database = self.calculator.database
+            materials = [material_id for material_id in database.get_available_materials()
+                         if 'thermal_conductivity' in database.get_material_info(material_id)['properties']]
+        materials = list(materials)
+        factors = shape_factors(geometries)
         
-        # Calculate thermal conductivity at each temperature
-        conductivities = []
-        for temp in temperatures:
-            k = self.calculator.calculate_thermal_conductivity(material_id, temp)
-            conductivities.append(k)
+        if processes is None or processes <= 1:
+            integrals = np.array([
+                self.calculate_conductivity_integrals(material_id, temp_cold, temp_hot, method)
+                for material_id in materials
+            ]).reshape(len(materials), len(pairs))
+        else:
+            integrals = self._parallel_integrals(materials, temp_cold, temp_hot, method,
+                                                 processes, chunk_size)
         
-        # Integrate using trapezoidal rule
-        integral = np.trapezoid(conductivities, temperatures)
+        num_materials, num_pairs, num_geometries = len(materials), len(pairs), len(factors)
+        power = integrals[:, :, np.newaxis] * factors[np.newaxis, np.newaxis, :]
+        results = {
+            'material': np.repeat(np.array(materials, dtype=str), num_pairs * num_geometries),
+            'temp_hot': np.tile(np.repeat(temp_hot, num_geometries), num_materials),
+            'temp_cold': np.tile(np.repeat(temp_cold, num_geometries), num_materials),
+            'geometry': np.tile(np.arange(num_geometries), num_materials * num_pairs),
+            'shape_factor': np.tile(factors, num_materials * num_pairs),
+            'conductivity_integral': np.repeat(integrals.ravel(), num_geometries),
+            'power': power.ravel(),
+        }
+        if not structured:
+            return results
+        
+        array = np.empty(len(results['power']),
+                         dtype=[(name, values.dtype) for name, values in results.items()])
+        for name, values in results.items():
+            array[name] = values
+        return array
+    
+    def _parallel_integrals(self, materials: List[str], temp_low: np.ndarray,
+                            temp_high: np.ndarray, method: Optional[str],
+                            processes: int, chunk_size: int) -> np.ndarray:
+        """Compute the (material, pair) integral grid in a process pool."""
+        from concurrent.futures import ProcessPoolExecutor
         
-        return integral
+        integrals = np.empty((len(materials), len(temp_low)))
+        chunk_size = max(1, int(chunk_size))
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_sweep_worker,
+                                 initargs=(self.calculator.database.materials_data,)) as pool:
+            tasks = [
+                (row, start, pool.submit(_sweep_worker_integrals, material_id,
+                                         temp_low[start:start + chunk_size],
+                                         temp_high[start:start + chunk_size], method))
+                for row, material_id in enumerate(materials)
+                for start in range(0, len(temp_low), chunk_size)
+            ]
+            for row, start, future in tasks:
+                integrals[row, start:start + chunk_size] = future.result()
+        return integrals
     
-    def calculate_thermal_power(self, material_id: str, geometry: Geometry,
+    def calculate_thermal_power(self, material_id: str,
+                               geometry: Union[Geometry, GeometryArray],
                                temp_hot: float, temp_cold: float,
-                               num_points: int = 100) -> float:
+                               num_points: int = 100,
+                               method: Optional[str] = None) -> Union[float, np.ndarray]:
         """
         Calculate thermal power transfer between two temperatures.
         
         From conservation of energy and Fourier's law:
         Q = (A/L) * ∫[T_cold to T_hot] k(T) dT
         
+        For variable cross-sections A/L is replaced by the geometry's cached
+        shape factor 1 / ∫dx/A(x).
+        
         Args:
             material_id: Material identifier
-            geometry: Geometry specification (must have constant cross-section)
+            geometry: Geometry specification, or a GeometryArray to evaluate
+                many parts with one integral
             temp_hot: Hot side temperature (K)
             temp_cold: Cold side temperature (K)
             num_points: Number of integration points
+            method: Integration method (see ``integrate_thermal_conductivity``)
             
         Returns:
-            Thermal power in Watts
+            Thermal power in Watts (an array for a GeometryArray)
         """
         if temp_hot <= temp_cold:
             raise ValueError("temp_hot must be greater than temp_cold")
         
         # Calculate thermal conductivity integral from cold to hot
         k_integral = self.calculate_thermal_conductivity_integral(
-            material_id, temp_cold, temp_hot, num_points
+            material_id, temp_cold, temp_hot, num_points, method=method
         )
         
-        # Calculate power: Q = (A/L) * ∫k(T)dT
-        area = geometry.cross_sectional_area()
-        power = (area / geometry.length) * k_integral
+        if isinstance(geometry, GeometryArray):
+            return geometry.shape_factors() * k_integral
         
-        return power
+        # Calculate power: Q = (A/L) * ∫k(T)dT
+        return geometry.shape_factor() * k_integral
     
     def calculate_temperature_profile(self, material_id: str, geometry: Geometry,
                                     temp_hot: float = None, temp_cold: float = None,
                                     thermal_power: float = None,
-                                    num_points: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+                                    num_points: int = 50,
+                                    method: str = 'inversion') -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate temperature profile along the length of the geometry.
         
         From Fourier's law: Q/A(x) dx = -k(T) dT
         Integrating: ∫[0 to x] Q/A(ξ) dξ = -∫[T_hot to T(x)] k(T) dT
         
-        For constant cross-section A: Q*x/A = ∫[T(x) to T_hot] k(T) dT
+        For constant cross-section A: Q*x/A = ∫[T(x) to T_hot] k(T) dT, and in
+        general Q * ∫[0 to x] dξ/A(ξ) = ∫[T(x) to T_hot] k(T) dT with the
+        geometry's ``resistance``.
+        
+        Profile methods:
+        - 'inversion': solve F(T(x)) = F(T_hot) - Q*x/A for all positions at
+          once by inverting the cached cumulative ∫k dT table
+        - 'ode': integrate dT/dx = -Q/(A*k(T)) with RK45 (legacy)
+        
+        With the inversion method, profiles that would drop below the lower
+        bound of the material's valid range are clipped to that bound.
         
         Args:
             material_id: Material identifier
-            geometry: Geometry specification (must have constant cross-section)
+            geometry: Geometry specification; position 0 is the hot end
             temp_hot: Hot end temperature (K) - required if thermal_power given
             temp_cold: Cold end temperature (K) - optional if thermal_power given
             thermal_power: Heat rate (W) - optional if both temperatures given
             num_points: Number of points along length
+            method: Profile method, 'inversion' or 'ode'
             
         Returns:
             Tuple of (positions, temperatures) arrays
@@ -239,20 +869,28 @@ class ThermalCalculator:
         if temp_cold is not None and thermal_power is not None:
             raise ValueError("Cannot specify both temp_cold and thermal_power - provide only one")
         
+        if method not in ('inversion', 'ode'):
+            raise ValueError(f"Unknown profile method: {method}")
+        
         # If both temperatures given, calculate thermal power
         if temp_cold is not None:
             if temp_hot <= temp_cold:
                 raise ValueError("temp_hot must be greater than temp_cold")
             thermal_power = self.calculate_thermal_power(material_id, geometry, temp_hot, temp_cold)
         
+        if method == 'inversion':
+            positions = np.linspace(0, geometry.length, num_points)
+            resistance = geometry.resistance(positions)  # ∫[0 to x] dξ/A(ξ)
+            temperatures = self._invert_profile(material_id, temp_hot, thermal_power, resistance)
+            if temp_cold is not None:
+                temperatures[-1] = temp_cold  # Cold end boundary condition
+            return positions, temperatures
+        
         # Create position array (0 to length)
         positions = np.linspace(0, geometry.length, num_points)
         temperatures = np.zeros(num_points)
         temperatures[0] = temp_hot  # Hot end boundary condition
         
-        # Geometry properties
-        area = geometry.cross_sectional_area()
-        
         # Solve the PDE: Q = -A*k(T)*dT/dx using scipy.integrate.solve_ivp
         # Rearrange to: dT/dx = -Q/(A*k(T))
         
@@ -260,13 +898,11 @@ class ThermalCalculator:
         
         def temperature_ode(x, T):
             """ODE for temperature profile: dT/dx = -Q/(A*k(T))"""
-            try:
-                k = self.calculator.calculate_thermal_conductivity(material_id, T[0])
-                if k <= 0:
-                    return [-1e-6]  # Small negative gradient if k invalid
-                return [-thermal_power / (area * k)]
-            except (ValueError, ZeroDivisionError):
-                return [-1e-6]  # Small negative gradient if calculation fails
+            k = self._thermal_conductivity(material_id, T, nan_out_of_range=True)
+            area = geometry.area_at(x)
+            # Small negative gradient where k is invalid or out of range
+            valid = np.isfinite(k) & (k > 0)
+            return np.where(valid, -thermal_power / (area * np.where(valid, k, 1.0)), -1e-6)
         
         # Set up boundary conditions and solve
         x_span = (0, geometry.length)
@@ -275,7 +911,7 @@ class ThermalCalculator:
         # Solve the ODE
         try:
             sol = solve_ivp(temperature_ode, x_span, T_initial, 
-                          t_eval=positions, method='RK45', rtol=1e-6)
+                          t_eval=positions, method='RK45', rtol=1e-6, vectorized=True)
             
             if sol.success:
                 temperatures = sol.y[0]
@@ -310,9 +946,32 @@ class ThermalCalculator:
         
         return positions, temperatures
     
+    def _invert_profile(self, material_id: str, temp_hot: float, thermal_power: float,
+                        resistance: np.ndarray) -> np.ndarray:
+        """
+        Temperatures along a conductor by inverting the cumulative ∫k dT table.
+        
+        Args:
+            material_id: Material identifier
+            temp_hot: Hot end temperature (K)
+            thermal_power: Heat rate (W)
+            resistance: Geometric resistance ∫[0 to x] dξ/A(ξ) at each position (1/m)
+            
+        Returns:
+            Temperature array, with the hot end set exactly to temp_hot
+        """
+        table = self.get_conductivity_integral_table(material_id)
+        PropertyCalculator.validate_temperature_range(temp_hot, *table.temperature_range)
+        
+        targets = table(temp_hot) - thermal_power * np.asarray(resistance, dtype=float)
+        temperatures = table.inverse(targets)
+        temperatures[0] = temp_hot  # Hot end boundary condition
+        return temperatures
+    
     def get_calculation_summary(self, material_id: str, geometry: Geometry,
                                temp_hot: float, temp_cold: float,
-                               num_points: int = 100) -> Dict[str, Any]:
+                               num_points: int = 100,
+                               method: Optional[str] = None) -> Dict[str, Any]:
         """
         Get comprehensive thermal calculation summary.
         
@@ -322,6 +981,7 @@ class ThermalCalculator:
             temp_hot: Hot side temperature (K)
             temp_cold: Cold side temperature (K)
             num_points: Number of integration points
+            method: Integration method (see ``integrate_thermal_conductivity``)
             
         Returns:
             Dictionary with calculation results and parameters
@@ -330,16 +990,14 @@ class ThermalCalculator:
         material_info = self.calculator.database._materials_data[material_id]
         
         # Calculate thermal properties
-        k_integral = self.calculate_thermal_conductivity_integral(
-            material_id, temp_cold, temp_hot, num_points
-        )
-        thermal_power = self.calculate_thermal_power(
-            material_id, geometry, temp_hot, temp_cold, num_points
+        integration = self.integrate_thermal_conductivity(
+            material_id, temp_cold, temp_hot, method=method, num_points=num_points
         )
+        k_integral = integration.value
+        thermal_power = geometry.shape_factor() * k_integral
         
         # Calculate thermal conductivities at endpoints
-        k_hot = self.calculator.calculate_thermal_conductivity(material_id, temp_hot)
-        k_cold = self.calculator.calculate_thermal_conductivity(material_id, temp_cold)
+        k_hot, k_cold = self._thermal_conductivity(material_id, [temp_hot, temp_cold]).tolist()
         
         summary = {
             'material': {
@@ -365,7 +1023,9 @@ class ThermalCalculator:
             'results': {
                 'thermal_conductivity_integral_W_K_per_m_K': k_integral,
                 'average_thermal_conductivity_W_per_m_K': k_integral / (temp_hot - temp_cold),
-                'thermal_power_W': thermal_power
+                'thermal_power_W': thermal_power,
+                'integration_method': integration.method,
+                'property_evaluations': integration.evaluations
             }
         }
         
@@ -405,3 +1065,67 @@ def create_custom(area_mm2: float, length_mm: float, description: str = "custom"
         length=length_mm/1000,
         description_text=description
     )
+
+
+def create_frustum(diameter_start_mm: float, diameter_end_mm: float,
+                   length_mm: float) -> FrustumGeometry:
+    """Create tapered rod geometry with dimensions in mm."""
+    return FrustumGeometry(
+        diameter_start=diameter_start_mm/1000,
+        diameter_end=diameter_end_mm/1000,
+        length=length_mm/1000
+    )
+
+def create_stepped(diameters_mm: Sequence[float], lengths_mm: Sequence[float]) -> SteppedGeometry:
+    """Create stepped shaft geometry from rod diameters and lengths in mm."""
+    if len(diameters_mm) != len(lengths_mm):
+        raise ValueError("Need one length per diameter")
+    return SteppedGeometry([create_rod(d, l) for d, l in zip(diameters_mm, lengths_mm)])
+
+def create_profile(positions_mm: Sequence[float], areas_mm2: Sequence[float],
+                   description: str = "profile") -> ProfileGeometry:
+    """Create geometry from a table of areas in mm² at positions in mm."""
+    return ProfileGeometry(
+        (np.asarray(positions_mm, dtype=float) / 1000, np.asarray(areas_mm2, dtype=float) / 1e6),
+        description_text=description
+    )
+
+def create_rod_array(diameters_mm, lengths_mm) -> RodArray:
+    """Create an array of rod/wire geometries with dimensions in mm."""
+    return RodArray(np.asarray(diameters_mm, dtype=float) / 1000,
+                    np.asarray(lengths_mm, dtype=float) / 1000)
+
+def create_tube_array(outer_diameters_mm, wall_thicknesses_mm, lengths_mm) -> TubeArray:
+    """Create an array of tube geometries with dimensions in mm."""
+    return TubeArray(np.asarray(outer_diameters_mm, dtype=float) / 1000,
+                     np.asarray(wall_thicknesses_mm, dtype=float) / 1000,
+                     np.asarray(lengths_mm, dtype=float) / 1000)
+
+def create_bar_array(widths_mm, thicknesses_mm, lengths_mm) -> BarArray:
+    """Create an array of bar geometries with dimensions in mm."""
+    return BarArray(np.asarray(widths_mm, dtype=float) / 1000,
+                    np.asarray(thicknesses_mm, dtype=float) / 1000,
+                    np.asarray(lengths_mm, dtype=float) / 1000)
+
+def create_custom_array(areas_mm2, lengths_mm, description: str = "custom") -> CustomArray:
+    """Create an array of custom geometries with areas in mm² and lengths in mm."""
+    return CustomArray(np.asarray(areas_mm2, dtype=float) / 1e6,
+                       np.asarray(lengths_mm, dtype=float) / 1000, description)
+
+
+# Calculator used by sweep worker processes, built from the parent's parsed data
+_sweep_calculator: Optional[ThermalCalculator] = None
+
+
+def _init_sweep_worker(materials_data: Dict[str, Any]) -> None:
+    """Process pool initializer: build a calculator over the shipped material data."""
+    global _sweep_calculator
+    database = MaterialDatabase.from_data(materials_data)
+    _sweep_calculator = ThermalCalculator(MaterialCalculator(database))
+
+
+def _sweep_worker_integrals(material_id: str, temp_low: np.ndarray, temp_high: np.ndarray,
+                            method: Optional[str]) -> np.ndarray:
+    """Process pool task: conductivity integrals for one material and chunk of pairs."""
+    return _sweep_calculator.calculate_conductivity_integrals(material_id, temp_low,
+                                                              temp_high, method)
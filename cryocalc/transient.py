@@ -0,0 +1,267 @@
+"""
+Transient 1D heat conduction along a geometry (cooldown simulations).
+
+The part is split into equal-length finite volumes along its length. Each
+time step is backward Euler with the material properties taken from the
+previous step (optionally refined by fixed-point iterations), so every step
+is one tridiagonal solve:
+
+    C_i (T_i' - T_i) / dt = G_{i-1/2} (T_{i-1}' - T_i') + G_{i+1/2} (T_{i+1}' - T_i')
+
+C_i = ρ c_p(T_i) V_i is the heat capacity of a cell. The face conductance
+G = k̄ / ΔR uses the geometric resistance ΔR = ∫dx/A between cell centers and
+the mean conductivity k̄ = (F(T_i) - F(T_j)) / (T_i - T_j) from the cached
+cumulative ∫k dT table, so the steady state of the scheme is the exact
+steady-state profile. c_p comes from the calculator's compiled evaluator
+(a Chebyshev surrogate when the calculator uses that backend).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from .thermal import Geometry, ThermalCalculator
+
+
+# Boundary temperature: fixed value, function of time (s), or None for no contact
+BoundaryTemperature = Union[None, float, Callable[[float], float]]
+
+
+@dataclass
+class TransientResult:
+    """
+    Recorded state of a transient simulation.
+
+    Attributes:
+        times: Recording times (s), starting at 0
+        positions: Cell center positions (m)
+        temperatures: Cell temperatures (K), shape (len(times), len(positions))
+        heat_flow_start: Heat leaving through the start face (W) at each recording
+        heat_flow_end: Heat leaving through the end face (W) at each recording
+        step_times: Time at the end of every step (s)
+        max_temperatures: Hottest cell temperature after every step (K)
+    """
+    times: np.ndarray
+    positions: np.ndarray
+    temperatures: np.ndarray
+    heat_flow_start: np.ndarray
+    heat_flow_end: np.ndarray
+    step_times: np.ndarray
+    max_temperatures: np.ndarray
+
+    def time_to_reach(self, temperature: float) -> Optional[float]:
+        """
+        First time at which every cell is at or below a temperature.
+
+        Args:
+            temperature: Target temperature (K)
+
+        Returns:
+            Time in seconds, linearly interpolated between steps (0.0 if the
+            part starts that cold), or None if the part never gets that cold
+            during the simulation
+        """
+        # Prepend the initial state at t = 0 to the per-step history
+        times = np.concatenate(([self.times[0]], self.step_times))
+        max_temperatures = np.concatenate(([self.temperatures[0].max()],
+                                           self.max_temperatures))
+        below = np.flatnonzero(max_temperatures <= temperature)
+        if len(below) == 0:
+            return None
+        step = int(below[0])
+        if step == 0:
+            return float(times[0])
+        t0, t1 = times[step - 1], times[step]
+        hot, cold = max_temperatures[step - 1], max_temperatures[step]
+        return float(t0 + (t1 - t0) * (hot - temperature) / (hot - cold))
+
+
+class TransientSolver:
+    """
+    Finite-volume transient conduction solver for one material and geometry.
+
+    Both ends can be held at a (possibly time-dependent) temperature through
+    half a cell of the part's own material, or left without contact; heat
+    inputs can be applied at either end. Position 0 is the start end.
+    """
+
+    def __init__(self, material_id: str, geometry: Geometry, num_cells: int = 100,
+                 density: Optional[float] = None,
+                 thermal_calculator: Optional[ThermalCalculator] = None):
+        """
+        Set up the mesh and the material property tables.
+
+        Args:
+            material_id: Material with 'thermal_conductivity' and 'specific_heat'
+            geometry: Geometry to simulate (constant or variable cross-section)
+            num_cells: Number of finite volumes along the length
+            density: Density in kg/m³. If None, the material's database density.
+            thermal_calculator: ThermalCalculator whose tables and evaluators
+                are used. If None, creates a default one.
+
+        Raises:
+            ValueError: If the material lacks data or ``num_cells`` < 1
+        """
+        if num_cells < 1:
+            raise ValueError("num_cells must be at least 1")
+        self.thermal = thermal_calculator or ThermalCalculator()
+        self.material_id = material_id
+        self.geometry = geometry
+        self.num_cells = int(num_cells)
+        self.density = (float(density) if density is not None
+                        else self.thermal.calculator.database.get_density(material_id))
+        if self.density <= 0:
+            raise ValueError("density must be positive")
+
+        self.conductivity_table = self.thermal.get_conductivity_integral_table(material_id)
+        self.specific_heat = self.thermal.calculator.get_evaluator(material_id, 'specific_heat')
+        k_range = self.conductivity_table.temperature_range
+        c_range = self.specific_heat.temperature_range
+        self.min_temp = max(k_range[0], c_range[0])
+        self.max_temp = min(k_range[1], c_range[1])
+
+        faces = np.linspace(0.0, geometry.length, self.num_cells + 1)
+        self.positions = (faces[:-1] + faces[1:]) / 2
+        self.volumes = geometry.area_at(self.positions) * np.diff(faces)
+        # ∫dx/A from the start face, through every cell center, to the end face
+        resistance = geometry.resistance(np.concatenate(([0.0], self.positions,
+                                                         [geometry.length])))
+        self._face_resistance = np.diff(resistance)
+
+    def _conductances(self, temperatures: np.ndarray, boundary: np.ndarray) -> np.ndarray:
+        """Conductances (W/K) of every face, from the start face to the end face."""
+        nodes = np.clip(np.concatenate(([boundary[0]], temperatures, [boundary[1]])),
+                        self.min_temp, self.max_temp)
+        delta_t = np.diff(nodes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_k = np.diff(self.conductivity_table(nodes)) / delta_t
+        # Nearly equal neighbours: the secant is ill-conditioned, use k at the midpoint
+        close = np.abs(delta_t) <= 1e-9 * nodes[1:]
+        if close.any():
+            midpoints = (nodes[:-1][close] + nodes[1:][close]) / 2
+            mean_k[close] = self.conductivity_table.evaluator.evaluate_array(midpoints)
+        return mean_k / self._face_resistance
+
+    def run(self, initial_temperature, duration: float, time_step: float,
+            temp_start: BoundaryTemperature = None, temp_end: BoundaryTemperature = None,
+            heat_start: float = 0.0, heat_end: float = 0.0,
+            num_records: int = 101, iterations: int = 1) -> TransientResult:
+        """
+        Integrate the temperature field in time.
+
+        Args:
+            initial_temperature: Initial temperature (K), scalar or one per cell
+            duration: Simulated time (s)
+            time_step: Time step (s); the last step is shortened to end at
+                ``duration``
+            temp_start: Temperature held at the start face (K), a function of
+                time, or None for no thermal contact
+            temp_end: Same for the end face
+            heat_start: Heat input at the start cell (W)
+            heat_end: Heat input at the end cell (W)
+            num_records: Number of evenly spaced snapshots to keep (at least 2)
+            iterations: Property updates per step; 1 uses the previous step's
+                properties, more iterate them to the new temperatures
+
+        Returns:
+            TransientResult
+
+        Raises:
+            ValueError: On invalid times or temperatures outside the range
+                where both k and c_p are valid
+        """
+        from scipy.linalg import solve_banded
+
+        if duration <= 0 or time_step <= 0:
+            raise ValueError("duration and time_step must be positive")
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+        num_records = max(2, int(num_records))
+
+        temperatures = np.array(np.broadcast_to(np.asarray(initial_temperature, dtype=float),
+                                                (self.num_cells,)))
+        self._check_range(temperatures, "Initial temperature")
+
+        def boundary_value(condition: BoundaryTemperature, time: float) -> float:
+            if condition is None:
+                return np.nan
+            value = float(condition(time)) if callable(condition) else float(condition)
+            self._check_range(np.array([value]), "Boundary temperature")
+            return value
+
+        num_steps = int(np.ceil(duration / time_step - 1e-9))
+        step_times = np.minimum(np.arange(1, num_steps + 1) * time_step, duration)
+        record_steps = np.unique(np.round(np.linspace(0, num_steps, num_records)).astype(int))
+
+        records = [temperatures.copy()]
+        flows_start, flows_end = [], []
+        max_temperatures = np.empty(num_steps)
+        heat_inputs = np.zeros(self.num_cells)
+        heat_inputs[0] += heat_start
+        heat_inputs[-1] += heat_end
+        banded = np.zeros((3, self.num_cells))
+
+        def end_flows(temps: np.ndarray, boundary: np.ndarray):
+            conductances = self._conductances(temps, np.nan_to_num(boundary, nan=1.0))
+            start = 0.0 if np.isnan(boundary[0]) else conductances[0] * (temps[0] - boundary[0])
+            end = 0.0 if np.isnan(boundary[1]) else conductances[-1] * (temps[-1] - boundary[1])
+            return start, end
+
+        boundary = np.array([boundary_value(temp_start, 0.0), boundary_value(temp_end, 0.0)])
+        start, end = end_flows(temperatures, boundary)
+        flows_start.append(start)
+        flows_end.append(end)
+
+        time = 0.0
+        for step in range(num_steps):
+            dt = step_times[step] - time
+            time = step_times[step]
+            boundary = np.array([boundary_value(temp_start, time), boundary_value(temp_end, time)])
+            contact = ~np.isnan(boundary)
+            estimate = temperatures
+            for _ in range(iterations):
+                properties_at = np.clip(estimate, self.min_temp, self.max_temp)
+                capacity = self.density * self.specific_heat.evaluate_array(properties_at) * self.volumes / dt
+                conductances = self._conductances(estimate, np.where(contact, boundary, estimate[[0, -1]]))
+                left = conductances[:-1].copy()
+                right = conductances[1:].copy()
+                if not contact[0]:
+                    left[0] = 0.0
+                if not contact[1]:
+                    right[-1] = 0.0
+
+                banded[0, 1:] = -right[:-1]
+                banded[1] = capacity + left + right
+                banded[2, :-1] = -left[1:]
+                rhs = capacity * temperatures + heat_inputs
+                if contact[0]:
+                    rhs[0] += left[0] * boundary[0]
+                if contact[1]:
+                    rhs[-1] += right[-1] * boundary[1]
+                estimate = solve_banded((1, 1), banded, rhs, check_finite=False)
+            temperatures = estimate
+            max_temperatures[step] = temperatures.max()
+
+            if step + 1 in record_steps:
+                records.append(temperatures.copy())
+                start, end = end_flows(temperatures, boundary)
+                flows_start.append(start)
+                flows_end.append(end)
+
+        return TransientResult(
+            times=np.concatenate(([0.0], step_times[record_steps[1:] - 1])),
+            positions=self.positions.copy(),
+            temperatures=np.array(records),
+            heat_flow_start=np.array(flows_start),
+            heat_flow_end=np.array(flows_end),
+            step_times=step_times,
+            max_temperatures=max_temperatures,
+        )
+
+    def _check_range(self, temperatures: np.ndarray, label: str) -> None:
+        if np.any(temperatures < self.min_temp) or np.any(temperatures > self.max_temp):
+            raise ValueError(
+                f"{label} outside valid range [{self.min_temp}K, {self.max_temp}K] "
+                f"for {self.material_id}"
+            )
@@ -0,0 +1,155 @@
+"""
+Tests for the asyncio thermal calculator facade.
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from cryocalc.aio import AsyncThermalCalculator
+from cryocalc.thermal import ThermalCalculator, create_rod
+
+
+class BlockingThermalCalculator(ThermalCalculator):
+    """ThermalCalculator whose power calculation waits for an event."""
+    
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.calls = 0
+    
+    def calculate_thermal_power(self, *args, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return super().calculate_thermal_power(*args, **kwargs)
+
+
+class TestAsyncThermalCalculator:
+    """Test cases for AsyncThermalCalculator."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.rod = create_rod(5.0, 100.0)
+        self.thermal = ThermalCalculator()
+    
+    def test_matches_sync_results(self):
+        """Test that async methods return the ThermalCalculator results."""
+        async def main():
+            async with AsyncThermalCalculator() as calc:
+                power = await calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0)
+                integral = await calc.calculate_thermal_conductivity_integral("aluminum_6061_t6", 4.0, 300.0)
+                positions, temps = await calc.calculate_temperature_profile(
+                    "aluminum_6061_t6", self.rod, temp_hot=300.0, temp_cold=4.0
+                )
+                return power, integral, temps
+        
+        power, integral, temps = asyncio.run(main())
+        
+        assert power == self.thermal.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0)
+        assert integral == self.thermal.calculate_thermal_conductivity_integral("aluminum_6061_t6", 4.0, 300.0)
+        expected = self.thermal.calculate_temperature_profile(
+            "aluminum_6061_t6", self.rod, temp_hot=300.0, temp_cold=4.0
+        )[1]
+        assert np.allclose(temps, expected)
+    
+    def test_identical_requests_are_coalesced(self):
+        """Test that concurrent identical requests share one computation."""
+        blocking = BlockingThermalCalculator()
+        
+        async def main():
+            async with AsyncThermalCalculator(blocking) as calc:
+                tasks = [
+                    asyncio.create_task(calc.calculate_thermal_power(
+                        "aluminum_6061_t6", create_rod(5.0, 100.0), 300.0, 4.0))
+                    for _ in range(5)
+                ]
+                await asyncio.sleep(0.05)
+                assert calc.in_flight == 1
+                blocking.release.set()
+                results = await asyncio.gather(*tasks)
+                assert calc.in_flight == 0
+                return results
+        
+        results = asyncio.run(main())
+        
+        assert blocking.calls == 1
+        assert len(set(results)) == 1
+    
+    def test_different_requests_are_not_coalesced(self):
+        """Test that requests with different arguments run separately."""
+        async def main():
+            async with AsyncThermalCalculator() as calc:
+                return await asyncio.gather(
+                    calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0),
+                    calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 77.0),
+                )
+        
+        first, second = asyncio.run(main())
+        assert first > second
+    
+    def test_cancellation(self):
+        """Test that cancelling one caller leaves the shared request running."""
+        blocking = BlockingThermalCalculator()
+        
+        async def main():
+            async with AsyncThermalCalculator(blocking) as calc:
+                args = ("aluminum_6061_t6", self.rod, 300.0, 4.0)
+                first = asyncio.create_task(calc.calculate_thermal_power(*args))
+                second = asyncio.create_task(calc.calculate_thermal_power(*args))
+                await asyncio.sleep(0.05)
+                first.cancel()
+                await asyncio.sleep(0)
+                blocking.release.set()
+                with pytest.raises(asyncio.CancelledError):
+                    await first
+                return await second
+        
+        assert asyncio.run(main()) > 0
+    
+    def test_cancel_all(self):
+        """Test cancelling every in-flight request."""
+        blocking = BlockingThermalCalculator()
+        
+        async def main():
+            async with AsyncThermalCalculator(blocking) as calc:
+                task = asyncio.create_task(
+                    calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0)
+                )
+                await asyncio.sleep(0.05)
+                assert calc.cancel_all() == 1
+                blocking.release.set()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+        
+        asyncio.run(main())
+    
+    def test_errors_propagate(self):
+        """Test that calculation errors reach the caller."""
+        async def main():
+            async with AsyncThermalCalculator() as calc:
+                await calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 4.0, 300.0)
+        
+        with pytest.raises(ValueError, match="temp_hot must be greater"):
+            asyncio.run(main())
+    
+    def test_unknown_method_and_executor(self):
+        """Test validation of method names and executor choices."""
+        with pytest.raises(ValueError, match="Unknown executor"):
+            AsyncThermalCalculator(executor="fibre")
+        
+        async def main():
+            async with AsyncThermalCalculator() as calc:
+                await calc.run("_invert_profile")
+        
+        with pytest.raises(ValueError, match="Unknown ThermalCalculator method"):
+            asyncio.run(main())
+    
+    def test_process_pool(self):
+        """Test offloading to a process pool."""
+        async def main():
+            async with AsyncThermalCalculator(executor="process", max_workers=1) as calc:
+                return await calc.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0)
+        
+        expected = self.thermal.calculate_thermal_power("aluminum_6061_t6", self.rod, 300.0, 4.0)
+        assert asyncio.run(main()) == pytest.approx(expected)
@@ -0,0 +1,165 @@
+"""
+Tests for streaming batch evaluation.
+"""
+
+import io
+import json
+
+import pytest
+from cryocalc.batch import detect_format, evaluate_rows, read_rows, write_results
+from cryocalc.calculator import MaterialCalculator
+
+
+CSV_INPUT = """material,property,temperature,variant
+aluminum_1100,thermal_conductivity,77,
+teflon,specific_heat,10,
+aluminum_1100,thermal_conductivity,1000,
+unobtainium,thermal_conductivity,10,
+fiberglass_epoxy_g10,thermal_conductivity,50,normal
+aluminum_1100,thermal_conductivity,4,
+"""
+
+
+class TestBatchEvaluation:
+    """Test cases for evaluate_rows."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+    
+    def test_results_in_input_order(self):
+        """Test that grouped evaluation preserves input order and values."""
+        rows = list(read_rows(io.StringIO(CSV_INPUT), 'csv'))
+        
+        results = list(evaluate_rows(rows, self.calculator, chunk_size=4))
+        
+        assert [r['temperature'] for r in results] == [77.0, 10.0, 1000.0, 10.0, 50.0, 4.0]
+        assert results[0]['value'] == self.calculator.calculate_thermal_conductivity("aluminum_1100", 77.0)
+        assert results[1]['value'] == self.calculator.calculate_specific_heat("teflon", 10.0)
+        assert results[4]['property'] == "thermal_conductivity_normal"
+        assert results[5]['value'] == self.calculator.calculate_thermal_conductivity("aluminum_1100", 4.0)
+        assert results[0]['units'] == "W/m-K"
+    
+    def test_errors_reported_per_row(self):
+        """Test that bad rows are reported without stopping the batch."""
+        rows = list(read_rows(io.StringIO(CSV_INPUT), 'csv'))
+        rows.append({"material": "teflon", "property": "specific_heat", "temperature": "warm"})
+        
+        results = list(evaluate_rows(rows, self.calculator))
+        
+        assert "outside valid range" in results[2]['error']
+        assert results[2]['value'] is None
+        assert "not found" in results[3]['error']
+        assert results[6]['error'] is not None
+        assert all(r['error'] is None for r in (results[0], results[1], results[4], results[5]))
+    
+    def test_malformed_lines_and_failing_groups(self):
+        """Test that undecodable rows and failing temperatures only affect their own rows."""
+        from cryocalc.materials import MaterialDatabase
+        database = MaterialDatabase.from_data({
+            "foam": {"name": "Foam", "properties": {"thermal_conductivity": {
+                "equation_type": "logarithmic_polynomial", "coefficients": [-1.0, 0.5],
+                "temperature_range": [0, 300], "units": "W/m-K"}}}
+        })
+        calculator = MaterialCalculator(database)
+        stream = io.StringIO(
+            '{"material": "foam", "property": "thermal_conductivity", "temperature": 100}\n'
+            '{bad\n'
+            '[1, 2]\n'
+            '{"material": "foam", "property": "thermal_conductivity", "temperature": 0}\n'
+            '{"material": "foam", "property": "thermal_conductivity", "temperature": 10}\n'
+        )
+        
+        results = list(evaluate_rows(read_rows(stream, 'jsonl'), calculator))
+        
+        assert len(results) == 5
+        assert results[0]['value'] == pytest.approx(1.0)
+        assert "Line 2: invalid JSON" in results[1]['error']
+        assert "must be an object" in results[2]['error']
+        assert "positive" in results[3]['error']
+        assert results[4]['error'] is None and results[4]['value'] == pytest.approx(10 ** -0.5)
+    
+    def test_non_string_fields(self):
+        """Test that non-string material, property or variant values are row errors."""
+        stream = io.StringIO(
+            '{"material": ["x"], "property": "thermal_conductivity", "temperature": 77}\n'
+            '{"material": "aluminum_1100", "property": {"k": 1}, "temperature": 77}\n'
+            '{"material": "aluminum_1100", "property": "thermal_conductivity", '
+            '"variant": [1], "temperature": 77}\n'
+            '{"material": "aluminum_1100", "property": "thermal_conductivity", "temperature": 77}\n'
+        )
+        
+        results = list(evaluate_rows(read_rows(stream, 'jsonl'), self.calculator))
+        
+        assert [r['error'] for r in results[:2]] == ["Row 'material' and 'property' must be strings"] * 2
+        assert results[2]['error'] == "Row 'variant' must be a string"
+        assert results[3]['value'] == self.calculator.calculate_thermal_conductivity("aluminum_1100", 77.0)
+    
+    def test_nan_not_reported_as_out_of_range(self):
+        """Test that a NaN inside the valid range gets its own error message."""
+        from cryocalc.materials import MaterialDatabase
+        database = MaterialDatabase.from_data({"odd": {"name": "Odd", "properties": {
+            "thermal_conductivity": {"equation_type": "polynomial", "coefficients": [float('nan')],
+                                     "temperature_range": [4, 300], "units": "W/m-K"}}}})
+        
+        result, = evaluate_rows([{"material": "odd", "property": "thermal_conductivity",
+                                  "temperature": 10}], MaterialCalculator(database))
+        
+        assert "NaN" in result['error'] and "outside" not in result['error']
+    
+    def test_streams_lazily(self):
+        """Test that rows are consumed one chunk at a time."""
+        consumed = []
+        
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield {"material": "teflon", "property": "specific_heat", "temperature": 10 + i}
+        
+        results = evaluate_rows(rows(), self.calculator, chunk_size=3)
+        next(results)
+        
+        assert len(consumed) == 3
+        assert len(list(results)) == 9
+
+
+class TestBatchFormats:
+    """Test cases for reading and writing batch files."""
+    
+    def test_detect_format(self):
+        """Test format detection from file names."""
+        assert detect_format("queries.jsonl") == 'jsonl'
+        assert detect_format("queries.CSV") == 'csv'
+        assert detect_format("-") == 'csv'
+        assert detect_format(None, 'jsonl') == 'jsonl'
+    
+    def test_jsonl_round_trip(self):
+        """Test JSONL input and output."""
+        lines = "\n".join(json.dumps(row) for row in [
+            {"material": "teflon", "property": "specific_heat", "temperature": 10},
+            {"material": "teflon", "property": "specific_heat", "temperature": 20},
+        ])
+        output = io.StringIO()
+        
+        count = write_results(evaluate_rows(read_rows(io.StringIO(lines + "\n\n"), 'jsonl')),
+                              output, 'jsonl')
+        
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 2
+        assert [r['temperature'] for r in results] == [10.0, 20.0]
+        assert all(r['error'] is None for r in results)
+    
+    def test_csv_output(self):
+        """Test CSV output with a header row."""
+        output = io.StringIO()
+        
+        write_results(evaluate_rows(read_rows(io.StringIO(CSV_INPUT), 'csv')), output, 'csv')
+        
+        lines = output.getvalue().splitlines()
+        assert lines[0] == "material,property,temperature,value,units,error"
+        assert len(lines) == 7
+    
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown format"):
+            list(read_rows(io.StringIO(""), 'xml'))
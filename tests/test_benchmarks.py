@@ -0,0 +1,47 @@
+"""
+Smoke tests for the benchmark runner in benchmarks/.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+RUNNER = PACKAGE_ROOT / "benchmarks" / "run_benchmarks.py"
+
+
+def run_runner(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(RUNNER), *args], cwd=PACKAGE_ROOT,
+                          capture_output=True, text=True)
+
+
+class TestBenchmarkRunner:
+    """Test result output and regression comparison."""
+    
+    def test_results_and_comparison(self, tmp_path):
+        """Test JSON output, a clean comparison and a flagged regression."""
+        results_file = tmp_path / "results.json"
+        run = run_runner("--quick", "-k", "teflon", "-o", str(results_file))
+        assert run.returncode == 0, run.stderr
+        
+        results = json.loads(results_file.read_text())
+        names = set(results["results"])
+        assert "calculate_property/logarithmic_polynomial/teflon/thermal_conductivity" in names
+        for prefix in ("calculate_temperature_series/", "thermal_conductivity_integral/",
+                       "thermal_power/", "temperature_profile/"):
+            assert any(name.startswith(prefix) for name in names)
+        assert all(timing["min_s"] > 0 for timing in results["results"].values())
+        
+        same = run_runner("--current", str(results_file), "--compare", str(results_file))
+        assert same.returncode == 0
+        
+        faster = {"metadata": results["metadata"],
+                  "results": {name: dict(timing, min_s=timing["min_s"] / 100)
+                              for name, timing in results["results"].items()}}
+        baseline_file = tmp_path / "baseline.json"
+        baseline_file.write_text(json.dumps(faster))
+        slower = run_runner("--current", str(results_file), "--compare", str(baseline_file))
+        assert slower.returncode == 1
+        assert "REGRESSION" in slower.stdout
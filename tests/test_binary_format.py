@@ -0,0 +1,145 @@
+"""
+Tests for the binary material database format.
+"""
+
+import pickle
+
+import pytest
+
+from cryocalc.binary_format import (BinaryMaterials, is_binary_materials_file,
+                                    write_binary_materials)
+from cryocalc.calculator import MaterialCalculator
+from cryocalc.materials import MaterialDatabase
+from cryocalc.thermal import ThermalCalculator, create_rod
+
+
+class TestBinaryFormat:
+    """Test writing, mapping and loading binary databases."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.database = MaterialDatabase()
+        self.materials = self.database._materials_data
+
+    def test_round_trip(self, tmp_path):
+        """Test that every value, type and key order survives a round trip."""
+        path = tmp_path / "materials.cdb"
+        extra = {"flags": [True, False, None], "count": 3, "mixed": [1, 2.5, "x"],
+                 "empty": [], "nested": {"unicode": "µΩ·m", "range": [4, 300]}}
+        write_binary_materials({**self.materials, "extra": extra}, path)
+
+        binary = BinaryMaterials(path)
+        assert list(binary) == list(self.materials) + ["extra"]
+        assert all(binary[material_id] == data for material_id, data in self.materials.items())
+        assert binary["extra"] == extra
+        assert type(binary["extra"]["nested"]["range"][0]) is int
+
+    def test_numeric_lists_use_float_pool(self, tmp_path):
+        """Test that lists mixing ints and floats are pooled and keep their types."""
+        path = tmp_path / "materials.cdb"
+        ranges = {"range": [4, 300], "mixed": [0, 1.5, -2, 2.0 ** 60], "big": [2 ** 60, 1.0]}
+        write_binary_materials({"m": ranges}, path)
+
+        binary = BinaryMaterials(path)
+        assert binary["m"] == ranges
+        assert [type(item) for item in binary["m"]["mixed"]] == [int, float, int, float]
+        assert type(binary["m"]["big"][0]) is int
+        # Only the two exactly representable lists went to the float pool
+        assert binary._float_count == 6
+
+    def test_oversized_int_raises_value_error(self, tmp_path):
+        """Test that integers beyond 64 bits raise the documented ValueError."""
+        with pytest.raises(ValueError, match="64 bits"):
+            write_binary_materials({"m": {"count": 2 ** 70}}, tmp_path / "m.cdb")
+
+    def test_lazy_decoding(self, tmp_path):
+        """Test that materials are decoded on first lookup and then cached."""
+        path = tmp_path / "materials.cdb"
+        write_binary_materials(self.materials, path)
+        binary = BinaryMaterials(path)
+
+        assert "teflon" in binary and "unobtainium" not in binary
+        assert binary._cache == {}
+        assert binary["teflon"] is binary["teflon"]
+        assert list(binary._cache) == ["teflon"]
+        with pytest.raises(KeyError):
+            binary["unobtainium"]
+
+    def test_database_loads_either_format(self, tmp_path):
+        """Test that save_materials picks the format and loading detects it."""
+        binary_path = tmp_path / "materials.cdb"
+        json_path = tmp_path / "materials.json"
+        self.database.save_materials(str(binary_path))
+        self.database.save_materials(str(json_path))
+        assert is_binary_materials_file(binary_path)
+        assert not is_binary_materials_file(json_path)
+
+        binary_db = MaterialDatabase(str(binary_path))
+        assert isinstance(binary_db._materials_data, BinaryMaterials)
+        assert binary_db.get_available_materials() == self.database.get_available_materials()
+
+        calculator = MaterialCalculator(binary_db)
+        reference = MaterialCalculator()
+        for material_id in ("aluminum_6061_t6", "copper_ofhc_rrr100", "silicon"):
+            for property_name in binary_db.get_material_info(material_id)['properties']:
+                low, high = binary_db.get_temperature_range(material_id, property_name)
+                temperature = (low + high) / 2
+                assert calculator.calculate_property(material_id, property_name, temperature) == \
+                    reference.calculate_property(material_id, property_name, temperature)
+
+        # Binary to JSON and back through explicit formats
+        binary_db.save_materials(str(tmp_path / "copy.dat"), binary=False)
+        assert MaterialDatabase(str(tmp_path / "copy.dat"))._materials_data == self.materials
+
+    def test_add_material_copies(self, tmp_path):
+        """Test that adding a material leaves the mapped file untouched."""
+        path = tmp_path / "materials.cdb"
+        write_binary_materials(self.materials, path)
+        database = MaterialDatabase(str(path))
+        revision = database.revision
+
+        database.add_material("bare", {"name": "Bare", "properties": {}})
+        assert isinstance(database._materials_data, dict)
+        assert database.revision > revision
+        assert "bare" not in BinaryMaterials(path)
+
+    def test_pickle_reopens_file(self, tmp_path):
+        """Test that pickling sends the path, e.g. to process pool workers."""
+        path = tmp_path / "materials.cdb"
+        write_binary_materials(self.materials, path)
+        binary = BinaryMaterials(path)
+        binary["teflon"]
+
+        data = pickle.dumps(binary)
+        assert len(data) < 1000
+        restored = pickle.loads(data)
+        assert restored._cache == {} and restored["teflon"] == binary["teflon"]
+
+        thermal = ThermalCalculator(MaterialCalculator(MaterialDatabase(str(path))))
+        sweep = thermal.sweep_thermal_power([create_rod(5.0, 100.0)], [(300.0, 4.0), (77.0, 4.0)],
+                                            materials=["stainless_steel_304"], processes=2,
+                                            chunk_size=1)
+        serial = ThermalCalculator().sweep_thermal_power(
+            [create_rod(5.0, 100.0)], [(300.0, 4.0), (77.0, 4.0)],
+            materials=["stainless_steel_304"])
+        assert sweep['power'].tolist() == pytest.approx(serial['power'].tolist(), rel=1e-12)
+
+    def test_invalid_files(self, tmp_path):
+        """Test errors for empty, foreign and newer-version files."""
+        empty = tmp_path / "empty.cdb"
+        empty.write_bytes(b"")
+        with pytest.raises(ValueError):
+            BinaryMaterials(empty)
+
+        foreign = tmp_path / "foreign.cdb"
+        foreign.write_bytes(b"{" + b" " * 100)
+        with pytest.raises(ValueError):
+            BinaryMaterials(foreign)
+
+        path = tmp_path / "materials.cdb"
+        write_binary_materials(self.materials, path)
+        data = bytearray(path.read_bytes())
+        data[8] = 99
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="version"):
+            MaterialDatabase(str(path))
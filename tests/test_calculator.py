@@ -4,6 +4,7 @@ Tests for the MaterialCalculator class.
 
 import pytest
 import math
+import numpy as np
 from cryocalc.calculator import MaterialCalculator
 from cryocalc.materials import MaterialDatabase
 from cryocalc.properties import PropertyType
@@ -92,6 +93,44 @@ class TestMaterialCalculator:
         values = [v for v in result["values"] if v is not None]
         assert all(v > 0 for v in values)
     
+    def test_calculate_property_many_matches_scalar(self):
+        """Test batch evaluation against scalar calculate_property."""
+        temperatures = np.linspace(4.0, 300.0, 25)
+        for material_id, property_name in [
+            ("aluminum_6061_t6", "thermal_conductivity"),
+            ("aluminum_3003_f", "linear_expansion"),
+            ("copper_ofhc_rrr50", "thermal_conductivity"),
+        ]:
+            values = self.calculator.calculate_property_many(material_id, property_name, temperatures)
+            assert isinstance(values, np.ndarray)
+            assert values.shape == temperatures.shape
+            expected = [self.calculator.calculate_property(material_id, property_name, float(t))
+                        for t in temperatures]
+            np.testing.assert_allclose(values, expected, rtol=1e-6, atol=1e-6)
+    
+    def test_calculate_property_many_out_of_range(self):
+        """Test batch evaluation with out-of-range temperatures."""
+        temperatures = [1.0, 77.0, 500.0]
+        
+        with pytest.raises(ValueError, match="outside valid range"):
+            self.calculator.calculate_property_many("aluminum_6061_t6", "thermal_conductivity", temperatures)
+        
+        values = self.calculator.calculate_property_many(
+            "aluminum_6061_t6", "thermal_conductivity", temperatures, nan_out_of_range=True
+        )
+        assert np.isnan(values[0])
+        assert np.isnan(values[2])
+        assert values[1] == pytest.approx(
+            self.calculator.calculate_thermal_conductivity("aluminum_6061_t6", 77.0), rel=1e-6
+        )
+    
+    def test_calculate_property_many_precision(self):
+        """Test rounding in batch evaluation."""
+        values = self.calculator.calculate_property_many(
+            "aluminum_6061_t6", "thermal_conductivity", [77.0, 150.0], precision=2
+        )
+        np.testing.assert_array_equal(values, np.round(values, 2))
+    
     def test_get_material_summary(self):
         """Test material summary generation."""
         summary = self.calculator.get_material_summary("aluminum_6061_t6")
@@ -108,6 +147,22 @@ class TestMaterialCalculator:
             assert "units" in prop_info
             assert "equation_type" in prop_info
             assert len(prop_info["temperature_range"]) == 2
+        
+        assert summary["density"] == 2700.0
+    
+    def test_material_summary_without_density(self):
+        """Test that a material without a density reports None."""
+        database = MaterialDatabase.from_data({"bare": {"name": "Bare", "properties": {}}})
+        
+        assert MaterialCalculator(database).get_material_summary("bare")["density"] is None
+    
+    def test_material_summary_notes(self):
+        """Test that low-reliability fits carry their notes into the summary."""
+        kevlar = self.calculator.get_material_summary("kevlar_49_fiber")
+        aluminum = self.calculator.get_material_summary("aluminum_6061_t6")
+        
+        assert "Not accurate" in kevlar["properties"]["thermal_conductivity"]["notes"]
+        assert "notes" not in aluminum["properties"]["thermal_conductivity"]
     
     def test_list_materials_with_property(self):
         """Test listing materials by property type."""
@@ -166,3 +221,59 @@ class TestMaterialCalculator:
         assert tc_wrap > 0
         # Wrap direction should have higher conductivity than normal
         assert tc_wrap > tc_normal
+
+
+class TestEnthalpy:
+    """Test ∫c_p dT tables and cooldown energy budgets."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+    
+    def test_enthalpy_change_matches_quadrature(self):
+        """Test table lookups against direct integration of c_p."""
+        evaluator = self.calculator.get_evaluator("aluminum_6061_t6", "specific_heat")
+        grid = np.geomspace(4.0, 300.0, 20001)
+        expected = np.trapezoid(evaluator.evaluate_array(grid), grid)
+        
+        change = self.calculator.enthalpy_change("aluminum_6061_t6", 300.0, 4.0)
+        assert isinstance(change, float)
+        assert change == pytest.approx(-expected, rel=1e-6)
+    
+    def test_enthalpy_change_vectorized(self):
+        """Test arrays of temperature pairs and NaN for invalid pairs."""
+        changes = self.calculator.enthalpy_change("stainless_steel_304", [300.0, 77.0, 4.0], 4.0)
+        
+        assert changes.shape == (3,)
+        assert changes[0] < changes[1] < changes[2] == 0.0
+        assert changes[0] == pytest.approx(
+            self.calculator.enthalpy_change("stainless_steel_304", 300.0, 77.0) + changes[1])
+        
+        with pytest.raises(ValueError, match="outside valid range"):
+            self.calculator.enthalpy_change("stainless_steel_304", [300.0, 400.0], 4.0)
+        masked = self.calculator.enthalpy_change("stainless_steel_304", [300.0, 400.0], 4.0,
+                                                 nan_out_of_range=True)
+        assert not np.isnan(masked[0]) and np.isnan(masked[1])
+    
+    def test_enthalpy_table_cached(self):
+        """Test that the table is reused and dropped with the evaluator cache."""
+        table = self.calculator.get_enthalpy_table("teflon")
+        assert self.calculator.get_enthalpy_table("teflon") is table
+        
+        self.calculator.database.reload()
+        assert self.calculator.get_enthalpy_table("teflon") is not table
+    
+    def test_cooldown_energy(self):
+        """Test the total over a bill of materials."""
+        budget = self.calculator.cooldown_energy([("aluminum_6061_t6", 10.0),
+                                                  ("stainless_steel_304", 5.0)])
+        
+        aluminum = -10.0 * self.calculator.enthalpy_change("aluminum_6061_t6", 300.0, 4.0)
+        steel = -5.0 * self.calculator.enthalpy_change("stainless_steel_304", 300.0, 4.0)
+        assert budget['total_J'] == pytest.approx(aluminum + steel)
+        assert [item['material'] for item in budget['items']] == ["aluminum_6061_t6",
+                                                                  "stainless_steel_304"]
+        assert budget['items'][0]['energy_J'] > 0
+        
+        with pytest.raises(ValueError):
+            self.calculator.cooldown_energy({"aluminum_1100": 1.0})
@@ -0,0 +1,89 @@
+"""
+Tests for the propcalc.js to materials.json converter.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = PACKAGE_ROOT / "convert_propcalc.py"
+sys.path.insert(0, str(PACKAGE_ROOT))
+
+from convert_propcalc import ConversionError, classify_formula  # noqa: E402
+from cryocalc.calculator import MaterialCalculator  # noqa: E402
+from cryocalc.materials import MaterialDatabase  # noqa: E402
+
+
+class TestClassifyFormula:
+    """Test classification of expanded formulas."""
+
+    def test_logarithmic_polynomial(self):
+        """Test that zero coefficients are kept so lengths match the JavaScript."""
+        entry = classify_formula("a + b*log10(T) + c*pow(log10(T), 3)",
+                                 {'a': 1.0, 'b': 2.0, 'c': 3.0}, True)
+        assert entry == {'equation_type': 'logarithmic_polynomial',
+                         'coefficients': [1.0, 2.0, 0.0, 3.0]}
+
+    def test_polynomial(self):
+        """Test a plain polynomial in T."""
+        entry = classify_formula("a + b*T + c*T*T", {'a': 1.0, 'b': 2.0, 'c': 3.0}, False)
+        assert entry == {'equation_type': 'polynomial', 'coefficients': [1.0, 2.0, 3.0]}
+
+    def test_rational(self):
+        """Test a ratio of sums of half-integer powers of T."""
+        entry = classify_formula("(a + c*pow(T, 0.5)) / (1 + b*pow(T, 0.5) + d*T)",
+                                 {'a': 1.0, 'b': 2.0, 'c': 3.0, 'd': 4.0}, True)
+        assert entry['equation_type'] == 'rational'
+        assert entry['numerator_coefficients'] == [1.0, 3.0]
+        assert entry['denominator_coefficients'] == [1.0, 2.0, 4.0]
+
+    def test_erf_windows(self):
+        """Test that (1 +/- erf) / 2 factors become below/above windows."""
+        formula = ("(a + b*log10(T)) * (1 - erf(2*(log10(T) - c))) / 2"
+                   " + d*exp(-log10(T)/f) * (1 + erf(2*(log10(T) - c))) / 2")
+        entry = classify_formula(formula, {'a': 1.0, 'b': 2.0, 'c': 1.5, 'd': 3.0, 'f': 0.5},
+                                 True)
+        assert entry['equation_type'] == 'erf_composite'
+        assert entry['variable'] == 'log10' and entry['log_output'] is True
+        sides = {segment['windows'][0]['side']: segment for segment in entry['segments']}
+        assert sides['below']['windows'][0] == {'center': 1.5, 'slope': 2.0, 'side': 'below'}
+        assert sides['above']['terms'] == [{'coefficient': 3.0, 'decay': 0.5}]
+
+    def test_unsupported(self):
+        """Test that formulas outside the supported forms are rejected."""
+        with pytest.raises(ConversionError):
+            classify_formula("sin(T)", {}, False)
+        with pytest.raises(ConversionError):
+            classify_formula("T + log10(T)", {}, True)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+def test_convert_all_cases(tmp_path):
+    """Test that the converted database loads and matches existing entries."""
+    output = tmp_path / "materials.json"
+    run = subprocess.run([sys.executable, str(SCRIPT), "-o", str(output), "--no-merge"],
+                         cwd=PACKAGE_ROOT, capture_output=True, text=True)
+    assert run.returncode == 0, run.stdout + run.stderr
+
+    materials = json.loads(output.read_text())['materials']
+    converted = MaterialCalculator(MaterialDatabase(str(output)))
+    packaged = MaterialCalculator()
+    equation_types = set()
+    for material_id, material in materials.items():
+        for property_name, prop_data in material['properties'].items():
+            assert prop_data['source'].startswith("propcalc.js case ")
+            equation_types.add(prop_data['equation_type'])
+    assert equation_types == {'logarithmic_polynomial', 'polynomial', 'rational', 'erf_composite'}
+
+    # Fits absent from the packaged database are named from their headers
+    assert 'thermal_conductivity' in materials['lead']['properties']
+    for material_id, property_name in [("aluminum_6061_t6", 'thermal_conductivity'),
+                                       ("copper_ofhc_rrr100", 'thermal_conductivity'),
+                                       ("kevlar_49_fiber", 'thermal_conductivity')]:
+        assert converted.calculate_property(material_id, property_name, 50.0) == \
+            pytest.approx(packaged.calculate_property(material_id, property_name, 50.0), rel=1e-9)
@@ -0,0 +1,221 @@
+"""
+Tests for compiled property evaluators.
+"""
+
+import pytest
+import math
+import numpy as np
+from cryocalc.calculator import MaterialCalculator
+from cryocalc.evaluators import (
+    PropertyEvaluator,
+    LogPolynomialEvaluator,
+    PolynomialEvaluator,
+    RationalEvaluator,
+    ErfCompositeEvaluator,
+    PiecewiseEvaluator,
+    compile_evaluator
+)
+from cryocalc.properties import EquationType
+
+
+class TestCompileEvaluator:
+    """Test cases for compile_evaluator."""
+    
+    def test_dispatch_by_equation_type(self):
+        """Test that each equation type compiles to the matching evaluator class."""
+        log_poly = compile_evaluator("m", "p", {
+            "equation_type": "logarithmic_polynomial",
+            "coefficients": [1.0, 2.0],
+            "temperature_range": [4, 300]
+        })
+        poly = compile_evaluator("m", "p", {
+            "equation_type": "polynomial",
+            "coefficients": [1.0, 2.0],
+            "temperature_range": [0, 300]
+        })
+        rational = compile_evaluator("m", "p", {
+            "equation_type": "rational",
+            "coefficients": [1.0, 2.0, 1.0, 1.0],
+            "temperature_range": [4, 300]
+        })
+        
+        assert isinstance(log_poly, LogPolynomialEvaluator)
+        assert isinstance(poly, PolynomialEvaluator)
+        assert isinstance(rational, RationalEvaluator)
+        assert poly.equation_type == EquationType.POLYNOMIAL
+        assert rational.numerator_coeffs == (1.0, 2.0)
+        assert rational.denominator_coeffs == (1.0, 1.0)
+    
+    def test_coefficients_are_frozen(self):
+        """Test that coefficients are copied into tuples at compile time."""
+        coefficients = [1.0, 2.0]
+        evaluator = compile_evaluator("m", "p", {
+            "equation_type": "polynomial",
+            "coefficients": coefficients,
+            "temperature_range": [0, 300]
+        })
+        coefficients[0] = 100.0
+        assert evaluator.coefficients == (1.0, 2.0)
+        assert evaluator(10.0) == 21.0
+    
+    def test_unsupported_equation_type(self):
+        """Test compiling an unknown equation type."""
+        with pytest.raises(ValueError, match="Unsupported equation type"):
+            compile_evaluator("m", "p", {
+                "equation_type": "mystery",
+                "coefficients": [1.0],
+                "temperature_range": [4, 300]
+            })
+    
+    def test_range_validation(self):
+        """Test scalar and array range validation."""
+        evaluator = compile_evaluator("m", "p", {
+            "equation_type": "polynomial",
+            "coefficients": [1.0, 1.0],
+            "temperature_range": [4, 300]
+        })
+        assert evaluator.temperature_range == (4.0, 300.0)
+        
+        with pytest.raises(ValueError, match="outside valid range"):
+            evaluator(2.0)
+        with pytest.raises(ValueError, match="outside valid range"):
+            evaluator.evaluate_many([10.0, 400.0])
+        
+        values = evaluator.evaluate_many([10.0, 400.0], nan_out_of_range=True)
+        assert values[0] == 11.0
+        assert np.isnan(values[1])
+
+
+class TestErfCompositeEvaluator:
+    """Test cases for erf composite fits from the database."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+    
+    def test_kevlar_matches_published_fit(self):
+        """Test Kevlar-49 fiber conductivity against the closed-form expression."""
+        evaluator = self.calculator.get_evaluator("kevlar_49_fiber", "thermal_conductivity")
+        assert isinstance(evaluator, ErfCompositeEvaluator)
+        
+        from cryocalc.properties import erf
+        x = math.log10(77.0)
+        low = (-2.4219 + 1.986637 * x) * (1 - erf(2 * (x - 1.257441))) / 2
+        high = (0.961209 - 9.6106 * math.exp(-x / 0.777857)) * (1 + erf(2 * (x - 1.257441))) / 2
+        assert evaluator(77.0) == pytest.approx(10 ** (low + high), rel=1e-12)
+    
+    def test_silicon_expansion_coefficient(self):
+        """Test the silicon expansion coefficient, which changes sign."""
+        values = self.calculator.calculate_property_many(
+            "silicon", "expansion_coefficient", [4.0, 77.0, 300.0]
+        )
+        
+        # Reference values from the published fit, in 10^-8/K
+        assert values[0] == pytest.approx(0.003072, rel=1e-6)
+        assert values[1] == pytest.approx(-47.5733520291, rel=1e-9)
+        assert values[2] == pytest.approx(261.4416296296, rel=1e-9)
+    
+    def test_invalid_window_side(self):
+        """Test that unknown window sides are rejected at compile time."""
+        with pytest.raises(ValueError, match="Unsupported erf window side"):
+            compile_evaluator("m", "p", {
+                "equation_type": "erf_composite",
+                "segments": [{"terms": [{"coefficient": 1.0}],
+                              "windows": [{"center": 1.0, "side": "left"}]}],
+                "temperature_range": [4, 300]
+            })
+
+
+class TestPiecewiseEvaluator:
+    """Test cases for piecewise fits."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.evaluator = compile_evaluator("m", "p", {
+            "equation_type": "piecewise",
+            "pieces": [
+                {"equation_type": "polynomial", "coefficients": [1.0],
+                 "temperature_range": [0, 10]},
+                {"equation_type": "polynomial", "coefficients": [0.0, 1.0],
+                 "temperature_range": [10, 20]}
+            ]
+        })
+    
+    def test_piece_selection(self):
+        """Test that each temperature uses the piece covering it."""
+        assert isinstance(self.evaluator, PiecewiseEvaluator)
+        assert self.evaluator.temperature_range == (0.0, 20.0)
+        assert self.evaluator(5.0) == 1.0
+        assert self.evaluator(10.0) == 10.0
+        assert self.evaluator(15.0) == 15.0
+        
+        values = self.evaluator.evaluate_many([5.0, 10.0, 15.0])
+        assert np.array_equal(values, [1.0, 10.0, 15.0])
+    
+    def test_integrate_across_breakpoint(self):
+        """Test closed-form integration across pieces."""
+        assert self.evaluator.has_antiderivative
+        # 1 * (10 - 5) + (15^2 - 10^2) / 2
+        assert self.evaluator.integrate(5.0, 15.0) == pytest.approx(67.5)
+        assert np.allclose(self.evaluator.integrate(np.array([0.0, 12.0]), np.array([5.0, 14.0])),
+                           [5.0, 26.0])
+    
+    def test_gap_between_pieces(self):
+        """Test that pieces must cover the range without gaps."""
+        with pytest.raises(ValueError, match="Gap between pieces"):
+            compile_evaluator("m", "p", {
+                "equation_type": "piecewise",
+                "pieces": [
+                    {"equation_type": "polynomial", "coefficients": [1.0],
+                     "temperature_range": [0, 10]},
+                    {"equation_type": "polynomial", "coefficients": [1.0],
+                     "temperature_range": [12, 20]}
+                ]
+            })
+
+
+class TestEvaluatorCache:
+    """Test cases for the evaluator cache on MaterialCalculator."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+    
+    def test_evaluator_is_cached(self):
+        """Test that repeated lookups return the same compiled evaluator."""
+        first = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        second = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        
+        assert isinstance(first, PropertyEvaluator)
+        assert first is second
+    
+    def test_cache_invalidated_by_add_material(self):
+        """Test that adding a material drops stale evaluators."""
+        material = {
+            "name": "Test material",
+            "properties": {
+                "thermal_conductivity": {
+                    "equation_type": "polynomial",
+                    "coefficients": [1.0],
+                    "temperature_range": [4, 300],
+                    "units": "W/m-K"
+                }
+            }
+        }
+        self.calculator.database.add_material("test_material", material)
+        assert self.calculator.calculate_thermal_conductivity("test_material", 77.0) == 1.0
+        
+        material = dict(material, properties={
+            "thermal_conductivity": dict(material["properties"]["thermal_conductivity"],
+                                         coefficients=[2.0])
+        })
+        self.calculator.database.add_material("test_material", material)
+        assert self.calculator.calculate_thermal_conductivity("test_material", 77.0) == 2.0
+    
+    def test_cache_invalidated_by_reload(self):
+        """Test that reloading the database drops cached evaluators."""
+        first = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        self.calculator.database.load_materials()
+        second = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        
+        assert first is not second
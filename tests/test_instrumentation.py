@@ -0,0 +1,108 @@
+"""
+Unit tests for calculator instrumentation.
+"""
+
+import json
+
+import pytest
+import numpy as np
+from cryocalc import MaterialCalculator
+from cryocalc.instrumentation import CalculationStats, CountingEvaluator, instrument
+from cryocalc.thermal import ThermalCalculator, create_rod
+
+
+class TestInstrumentation:
+    """Test evaluation counters, timers and cache statistics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+        self.thermal = ThermalCalculator(self.calculator)
+        self.rod = create_rod(5.0, 100.0)
+
+    def test_disabled_by_default(self):
+        """Test that uninstrumented calculators use the plain class methods."""
+        assert self.calculator.instrumentation is None
+        assert 'get_evaluator' not in vars(self.calculator)
+        evaluator = self.calculator.get_evaluator("aluminum_6061_t6", 'thermal_conductivity')
+        assert not isinstance(evaluator, CountingEvaluator)
+
+    def test_counts_evaluations_and_cache_hits(self):
+        """Test per-property counters and evaluator cache hit rates."""
+        stats = self.calculator.enable_instrumentation()
+        self.calculator.calculate_property("aluminum_6061_t6", 'thermal_conductivity', 100.0)
+        self.calculator.calculate_property("aluminum_6061_t6", 'thermal_conductivity', 200.0)
+        self.calculator.calculate_property_many("aluminum_6061_t6", 'specific_heat',
+                                                np.linspace(10.0, 300.0, 50))
+
+        data = stats.as_dict()
+        conductivity = data['evaluations']['aluminum_6061_t6']['thermal_conductivity']
+        assert conductivity['calls'] == 2 and conductivity['points'] == 2
+        assert data['evaluations']['aluminum_6061_t6']['specific_heat']['points'] == 50
+        assert data['caches']['MaterialCalculator.evaluators'] == {
+            'hits': 1, 'misses': 2, 'hit_rate': pytest.approx(1 / 3)
+        }
+        assert data['timers']['MaterialCalculator.calculate_property']['calls'] == 2
+        assert stats.total_evaluations == 52
+        json.dumps(data)
+
+    def test_thermal_timers_and_table_cache(self):
+        """Test that thermal calculations are timed and table reuse recorded."""
+        self.thermal.calculate_thermal_power("stainless_steel_304", self.rod, 300.0, 4.0,
+                                             method='table')
+        with instrument(self.thermal) as stats:
+            self.thermal.calculate_thermal_power("stainless_steel_304", self.rod, 300.0, 4.0,
+                                                 method='table')
+            self.thermal.calculate_thermal_power("copper_ofhc_rrr100", self.rod, 300.0, 4.0,
+                                                 method='table')
+            self.thermal.calculate_temperature_profile("stainless_steel_304", self.rod,
+                                                       300.0, 4.0)
+
+        data = stats.as_dict()
+        assert data['caches']['ThermalCalculator.conductivity_tables']['hits'] >= 1
+        assert data['caches']['ThermalCalculator.conductivity_tables']['misses'] == 1
+        # The profile computes its own heat flow, a nested timed call
+        assert data['timers']['ThermalCalculator.calculate_thermal_power']['calls'] == 3
+        assert data['timers']['ThermalCalculator.build_conductivity_table']['calls'] == 1
+        assert 'ThermalCalculator.calculate_temperature_profile' in data['timers']
+        # Building the copper table evaluates its conductivity
+        assert data['evaluations']['copper_ofhc_rrr100']['thermal_conductivity']['points'] > 0
+        assert "calculate_thermal_power" in stats.report()
+
+    def test_disable_restores_plain_objects(self):
+        """Test that disabling removes every wrapper, including in cached tables."""
+        with instrument(self.thermal):
+            table = self.thermal.get_conductivity_integral_table("aluminum_6061_t6")
+            assert isinstance(table.evaluator, CountingEvaluator)
+
+        assert self.thermal.instrumentation is None
+        assert self.calculator.instrumentation is None
+        assert not isinstance(table.evaluator, CountingEvaluator)
+        for name in ('get_evaluator', 'calculate_property'):
+            assert name not in vars(self.calculator)
+        assert 'calculate_thermal_power' not in vars(self.thermal)
+
+    def test_results_unchanged(self):
+        """Test that instrumented calculations return identical values."""
+        plain = self.thermal.calculate_thermal_power("stainless_steel_304", self.rod, 300.0, 4.0)
+        change = self.calculator.enthalpy_change("aluminum_6061_t6", 300.0, 4.0)
+        with instrument(self.thermal):
+            assert self.thermal.calculate_thermal_power(
+                "stainless_steel_304", self.rod, 300.0, 4.0) == plain
+            assert self.calculator.enthalpy_change("aluminum_6061_t6", 300.0, 4.0) == change
+            evaluator = self.calculator.get_evaluator("aluminum_6061_t6", 'specific_heat')
+            assert evaluator.temperature_range == (4.0, 300.0)
+            with pytest.raises(ValueError):
+                evaluator(1000.0)
+
+    def test_shared_stats_and_reset(self):
+        """Test accumulating into a supplied stats object and resetting it."""
+        stats = CalculationStats()
+        with instrument(self.calculator, stats):
+            self.calculator.calculate_property("teflon", 'thermal_conductivity', 50.0)
+        with instrument(self.calculator, stats):
+            self.calculator.calculate_property("teflon", 'thermal_conductivity', 60.0)
+
+        assert stats.evaluations[("teflon", 'thermal_conductivity')][0] == 2
+        stats.reset()
+        assert stats.as_dict() == {'evaluations': {}, 'timers': {}, 'caches': {}}
@@ -0,0 +1,269 @@
+"""
+Tests for cumulative integral tables and integration helpers.
+"""
+
+import pytest
+import numpy as np
+from cryocalc.calculator import MaterialCalculator
+from cryocalc.evaluators import compile_evaluator
+from cryocalc.integration import (
+    CumulativeIntegralTable,
+    IntegrationResult,
+    gauss_legendre_rule,
+    integrate_gauss_kronrod,
+    integrate_gauss_legendre,
+    integrate_simpson,
+    integrate_trapezoid
+)
+from cryocalc.thermal import ThermalCalculator
+
+
+class TestCumulativeIntegralTable:
+    """Test cases for CumulativeIntegralTable."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = MaterialCalculator()
+    
+    def test_polynomial_table_matches_exact_integral(self):
+        """Test the table against a closed-form polynomial integral."""
+        evaluator = compile_evaluator("m", "thermal_conductivity", {
+            "equation_type": "polynomial",
+            "coefficients": [2.0, 0.5, -1e-3, 2e-6],
+            "temperature_range": [4, 300]
+        })
+        table = CumulativeIntegralTable(evaluator)
+        
+        lows = np.array([4.0, 10.0, 77.0])
+        highs = np.array([300.0, 20.0, 80.0])
+        np.testing.assert_allclose(table.integral(lows, highs),
+                                   evaluator.integrate(lows, highs), rtol=1e-10)
+    
+    def test_table_starts_at_zero(self):
+        """Test that F(T_min) is zero and F is increasing for k > 0."""
+        evaluator = self.calculator.get_evaluator("copper_ofhc_rrr100", "thermal_conductivity")
+        table = CumulativeIntegralTable(evaluator)
+        
+        assert table(4.0) == 0.0
+        assert table.monotone
+        samples = table(np.linspace(4.0, 300.0, 5000))
+        assert np.all(np.diff(samples) >= 0)
+    
+    def test_table_matches_fine_trapezoid(self):
+        """Test the table against a very fine trapezoid integration."""
+        evaluator = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        table = CumulativeIntegralTable(evaluator)
+        
+        temperatures = np.linspace(20.0, 150.0, 200001)
+        reference = np.trapezoid(evaluator.evaluate_array(temperatures), temperatures)
+        assert table.integral(20.0, 150.0) == pytest.approx(reference, rel=1e-8)
+    
+    def test_accuracy_report(self):
+        """Test the accuracy bound reported by the table."""
+        evaluator = self.calculator.get_evaluator("stainless_steel_304", "thermal_conductivity")
+        table = CumulativeIntegralTable(evaluator)
+        
+        assert table.accuracy['max_rel_error'] < 1e-8
+        assert table.accuracy['full_range_integral'] == pytest.approx(table.integral(4.0, 300.0))
+        assert table.accuracy['trapezoid_100_rel_difference'] < 1e-2
+    
+    def test_inverse_round_trip(self):
+        """Test that inverse(F(T)) recovers T."""
+        evaluator = self.calculator.get_evaluator("copper_ofhc_rrr100", "thermal_conductivity")
+        table = CumulativeIntegralTable(evaluator)
+        
+        temperatures = np.linspace(4.0, 300.0, 301)
+        np.testing.assert_allclose(table.inverse(table(temperatures)), temperatures, rtol=1e-9)
+        assert table.inverse(-1.0) == 4.0
+        assert table.inverse(1e12) == 300.0
+    
+    def test_inverse_requires_positive_property(self):
+        """Test that a property with negative values cannot be inverted."""
+        evaluator = self.calculator.get_evaluator("aluminum_3003_f", "linear_expansion")
+        table = CumulativeIntegralTable(evaluator)
+        
+        assert not table.monotone
+        with pytest.raises(ValueError, match="Cannot invert"):
+            table.inverse(0.0)
+    
+    def test_invalid_num_points(self):
+        """Test that a table needs at least two grid points."""
+        evaluator = self.calculator.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        with pytest.raises(ValueError):
+            CumulativeIntegralTable(evaluator, num_points=1)
+
+
+class TestQuadratureRules:
+    """Test cases for the standalone quadrature rules."""
+    
+    @staticmethod
+    def integrand(temperatures):
+        """Smooth test integrand with a known integral."""
+        return 1.0 / temperatures + np.sqrt(temperatures)
+    
+    @staticmethod
+    def exact(temp_low, temp_high):
+        """Exact integral of ``integrand``."""
+        return (np.log(temp_high / temp_low)
+                + 2.0 / 3.0 * (temp_high**1.5 - temp_low**1.5))
+    
+    def test_rules_converge(self):
+        """Test every rule against the exact integral."""
+        exact = self.exact(4.0, 300.0)
+        
+        assert integrate_trapezoid(self.integrand, 4.0, 300.0, 2000).value == pytest.approx(exact, rel=1e-5)
+        assert integrate_simpson(self.integrand, 4.0, 300.0, 65).value == pytest.approx(exact, rel=1e-6)
+        assert integrate_gauss_legendre(self.integrand, 4.0, 300.0, 16).value == pytest.approx(exact, rel=1e-10)
+        assert integrate_gauss_kronrod(self.integrand, 4.0, 300.0, 1e-10).value == pytest.approx(exact, rel=1e-10)
+    
+    def test_evaluation_counts(self):
+        """Test that each rule reports the number of integrand evaluations."""
+        calls = []
+        
+        def counting(temperatures):
+            calls.append(np.size(temperatures))
+            return self.integrand(temperatures)
+        
+        for rule, option in ((integrate_trapezoid, 50), (integrate_simpson, 32),
+                             (integrate_gauss_legendre, 12), (integrate_gauss_kronrod, 1e-8)):
+            result = rule(counting, 4.0, 300.0, option)
+            assert isinstance(result, IntegrationResult)
+            assert result.evaluations == sum(calls)
+            calls.clear()
+    
+    def test_simpson_rounds_to_odd_points(self):
+        """Test that Simpson's rule uses an odd number of points."""
+        assert integrate_simpson(self.integrand, 4.0, 300.0, 32).evaluations == 33
+        with pytest.raises(ValueError):
+            integrate_simpson(self.integrand, 4.0, 300.0, 2)
+    
+    def test_zero_lower_bound(self):
+        """Test integration from T = 0 where the log substitution is skipped."""
+        result = integrate_gauss_legendre(lambda t: t**2, 0.0, 3.0, 4)
+        assert result.value == pytest.approx(9.0, rel=1e-12)
+    
+    def test_gauss_rule_is_cached(self):
+        """Test that Gauss-Legendre nodes are computed once per order."""
+        nodes, weights = gauss_legendre_rule(10)
+        assert gauss_legendre_rule(10)[0] is nodes
+        assert weights.sum() == pytest.approx(2.0)
+        assert not nodes.flags.writeable
+        with pytest.raises(ValueError):
+            gauss_legendre_rule(0)
+    
+    def test_adaptive_error_estimate(self):
+        """Test that the adaptive rule reports an error estimate."""
+        result = integrate_gauss_kronrod(self.integrand, 4.0, 300.0, 1e-8)
+        assert result.error_estimate is not None
+        assert result.error_estimate <= 1e-8 * abs(result.value)
+        assert result.converged
+    
+    def test_adaptive_tolerance_below_roundoff(self):
+        """Test that tolerances float64 cannot deliver stop at the roundoff floor."""
+        exact = self.exact(4.0, 300.0)
+        for tolerance in (1e-15, 1e-20):
+            result = integrate_gauss_kronrod(self.integrand, 4.0, 300.0, tolerance)
+            assert result.converged
+            assert result.evaluations < 2000
+            assert result.value == pytest.approx(exact, rel=1e-13)
+    
+    def test_adaptive_evaluation_budget(self):
+        """Test that an unreachable tolerance stops at the evaluation budget."""
+        rng = np.random.default_rng(0)
+        
+        def noisy(temperatures):
+            return self.integrand(temperatures) * (1 + 1e-9 * rng.standard_normal(temperatures.shape))
+        
+        result = integrate_gauss_kronrod(noisy, 4.0, 300.0, 1e-15, max_evaluations=5000)
+        assert not result.converged
+        assert result.evaluations <= 5000
+        assert result.value == pytest.approx(self.exact(4.0, 300.0), rel=1e-8)
+        
+        calc = ThermalCalculator()
+        result = calc.integrate_thermal_conductivity("titanium_6al_4v", 23.0, 300.0,
+                                                     method='adaptive', tolerance=1e-15)
+        assert result.evaluations <= 100000
+        assert result.value == pytest.approx(
+            calc.integrate_thermal_conductivity("titanium_6al_4v", 23.0, 300.0,
+                                                method='adaptive').value, rel=1e-8)
+
+
+class TestThermalCalculatorTables:
+    """Test cumulative table use in ThermalCalculator."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = ThermalCalculator()
+    
+    def test_table_is_built_lazily_and_cached(self):
+        """Test that tables are built on first use and reused afterwards."""
+        assert self.calc._integral_tables == {}
+        self.calc.calculate_thermal_conductivity_integral("aluminum_6061_t6", 77.0, 300.0)
+        table = self.calc.get_conductivity_integral_table("aluminum_6061_t6")
+        
+        self.calc.calculate_thermal_conductivity_integral("aluminum_6061_t6", 4.0, 77.0)
+        assert self.calc.get_conductivity_integral_table("aluminum_6061_t6") is table
+    
+    def test_tables_invalidated_on_reload(self):
+        """Test that tables are rebuilt after the database changes."""
+        table = self.calc.get_conductivity_integral_table("aluminum_6061_t6")
+        self.calc.calculator.database.load_materials()
+        assert self.calc.get_conductivity_integral_table("aluminum_6061_t6") is not table
+    
+    def test_table_and_trapezoid_agree(self):
+        """Test that the default table path agrees with the trapezoid path."""
+        table_value = self.calc.calculate_thermal_conductivity_integral(
+            "copper_ofhc_rrr100", 4.0, 300.0
+        )
+        trapezoid_value = self.calc.calculate_thermal_conductivity_integral(
+            "copper_ofhc_rrr100", 4.0, 300.0, num_points=20000, method='trapezoid'
+        )
+        assert table_value == pytest.approx(trapezoid_value, rel=1e-6)
+    
+    @pytest.mark.parametrize("method", ["gauss", "adaptive", "simpson"])
+    def test_quadrature_methods_agree(self, method):
+        """Test that quadrature methods match the table with fewer evaluations."""
+        reference = self.calc.calculate_thermal_conductivity_integral(
+            "copper_ofhc_rrr100", 4.0, 300.0
+        )
+        result = self.calc.integrate_thermal_conductivity(
+            "copper_ofhc_rrr100", 4.0, 300.0, method=method, num_points=33, order=24
+        )
+        assert result.method == method
+        assert 0 < result.evaluations
+        assert result.value == pytest.approx(reference, rel=1e-4)
+    
+    def test_gauss_beats_trapezoid(self):
+        """Test that 16-point Gauss is more accurate than the 100-point trapezoid."""
+        reference = self.calc.calculate_thermal_conductivity_integral(
+            "aluminum_1100", 4.0, 300.0
+        )
+        gauss = self.calc.integrate_thermal_conductivity("aluminum_1100", 4.0, 300.0, method='gauss')
+        trapezoid = self.calc.integrate_thermal_conductivity("aluminum_1100", 4.0, 300.0, method='trapezoid')
+        
+        assert gauss.evaluations == 16
+        assert trapezoid.evaluations == 100
+        assert abs(gauss.value - reference) < abs(trapezoid.value - reference)
+    
+    def test_summary_reports_integration(self):
+        """Test that the calculation summary reports the integration method."""
+        from cryocalc.thermal import create_rod
+        summary = self.calc.get_calculation_summary(
+            "aluminum_6061_t6", create_rod(10, 100), 300.0, 77.0, method='gauss'
+        )
+        assert summary['results']['integration_method'] == 'gauss'
+        assert summary['results']['property_evaluations'] == 16
+    
+    def test_unknown_method(self):
+        """Test that an unknown integration method is rejected."""
+        with pytest.raises(ValueError, match="Unknown integration method"):
+            self.calc.calculate_thermal_conductivity_integral(
+                "aluminum_6061_t6", 77.0, 300.0, method='bogus'
+            )
+    
+    def test_analytic_method_unavailable(self):
+        """Test requesting a closed-form integral for a log-polynomial fit."""
+        with pytest.raises(ValueError, match="No closed-form integral"):
+            self.calc.calculate_thermal_conductivity_integral(
+                "aluminum_6061_t6", 77.0, 300.0, method='analytic'
+            )
@@ -7,6 +7,8 @@ import json
 import tempfile
 from pathlib import Path
 
+from cryocalc import materials
+from cryocalc.calculator import MaterialCalculator
 from cryocalc.materials import MaterialDatabase
 from cryocalc.properties import PropertyType
 
@@ -41,6 +43,17 @@ class TestMaterialDatabase:
         assert len(info["properties"]) > 0
         assert "thermal_conductivity" in info["properties"]
     
+    def test_get_density(self):
+        """Test material densities and missing density errors."""
+        for material_id in self.database.get_available_materials():
+            assert self.database.get_density(material_id) > 0
+        
+        database = MaterialDatabase.from_data({"bare": {"name": "Bare", "properties": {}}})
+        with pytest.raises(ValueError, match="No density"):
+            database.get_density("bare")
+        with pytest.raises(ValueError, match="not found in database"):
+            database.get_density("nonexistent_material")
+    
     def test_get_material_info_invalid(self):
         """Test getting info for invalid material."""
         with pytest.raises(ValueError, match="not found in database"):
@@ -84,6 +97,7 @@ class TestMaterialDatabase:
         """Test parameter validation."""
         # Valid parameters
         assert self.database.validate_calculation_parameters("aluminum_6061_t6", "thermal_conductivity")
+        assert self.database.validate_calculation_parameters("kevlar_49_fiber", "thermal_conductivity")
         
         # Invalid material
         assert not self.database.validate_calculation_parameters("nonexistent", "thermal_conductivity")
@@ -153,3 +167,91 @@ class TestMaterialDatabase:
         """Test handling of missing file."""
         with pytest.raises(FileNotFoundError, match="not found"):
             MaterialDatabase("nonexistent_file.json")
+
+
+class TestSharedDefaultDatabase:
+    """Test cases for the process-wide default materials data."""
+    
+    def test_loaded_once_on_first_access(self, monkeypatch):
+        """Test that the default file is parsed lazily and only once."""
+        calls = []
+        read = materials._read_materials_file
+        monkeypatch.setattr(materials, "_default_materials", None)
+        monkeypatch.setattr(materials, "_read_materials_file",
+                            lambda path: calls.append(path) or read(path))
+        
+        first = MaterialCalculator()
+        second = MaterialCalculator()
+        assert calls == []
+        
+        first.calculate_thermal_conductivity("aluminum_1100", 77.0)
+        second.calculate_thermal_conductivity("aluminum_1100", 77.0)
+        assert len(calls) == 1
+        assert first.database._materials_data is second.database._materials_data
+    
+    def test_first_load_keeps_caches(self, monkeypatch):
+        """Test that the lazy first load does not invalidate what it just cached."""
+        from cryocalc.thermal import ThermalCalculator
+        monkeypatch.setattr(materials, "_default_materials", None)
+        calculator = MaterialCalculator()
+        evaluator = calculator.get_evaluator("aluminum_1100", 'thermal_conductivity')
+        assert calculator.get_evaluator("aluminum_1100", 'thermal_conductivity') is evaluator
+        
+        monkeypatch.setattr(materials, "_default_materials", None)
+        thermal = ThermalCalculator(MaterialCalculator())
+        table = thermal.get_conductivity_integral_table("aluminum_1100")
+        assert thermal.get_conductivity_integral_table("aluminum_1100") is table
+    
+    def test_add_material_does_not_leak(self):
+        """Test that adding a material only affects the database it was added to."""
+        first = MaterialDatabase()
+        second = MaterialDatabase()
+        
+        first.add_material("local_material", {"name": "Local", "properties": {}})
+        
+        assert "local_material" in first.get_available_materials()
+        assert "local_material" not in second.get_available_materials()
+        assert "local_material" not in MaterialDatabase().get_available_materials()
+    
+    def test_reload_propagates(self):
+        """Test that reload() refreshes every default database in the process."""
+        calculator = MaterialCalculator()
+        other = MaterialDatabase()
+        revision = calculator.database.revision
+        old_data = calculator.database._materials_data
+        
+        other.reload()
+        
+        assert calculator.database.revision != revision
+        assert calculator.database._materials_data is not old_data
+        assert calculator.database._materials_data is other._materials_data
+    
+    def test_reload_discards_added_materials(self):
+        """Test that reload() drops local additions and rejoins the shared data."""
+        database = MaterialDatabase()
+        database.add_material("local_material", {"name": "Local", "properties": {}})
+        
+        database.reload()
+        
+        assert "local_material" not in database.get_available_materials()
+        assert database._materials_data is MaterialDatabase()._materials_data
+    
+    def test_from_data(self):
+        """Test building a database from parsed data without a file."""
+        data = MaterialDatabase().materials_data
+        database = MaterialDatabase.from_data(data)
+        
+        assert data is MaterialDatabase()._materials_data
+        assert database.materials_data is data
+        assert database.get_available_materials() == list(data)
+        with pytest.raises(ValueError, match="no file"):
+            database.reload()
+        with pytest.raises(ValueError, match="output_file is required"):
+            database.save_materials()
+    
+    def test_custom_file_not_shared(self):
+        """Test that databases with an explicit data file keep their own data."""
+        custom = MaterialDatabase(str(materials.DEFAULT_DATA_FILE))
+        
+        assert custom._materials_data is not MaterialDatabase()._materials_data
+        assert custom.get_available_materials() == MaterialDatabase().get_available_materials()
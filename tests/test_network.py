@@ -0,0 +1,138 @@
+"""
+Unit tests for the thermal network solver.
+"""
+
+import pytest
+import numpy as np
+from cryocalc.network import ThermalNetwork
+from cryocalc.thermal import ThermalCalculator, create_rod, create_tube, create_wire
+
+
+class TestThermalNetwork:
+    """Test series/parallel network solutions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.thermal = ThermalCalculator()
+        self.tube = create_tube(10.0, 0.5, 200.0)
+        self.clamp = create_rod(10.0, 20.0)
+        self.standoff = create_rod(5.0, 20.0)
+
+    def power(self, material_id, geometry, temp_hot, temp_cold):
+        return self.thermal.calculate_thermal_power(material_id, geometry, temp_hot,
+                                                    temp_cold, method='table')
+
+    def test_single_segment_matches_thermal_power(self):
+        """Test that one segment reproduces calculate_thermal_power."""
+        network = ThermalNetwork.series([("stainless_steel_304", self.tube)], 300.0, 4.0,
+                                        self.thermal)
+        solution = network.solve()
+
+        expected = self.power("stainless_steel_304", self.tube, 300.0, 4.0)
+        assert solution.heat_load('cold') == pytest.approx(expected, rel=1e-12)
+        assert solution.heat_load('hot') == pytest.approx(-expected, rel=1e-12)
+        assert solution.iterations == 0
+
+    def test_series_chain(self):
+        """Test that a series chain carries one heat flow through every segment."""
+        links = [("stainless_steel_304", self.tube), ("copper_ofhc_rrr100", self.clamp),
+                 ("teflon", self.standoff)]
+        solution = ThermalNetwork.series(links, 300.0, 4.0, self.thermal).solve()
+
+        temps = [solution.temperatures[node] for node in ['hot', 'joint 1', 'joint 2', 'cold']]
+        assert temps[0] > temps[1] > temps[2] > temps[3]
+        assert np.allclose(solution.heat_flows, solution.heat_flows[0], rtol=1e-9)
+        # Each segment obeys Q = (A/L) ∫k dT between its solved end temperatures
+        for (material_id, geometry), flow, hot, cold in zip(links, solution.heat_flows,
+                                                            temps, temps[1:]):
+            assert flow == pytest.approx(self.power(material_id, geometry, hot, cold), rel=1e-9)
+
+    def test_directional_material(self):
+        """Test a G10 standoff, which only has directional conductivity fits."""
+        with pytest.raises(ValueError):
+            ThermalNetwork(self.thermal).add_segment('clamp', '4K', "fiberglass_epoxy_g10",
+                                                     self.standoff)
+        links = [("stainless_steel_304", self.tube),
+                 ("fiberglass_epoxy_g10", self.standoff, 'normal')]
+        network = ThermalNetwork.series(links, 300.0, 4.0, self.thermal)
+        solution = network.solve()
+
+        assert network.segments[1].property_name == 'thermal_conductivity_normal'
+        joint = solution.temperatures['joint 1']
+        table = self.thermal.get_conductivity_integral_table("fiberglass_epoxy_g10",
+                                                             'thermal_conductivity_normal')
+        expected = self.standoff.shape_factor() * (table(joint) - table(4.0))
+        assert solution.heat_load('cold') == pytest.approx(expected, rel=1e-9)
+        assert network.summary(solution)[1]['property'] == 'thermal_conductivity_normal'
+
+    def test_parallel_bundle(self):
+        """Test that count and separate parallel segments are equivalent."""
+        wire = create_wire(0.1, 500.0)
+        bundle = ThermalNetwork(self.thermal)
+        bundle.add_segment('300K', '4K', "stainless_steel_304", wire, count=24)
+        bundle.fix_temperature('300K', 300.0)
+        bundle.fix_temperature('4K', 4.0)
+
+        separate = ThermalNetwork(self.thermal)
+        for _ in range(24):
+            separate.add_segment('300K', '4K', "stainless_steel_304", wire)
+        separate.fix_temperature('300K', 300.0)
+        separate.fix_temperature('4K', 4.0)
+
+        expected = 24 * self.power("stainless_steel_304", wire, 300.0, 4.0)
+        assert bundle.solve().heat_load('4K') == pytest.approx(expected, rel=1e-12)
+        assert separate.solve().heat_load('4K') == pytest.approx(expected, rel=1e-12)
+
+    def test_intermediate_stage_and_heat_input(self):
+        """Test energy conservation with a heat-sunk stage and a dissipating node."""
+        network = ThermalNetwork(self.thermal)
+        network.add_segment('300K', 'support', "stainless_steel_304", self.tube)
+        network.add_segment('support', '50K', "copper_ofhc_rrr100", self.clamp)
+        network.add_segment('support', 'cold', "teflon", self.standoff)
+        network.add_segment('cold', '4K', "aluminum_6061_t6", self.clamp)
+        network.fix_temperature('300K', 300.0)
+        network.fix_temperature('50K', 50.0)
+        network.fix_temperature('4K', 4.0)
+        network.add_heat_input('cold', 0.01)
+
+        solution = network.solve()
+
+        assert sum(solution.boundary_heat.values()) == pytest.approx(0.01, rel=1e-9)
+        assert solution.heat_load('50K') > 0
+        assert solution.temperatures['cold'] > 4.0
+        rows = network.summary(solution)
+        assert rows[3]['heat_flow_W'] == pytest.approx(solution.heat_load('4K'), rel=1e-9)
+
+    def test_initial_temperatures(self):
+        """Test that a supplied starting guess converges to the same state."""
+        links = [("stainless_steel_304", self.tube), ("teflon", self.standoff)]
+        network = ThermalNetwork.series(links, 300.0, 4.0, self.thermal)
+
+        default = network.solve()
+        guessed = network.solve(initial_temperatures={'joint 1': 10.0})
+        assert guessed.temperatures['joint 1'] == pytest.approx(default.temperatures['joint 1'],
+                                                               rel=1e-9)
+
+    def test_invalid_networks(self):
+        """Test validation of incomplete or inconsistent networks."""
+        network = ThermalNetwork(self.thermal)
+        with pytest.raises(ValueError, match="no segments"):
+            network.solve()
+
+        network.add_segment('a', 'b', "teflon", self.standoff)
+        with pytest.raises(ValueError, match="fixed-temperature"):
+            network.solve()
+
+        network.fix_temperature('a', 300.0)
+        network.add_segment('c', 'd', "teflon", self.standoff)
+        with pytest.raises(ValueError, match="not connected"):
+            network.solve()
+
+        network = ThermalNetwork.series([("teflon", self.standoff)], 400.0, 4.0, self.thermal)
+        with pytest.raises(ValueError, match="outside the valid range"):
+            network.solve()
+
+        with pytest.raises(ValueError):
+            network.add_segment('a', 'b', "unobtainium", self.standoff)
+        with pytest.raises(ValueError, match="different nodes"):
+            network.add_segment('a', 'a', "teflon", self.standoff)
@@ -4,7 +4,8 @@ Tests for the properties module.
 
 import pytest
 import math
-from cryocalc.properties import PropertyCalculator, PropertyType, EquationType, erf
+import numpy as np
+from cryocalc.properties import PropertyCalculator, PropertyType, EquationType, erf, horner
 
 
 class TestPropertyCalculator:
@@ -102,6 +103,66 @@ class TestPropertyCalculator:
         self.calculator.validate_temperature_range(200.0, 50.0, 200.0)
 
 
+class TestVectorizedEvaluation:
+    """Test cases for array-valued PropertyCalculator evaluation."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = PropertyCalculator()
+        self.temperatures = np.linspace(4.0, 300.0, 37)
+    
+    def test_horner_matches_power_sum(self):
+        """Test Horner evaluation against the explicit power sum."""
+        coefficients = [1.5, -0.25, 0.03, 2e-4]
+        for x in (0.0, 1.7, 42.0):
+            expected = sum(c * x ** i for i, c in enumerate(coefficients))
+            assert abs(horner(x, coefficients) - expected) < 1e-9
+    
+    def test_logarithmic_polynomial_array(self):
+        """Test array logarithmic polynomial matches scalar evaluation."""
+        coefficients = [0.07918, 1.0957, -0.07277, 0.08084, 0.02803, -0.09464, 0.04179, -0.00571, 0]
+        result = self.calculator.logarithmic_polynomial(self.temperatures, coefficients)
+        
+        assert isinstance(result, np.ndarray)
+        assert result.shape == self.temperatures.shape
+        expected = [self.calculator.logarithmic_polynomial(float(t), coefficients)
+                    for t in self.temperatures]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+    
+    def test_polynomial_array(self):
+        """Test array polynomial matches scalar evaluation."""
+        coefficients = [-412.77, -0.30389, 0.0087696, -9.9821e-6, 0]
+        result = self.calculator.polynomial(self.temperatures, coefficients)
+        
+        expected = [self.calculator.polynomial(float(t), coefficients)
+                    for t in self.temperatures]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+    
+    def test_rational_array(self):
+        """Test array rational function matches scalar evaluation."""
+        numerator_coeffs = [2.2154, -0.88068, 0.29505, -0.04831, 0.003207]
+        denominator_coeffs = [1, -0.47461, 0.13871, -0.02043, 0.001281]
+        result = self.calculator.rational(self.temperatures, numerator_coeffs, denominator_coeffs)
+        
+        expected = [self.calculator.rational(float(t), numerator_coeffs, denominator_coeffs)
+                    for t in self.temperatures]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+    
+    def test_array_accepts_lists(self):
+        """Test that plain lists take the vectorized path."""
+        result = self.calculator.polynomial([1.0, 2.0, 3.0], [0.0, 1.0])
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, [1.0, 2.0, 3.0])
+    
+    def test_array_invalid_temperature(self):
+        """Test that any invalid element in an array raises."""
+        with pytest.raises(ValueError, match="Temperature must be positive"):
+            self.calculator.logarithmic_polynomial(np.array([10.0, 0.0]), [1.0])
+        
+        with pytest.raises(ValueError, match="Temperature must be non-negative"):
+            self.calculator.polynomial(np.array([10.0, -1.0]), [1.0])
+
+
 class TestErrorFunction:
     """Test cases for error function."""
     
@@ -130,6 +191,73 @@ class TestErrorFunction:
         """Test error function symmetry."""
         x = 1.5
         assert abs(erf(-x) + erf(x)) < 1e-10
+    
+    def test_erf_array_matches_scalar(self):
+        """Test that the vectorized error function matches the scalar one."""
+        x = np.array([-3.0, -0.5, 0.0, 0.25, 1.0, 4.0])
+        
+        result = erf(x)
+        
+        assert isinstance(result, np.ndarray)
+        assert np.allclose(result, [erf(float(v)) for v in x], rtol=1e-14)
+        assert np.allclose(result, [math.erf(v) for v in x], atol=2e-4)
+    
+    def test_erf_accuracy(self):
+        """Test the scalar error function against math.erf."""
+        # The a = 0.147 approximation is within 1.3e-4 everywhere
+        assert max(abs(erf(x / 100) - math.erf(x / 100)) for x in range(-400, 401)) < 1.3e-4
+        
+        # Near zero the approximation is relatively exact; computing
+        # 1 - exp(-x^2 ...) directly would round these to zero or lose digits
+        for x in (1e-8, 1e-5, 1e-3):
+            assert erf(x) == pytest.approx(math.erf(x), rel=1e-8)
+
+
+class TestErfComposite:
+    """Test cases for error-function composite equations."""
+    
+    def test_single_window(self):
+        """Test a constant switched on by one window at its center."""
+        segments = [(((2.0, 0.0, 0.0, 0.0),), ((10.0, 1.0, 1.0),))]
+        
+        # Half way through the window at the center, fully on far above it
+        assert PropertyCalculator.erf_composite(10.0, segments) == pytest.approx(1.0)
+        assert PropertyCalculator.erf_composite(100.0, segments) == pytest.approx(2.0)
+    
+    def test_blend_of_two_segments(self):
+        """Test that complementary windows blend two expressions."""
+        segments = [
+            (((1.0, 1.0, 0.0, 0.0),), ((1.0, 2.0, -1.0),)),
+            (((3.0, 0.0, 0.0, 0.0), (-1.0, 0.0, 0.0, 0.5)), ((1.0, 2.0, 1.0),)),
+        ]
+        temperature = 25.0
+        x = math.log10(temperature)
+        weight = (1 + erf(2 * (x - 1.0))) / 2
+        expected = 10 ** (x * (1 - weight) + (3.0 - math.exp(-x / 0.5)) * weight)
+        
+        result = PropertyCalculator.erf_composite(temperature, segments, "log10", True)
+        assert result == pytest.approx(expected, rel=1e-12)
+    
+    def test_array_matches_scalar(self):
+        """Test that array evaluation matches scalar evaluation."""
+        segments = [
+            (((1.0, -1.0, 0.0, 0.0), (0.5, 2.0, 5.0, 0.0)), ((20.0, 0.2, 1.0),)),
+            (((4.0, 0.5, 0.0, 0.0),), ((20.0, 0.2, -1.0),)),
+        ]
+        temps = np.array([1.0, 10.0, 20.0, 50.0, 300.0])
+        
+        result = PropertyCalculator.erf_composite(temps, segments)
+        expected = [PropertyCalculator.erf_composite(float(t), segments) for t in temps]
+        assert np.allclose(result, expected, rtol=1e-13)
+    
+    def test_invalid_temperature(self):
+        """Test that non-positive temperatures are rejected."""
+        segments = [(((1.0, 0.0, 0.0, 0.0),), ())]
+        
+        with pytest.raises(ValueError, match="Temperature must be positive"):
+            PropertyCalculator.erf_composite(0.0, segments)
+        with pytest.raises(ValueError, match="Temperature must be positive"):
+            PropertyCalculator.erf_composite(np.array([1.0, -1.0]), segments)
 
 
 class TestEnums:
@@ -0,0 +1,183 @@
+"""
+Tests for the line-delimited JSON calculation server.
+"""
+
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+from cryocalc.calculator import MaterialCalculator
+from cryocalc.server import RequestHandler, serve_unix_socket
+
+
+class TestRequestHandler:
+    """Test cases for RequestHandler."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.handler = RequestHandler()
+        self.calculator = MaterialCalculator()
+    
+    def test_calculate_scalar(self):
+        """Test a single-temperature calculation."""
+        response = self.handler.handle({
+            "id": 7, "op": "calculate", "material": "aluminum_6061_t6",
+            "property": "thermal_conductivity", "temperature": 77.0
+        })
+        
+        assert response["id"] == 7
+        assert response["ok"]
+        assert response["result"]["value"] == \
+            self.calculator.calculate_thermal_conductivity("aluminum_6061_t6", 77.0)
+        assert response["result"]["units"] == "W/m-K"
+    
+    def test_calculate_array(self):
+        """Test a batched temperature array, with out-of-range points as null."""
+        response = self.handler.handle({
+            "op": "calculate", "material": "aluminum_6061_t6",
+            "property": "thermal_conductivity", "temperature": [4.0, 77.0, 1000.0],
+            "nan_out_of_range": True
+        })
+        
+        values = response["result"]["values"]
+        assert values[1] == self.calculator.calculate_thermal_conductivity("aluminum_6061_t6", 77.0)
+        assert values[2] is None
+    
+    def test_calculate_variant(self):
+        """Test that variants are appended to the property name."""
+        response = self.handler.handle({
+            "op": "calculate", "material": "fiberglass_epoxy_g10",
+            "property": "thermal_conductivity", "variant": "normal", "temperature": 77.0
+        })
+        
+        assert response["ok"]
+    
+    def test_thermal_power(self):
+        """Test a thermal power query with a geometry specification."""
+        response = self.handler.handle({
+            "op": "thermal-power", "material": "stainless_steel_304",
+            "geometry": {"type": "tube", "outer_diameter_mm": 10.0,
+                         "wall_thickness_mm": 0.5, "length_mm": 200.0},
+            "temp_hot": 300.0, "temp_cold": 4.0
+        })
+        
+        from cryocalc.thermal import ThermalCalculator, create_tube
+        expected = ThermalCalculator().calculate_thermal_power(
+            "stainless_steel_304", create_tube(10.0, 0.5, 200.0), 300.0, 4.0
+        )
+        assert response["result"]["value"] == pytest.approx(expected)
+        assert response["result"]["units"] == "W"
+    
+    def test_thermal_power_variable_geometry(self):
+        """Test a stepped geometry given as lists of dimensions."""
+        response = self.handler.handle({
+            "op": "thermal-power", "material": "stainless_steel_304",
+            "geometry": {"type": "stepped", "diameters_mm": [10.0, 4.0],
+                         "lengths_mm": [50.0, 30.0]},
+            "temp_hot": 300.0, "temp_cold": 4.0
+        })
+        
+        assert response["ok"]
+        assert response["result"]["geometry"].startswith("stepped")
+    
+    def test_conductivity_integral(self):
+        """Test a conductivity integral query."""
+        response = self.handler.handle({
+            "op": "conductivity-integral", "material": "aluminum_6061_t6",
+            "temp_low": 4.0, "temp_high": 300.0
+        })
+        
+        assert response["ok"]
+        assert response["result"]["value"] > 0
+    
+    def test_errors_do_not_stop_the_server(self):
+        """Test that bad requests produce error responses."""
+        unknown_op = self.handler.handle({"id": 1, "op": "explode"})
+        missing_field = self.handler.handle({"id": 2, "op": "calculate", "material": "aluminum_1100"})
+        bad_geometry = self.handler.handle({
+            "op": "thermal-power", "material": "aluminum_1100",
+            "geometry": {"type": "sphere"}, "temp_hot": 300.0, "temp_cold": 4.0
+        })
+        
+        assert not unknown_op["ok"] and "Unknown op" in unknown_op["error"]
+        assert not missing_field["ok"] and "Missing field" in missing_field["error"]
+        assert not bad_geometry["ok"] and "Unknown geometry type" in bad_geometry["error"]
+        assert not json.loads(self.handler.handle_line("not json"))["ok"]
+    
+    def test_unexpected_errors_do_not_stop_the_server(self):
+        """Test that failures outside the expected exception types are reported."""
+        zero_length = self.handler.handle({
+            "id": 1, "op": "thermal-power", "material": "aluminum_1100",
+            "geometry": {"type": "rod", "diameter_mm": 5, "length_mm": 0},
+            "temp_hot": 300.0, "temp_cold": 4.0
+        })
+        null_precision = self.handler.handle({
+            "id": 2, "op": "calculate", "material": "aluminum_1100",
+            "property": "thermal_conductivity", "temperature": 77.0, "precision": None
+        })
+        
+        assert not zero_length["ok"] and "ZeroDivisionError" in zero_length["error"]
+        assert not null_precision["ok"] and "precision" in null_precision["error"]
+        assert self.handler.handle({"id": 3, "op": "ping"})["result"] == "pong"
+    
+    def test_serve_stream(self):
+        """Test answering a stream of requests in order."""
+        requests = [
+            {"id": 1, "op": "ping"},
+            {"id": 2, "op": "info", "material": "teflon"},
+            {"id": 3, "op": "list-materials", "property": "specific_heat"},
+        ]
+        infile = io.StringIO("\n".join(json.dumps(r) for r in requests) + "\n\n")
+        outfile = io.StringIO()
+        
+        self.handler.serve_stream(infile, outfile)
+        
+        responses = [json.loads(line) for line in outfile.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert responses[0]["result"] == "pong"
+        assert responses[1]["result"]["name"] == "Teflon"
+        assert all(r["ok"] for r in responses)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+class TestUnixSocketServer:
+    """Test cases for serving over a Unix domain socket."""
+    
+    def test_round_trip(self):
+        """Test two requests over one connection."""
+        path = os.path.join(tempfile.mkdtemp(), "cryocalc.sock")
+        thread = threading.Thread(target=serve_unix_socket, args=(path,), daemon=True)
+        thread.start()
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.01)
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            stream = client.makefile("rw")
+            stream.write(json.dumps({"id": 1, "op": "ping"}) + "\n")
+            stream.write(json.dumps({"id": 2, "op": "calculate", "material": "teflon",
+                                     "property": "specific_heat", "temperature": [10, 20]}) + "\n")
+            stream.flush()
+            first = json.loads(stream.readline())
+            second = json.loads(stream.readline())
+        
+        assert first == {"id": 1, "ok": True, "result": "pong"}
+        assert second["ok"] and len(second["result"]["values"]) == 2
+    
+    def test_existing_file_is_kept(self):
+        """Test that a regular file at the socket path is not deleted."""
+        path = os.path.join(tempfile.mkdtemp(), "results.json")
+        with open(path, "w") as f:
+            f.write("keep me")
+        
+        with pytest.raises(ValueError, match="not a socket"):
+            serve_unix_socket(path)
+        with open(path) as f:
+            assert f.read() == "keep me"
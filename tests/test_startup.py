@@ -0,0 +1,95 @@
+"""
+Startup regression checks.
+
+The CLI is invoked once per query in scripted runs, so the scalar property
+path must not import NumPy, SciPy or the thermal analysis modules. Each check runs
+in a fresh interpreter so that modules imported by other tests do not count.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that are expensive to import and not needed for scalar properties
+DEFERRED_MODULES = ("numpy", "scipy", "cryocalc.thermal", "cryocalc.surrogates",
+                    "cryocalc.integration")
+
+
+def run_fresh(code: str) -> dict:
+    """Run code in a new interpreter and return the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def loaded_deferred_modules() -> str:
+    """Snippet printing which deferred modules are loaded, as JSON."""
+    return (
+        "import json, sys\n"
+        f"print(json.dumps(sorted(m for m in sys.modules "
+        f"if m.split('.')[0] in ('numpy', 'scipy') or m in {DEFERRED_MODULES!r})))"
+    )
+
+
+class TestStartup:
+    """Test cases for import-time behaviour."""
+    
+    def test_scalar_property_path(self):
+        """Test that a scalar calculation does not load deferred modules."""
+        loaded = run_fresh(
+            "import cryocalc\n"
+            "calc = cryocalc.MaterialCalculator()\n"
+            "calc.calculate_thermal_conductivity('aluminum_1100', 77.0)\n"
+            + loaded_deferred_modules()
+        )
+        assert loaded == []
+    
+    def test_cli_calculate(self):
+        """Test that the CLI calculate command does not load deferred modules."""
+        loaded = run_fresh(
+            "import sys\n"
+            "from cryocalc.cli import main\n"
+            "sys.argv = ['cryocalc', 'calculate', 'aluminum_1100', 'thermal_conductivity', '77']\n"
+            "main()\n"
+            + loaded_deferred_modules()
+        )
+        assert loaded == []
+    
+    def test_lazy_attributes(self):
+        """Test that thermal exports are still reachable from the package."""
+        loaded = run_fresh(
+            "import cryocalc\n"
+            "assert 'ThermalCalculator' in dir(cryocalc)\n"
+            "rod = cryocalc.create_rod(10.0, 100.0)\n"
+            "assert isinstance(cryocalc.ThermalCalculator(), object)\n"
+            + loaded_deferred_modules()
+        )
+        assert "cryocalc.thermal" in loaded
+        assert not any(name.startswith("scipy") for name in loaded)
+    
+    def test_array_path_loads_numpy(self):
+        """Test that array calculations still import NumPy on demand."""
+        loaded = run_fresh(
+            "import cryocalc\n"
+            "calc = cryocalc.MaterialCalculator()\n"
+            "values = calc.calculate_property_many('aluminum_1100', 'thermal_conductivity',\n"
+            "                                      [4.0, 77.0, 300.0])\n"
+            "assert type(values).__name__ == 'ndarray'\n"
+            + loaded_deferred_modules()
+        )
+        assert "numpy" in loaded
+    
+    def test_unknown_attribute(self):
+        """Test that unknown package attributes still raise AttributeError."""
+        import cryocalc
+        
+        with pytest.raises(AttributeError):
+            cryocalc.not_a_real_attribute
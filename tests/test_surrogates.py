@@ -0,0 +1,182 @@
+"""
+Tests for Chebyshev surrogate evaluators.
+"""
+
+import pytest
+import numpy as np
+from cryocalc.calculator import MaterialCalculator
+from cryocalc.evaluators import ErfCompositeEvaluator, PiecewiseEvaluator, compile_evaluator
+from cryocalc.surrogates import ChebyshevEvaluator, clenshaw, fit_surrogate
+
+
+class TestClenshaw:
+    """Test cases for the Clenshaw recurrence."""
+    
+    def test_matches_chebval(self):
+        """Test agreement with NumPy's Chebyshev series evaluation."""
+        coefficients = [0.5, -1.2, 0.3, 2.0, -0.7]
+        x = np.linspace(-1, 1, 21)
+        
+        expected = np.polynomial.chebyshev.chebval(x, coefficients)
+        assert np.allclose(clenshaw(x, coefficients), expected, rtol=1e-14)
+        assert clenshaw(0.3, coefficients) == pytest.approx(
+            np.polynomial.chebyshev.chebval(0.3, coefficients), rel=1e-14
+        )
+    
+    def test_constant_series(self):
+        """Test a single-coefficient series."""
+        assert clenshaw(0.7, [2.5]) == 2.5
+
+
+class TestChebyshevEvaluator:
+    """Test cases for ChebyshevEvaluator."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = MaterialCalculator()
+    
+    def test_all_properties_within_tolerance(self):
+        """Test that every smooth database property gets a verified surrogate."""
+        # Erf windows only ~10 K wide over 1-600 K need far more than 256
+        # Chebyshev terms
+        unresolved = {("silicon", "expansion_coefficient")}
+        database = self.calc.database
+        for material_id in database.get_available_materials():
+            for property_name in database.get_material_info(material_id)['properties']:
+                reference = self.calc.get_evaluator(material_id, property_name)
+                if (material_id, property_name) in unresolved:
+                    with pytest.raises(ValueError, match="did not reach tolerance"):
+                        ChebyshevEvaluator(reference)
+                    continue
+                surrogate = ChebyshevEvaluator(reference)
+                
+                assert surrogate.max_rel_error <= 1e-9
+                temps = np.linspace(reference.min_temp, reference.max_temp, 397)
+                expected = reference.evaluate_array(temps)
+                actual = surrogate.evaluate_array(temps)
+                scale = 1.0 if surrogate.log_output else np.max(np.abs(expected))
+                assert np.all(np.abs(actual - expected) <= 1e-8 * np.maximum(np.abs(expected), scale))
+    
+    def test_scalar_matches_array(self):
+        """Test that scalar and array evaluation agree."""
+        reference = self.calc.get_evaluator("aluminum_6061_t6", "thermal_conductivity")
+        surrogate = ChebyshevEvaluator(reference)
+        temps = np.array([4.0, 77.0, 150.0, 300.0])
+        
+        scalar = [surrogate.evaluate(float(t)) for t in temps]
+        assert np.allclose(scalar, surrogate.evaluate_array(temps), rtol=1e-14)
+    
+    def test_sign_changing_property(self):
+        """Test that properties crossing zero are fitted without a log transform."""
+        reference = self.calc.get_evaluator("stainless_steel_304", "linear_expansion")
+        surrogate = ChebyshevEvaluator(reference)
+        
+        assert not surrogate.log_output
+        assert surrogate(150.0) == pytest.approx(reference(150.0), rel=1e-8)
+    
+    def test_range_validation_and_metadata(self):
+        """Test that the surrogate keeps the reference range, units and integral."""
+        reference = self.calc.get_evaluator("aluminum_6061_t6", "linear_expansion")
+        surrogate = ChebyshevEvaluator(reference)
+        
+        assert surrogate.temperature_range == reference.temperature_range
+        assert surrogate.units == reference.units
+        assert surrogate.has_antiderivative
+        assert surrogate.integrate(10.0, 200.0) == reference.integrate(10.0, 200.0)
+        with pytest.raises(ValueError, match="outside valid range"):
+            surrogate(1000.0)
+    
+    def test_unreachable_tolerance(self):
+        """Test that a fit that cannot meet the tolerance raises ValueError."""
+        reference = compile_evaluator("m", "p", {
+            "equation_type": "logarithmic_polynomial",
+            "coefficients": [1.0, 0.5],
+            "temperature_range": [4, 300]
+        })
+        
+        with pytest.raises(ValueError, match="did not reach tolerance"):
+            ChebyshevEvaluator(reference, tolerance=1e-30, max_degree=16)
+    
+    def test_piecewise_fitted_per_piece(self):
+        """Test that a jump between pieces does not prevent a surrogate."""
+        reference = compile_evaluator("m", "p", {
+            "equation_type": "piecewise",
+            "pieces": [
+                {"equation_type": "polynomial", "coefficients": [209.8, 0.12, -0.0115],
+                 "temperature_range": [5, 57]},
+                {"equation_type": "logarithmic_polynomial", "coefficients": [2.3, 0.01],
+                 "temperature_range": [57, 293]}
+            ]
+        })
+        
+        surrogate, failures = fit_surrogate(reference)
+        
+        assert failures == []
+        assert isinstance(surrogate, PiecewiseEvaluator)
+        assert all(isinstance(piece, ChebyshevEvaluator) for piece in surrogate.pieces)
+        assert surrogate.breakpoints == reference.breakpoints
+        temps = np.array([5.0, 30.0, 56.999, 57.0, 150.0, 293.0])
+        assert np.allclose(surrogate.evaluate_many(temps), reference.evaluate_many(temps),
+                           rtol=1e-8)
+        assert surrogate(57.0) == pytest.approx(reference(57.0), rel=1e-8)
+    
+    def test_piecewise_keeps_unfittable_pieces(self):
+        """Test that only the pieces missing the tolerance keep the reference."""
+        silicon = MaterialCalculator().get_evaluator("silicon", "expansion_coefficient")
+        smooth = compile_evaluator("m", "p", {
+            "equation_type": "polynomial", "coefficients": [1.0, 0.01],
+            "temperature_range": [silicon.max_temp, 1000]
+        })
+        reference = PiecewiseEvaluator("m", "p", silicon.min_temp, 1000, [silicon, smooth])
+        
+        surrogate, failures = fit_surrogate(reference)
+        
+        assert surrogate.pieces[0] is silicon
+        assert isinstance(surrogate.pieces[1], ChebyshevEvaluator)
+        assert len(failures) == 1 and failures[0].startswith(f"piece {silicon.min_temp:g}-")
+
+
+class TestChebyshevBackend:
+    """Test cases for selecting the Chebyshev backend on MaterialCalculator."""
+    
+    def test_backend_selection(self):
+        """Test that the backend controls which evaluator is compiled."""
+        reference_calc = MaterialCalculator()
+        fast_calc = MaterialCalculator(backend='chebyshev')
+        
+        evaluator = fast_calc.get_evaluator("copper_ofhc_rrr100", "thermal_conductivity")
+        assert isinstance(evaluator, ChebyshevEvaluator)
+        assert fast_calc.calculate_thermal_conductivity("copper_ofhc_rrr100", 20.0) == pytest.approx(
+            reference_calc.calculate_thermal_conductivity("copper_ofhc_rrr100", 20.0), rel=1e-8
+        )
+        
+        fast_calc.set_backend('reference')
+        evaluator = fast_calc.get_evaluator("copper_ofhc_rrr100", "thermal_conductivity")
+        assert not isinstance(evaluator, ChebyshevEvaluator)
+    
+    def test_backend_reports_fallbacks(self):
+        """Test that fits without a verified surrogate are kept and reported."""
+        calc = MaterialCalculator(backend='chebyshev')
+        calc.precompile_evaluators()
+        evaluator = calc.get_evaluator("silicon", "expansion_coefficient")
+        
+        assert isinstance(evaluator, ErfCompositeEvaluator)
+        assert list(calc.surrogate_fallbacks) == [("silicon", "expansion_coefficient")]
+        assert "did not reach tolerance" in calc.surrogate_fallbacks[
+            ("silicon", "expansion_coefficient")]
+        
+        calc.set_backend('reference')
+        assert calc.surrogate_fallbacks == {}
+    
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            MaterialCalculator(backend='lookup')
+    
+    def test_precompile_evaluators(self):
+        """Test compiling every evaluator up front."""
+        calc = MaterialCalculator(backend='chebyshev')
+        count = calc.precompile_evaluators(["aluminum_6061_t6", "teflon"])
+        
+        assert count == 7
+        assert calc._evaluator_cache.cache_info().currsize == 7
@@ -15,7 +15,19 @@ from cryocalc.thermal import (
     create_wire,
     create_tube,
     create_bar,
-    create_custom
+    create_custom,
+    RodArray,
+    TubeArray,
+    BarArray,
+    CustomArray,
+    create_rod_array,
+    create_tube_array,
+    shape_factors,
+    FrustumGeometry,
+    ProfileGeometry,
+    create_frustum,
+    create_stepped,
+    create_profile,
 )
 from cryocalc import MaterialCalculator
 
@@ -111,6 +123,146 @@ class TestGeometryHelpers:
         assert custom.length == 0.05
 
 
+class TestGeometryArrays:
+    """Test array-backed geometry collections."""
+    
+    def test_rod_array_matches_scalar(self):
+        """Test vectorized areas and indexing against RodGeometry."""
+        rods = RodArray([0.005, 0.0005, 0.002], 0.1)
+        
+        assert len(rods) == 3
+        assert np.array_equal(rods.lengths, [0.1, 0.1, 0.1])
+        for i, rod in enumerate(rods):
+            assert isinstance(rod, RodGeometry)
+            assert rods.cross_sectional_areas()[i] == pytest.approx(rod.cross_sectional_area(), rel=1e-15)
+        assert rods[1].geometry_type == GeometryType.WIRE
+        assert rods.descriptions()[0] == rods[0].description()
+    
+    def test_tube_bar_custom_arrays(self):
+        """Test the other array kinds against their scalar geometries."""
+        arrays = [
+            TubeArray([0.01, 0.02], [0.0005, 0.001], [0.25, 0.5]),
+            BarArray([0.01, 0.02], 0.005, [0.1, 0.2]),
+            CustomArray([1e-5, 2e-5], 0.05, "strap"),
+        ]
+        for array in arrays:
+            expected = [g.cross_sectional_area() / g.length for g in array]
+            assert np.allclose(array.shape_factors(), expected, rtol=1e-15)
+        assert arrays[2].descriptions()[0].startswith("strap")
+    
+    def test_tube_array_invalid_wall_thickness(self):
+        """Test that any too-thick wall is rejected."""
+        with pytest.raises(ValueError, match="Wall thickness"):
+            TubeArray([0.01, 0.01], [0.001, 0.005], 0.1)
+    
+    def test_mm_helpers(self):
+        """Test the mm helpers convert like their scalar counterparts."""
+        rods = create_rod_array([5.0, 2.0], [100.0, 50.0])
+        tubes = create_tube_array(10.0, [0.5, 1.0], 250.0)
+        
+        assert rods[0].diameter == create_rod(5.0, 100.0).diameter
+        assert tubes[1].cross_sectional_area() == pytest.approx(
+            create_tube(10.0, 1.0, 250.0).cross_sectional_area(), rel=1e-15)
+    
+    def test_shape_factors_accepts_all_forms(self):
+        """Test shape_factors for a geometry, a list and an array."""
+        rod = create_rod(5.0, 100.0)
+        
+        assert shape_factors(rod) == pytest.approx([rod.cross_sectional_area() / rod.length])
+        assert np.array_equal(shape_factors([rod, rod]), shape_factors(create_rod_array(5.0, [100.0, 100.0])))
+    
+    def test_scalar_geometries_use_slots(self):
+        """Test that scalar geometries carry no per-instance __dict__."""
+        for geometry in [create_rod(5.0, 100.0), create_tube(10.0, 0.5, 250.0),
+                         create_bar(10.0, 5.0, 100.0), create_custom(10.0, 50.0)]:
+            assert not hasattr(geometry, '__dict__')
+
+
+class TestVariableGeometries:
+    """Test geometries with a cross-section that varies along the length."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = ThermalCalculator()
+    
+    def test_frustum_shape_factor(self):
+        """Test the closed-form frustum shape factor π r0 r1 / L."""
+        frustum = create_frustum(10.0, 4.0, 100.0)
+        
+        assert isinstance(frustum, FrustumGeometry)
+        assert frustum.shape_factor() == pytest.approx(np.pi * 0.005 * 0.002 / 0.1, rel=1e-14)
+        assert frustum.cross_sectional_area() == pytest.approx(frustum.shape_factor() * 0.1)
+        straight = create_frustum(5.0, 5.0, 100.0)
+        rod = create_rod(5.0, 100.0)
+        assert straight.shape_factor() == pytest.approx(rod.shape_factor(), rel=1e-14)
+    
+    def test_callable_profile_matches_frustum(self):
+        """Test numerical ∫dx/A against the frustum closed form."""
+        frustum = create_frustum(10.0, 4.0, 100.0)
+        profile = ProfileGeometry(frustum.area_at, 0.1)
+        positions = np.linspace(0, 0.1, 37)
+        
+        assert profile.shape_factor() == pytest.approx(frustum.shape_factor(), rel=1e-12)
+        assert np.allclose(profile.resistance(positions), frustum.resistance(positions), rtol=1e-10)
+    
+    def test_stepped_geometry(self):
+        """Test that steps add like resistances in series."""
+        stepped = create_stepped([10.0, 4.0], [50.0, 30.0])
+        first, second = create_rod(10.0, 50.0), create_rod(4.0, 30.0)
+        
+        expected = 1 / (1 / first.shape_factor() + 1 / second.shape_factor())
+        assert stepped.length == pytest.approx(0.08)
+        assert stepped.shape_factor() == pytest.approx(expected, rel=1e-14)
+        assert stepped.area_at([0.01, 0.07]) == pytest.approx(
+            [first.cross_sectional_area(), second.cross_sectional_area()])
+    
+    def test_profile_table(self):
+        """Test a piecewise linear area table, including a step in slope."""
+        profile = create_profile([0.0, 20.0, 100.0], [50.0, 10.0, 10.0])
+        
+        # ∫dx/A = L ln(A0/A1)/(A0 - A1) on the taper plus the constant part
+        taper = 0.02 * np.log(50e-6 / 10e-6) / (50e-6 - 10e-6)
+        expected = 1 / (taper + 0.08 / 10e-6)
+        assert profile.length == pytest.approx(0.1)
+        assert profile.shape_factor() == pytest.approx(expected, rel=1e-10)
+    
+    def test_invalid_variable_geometries(self):
+        """Test validation of variable geometry inputs."""
+        with pytest.raises(ValueError):
+            create_frustum(0.0, 4.0, 100.0)
+        with pytest.raises(ValueError):
+            create_profile([0.0, 10.0], [5.0, 0.0])
+        with pytest.raises(ValueError):
+            create_profile([5.0, 10.0], [5.0, 5.0])
+        with pytest.raises(ValueError):
+            ProfileGeometry(lambda x: 1e-6 + 0 * x)
+        with pytest.raises(ValueError):
+            create_stepped([5.0], [10.0, 20.0])
+    
+    def test_power_uses_shape_factor(self):
+        """Test that thermal power needs only one conductivity integral."""
+        frustum = create_frustum(10.0, 4.0, 100.0)
+        
+        k_integral = self.calc.calculate_thermal_conductivity_integral("stainless_steel_304", 4.0, 300.0)
+        power = self.calc.calculate_thermal_power("stainless_steel_304", frustum, 300.0, 4.0)
+        assert power == pytest.approx(frustum.shape_factor() * k_integral, rel=1e-14)
+        summary = self.calc.get_calculation_summary("stainless_steel_304", frustum, 300.0, 4.0)
+        assert summary['results']['thermal_power_W'] == pytest.approx(power, rel=1e-14)
+    
+    def test_profile_inversion_matches_ode(self):
+        """Test the inversion profile of a taper against the ODE solution."""
+        frustum = create_frustum(10.0, 4.0, 100.0)
+        
+        x, temps = self.calc.calculate_temperature_profile("stainless_steel_304", frustum, 300.0, 4.0)
+        _, ode_temps = self.calc.calculate_temperature_profile("stainless_steel_304", frustum,
+                                                               300.0, 4.0, method='ode')
+        assert temps[0] == 300.0 and temps[-1] == 4.0
+        assert np.all(np.diff(temps) < 0)
+        assert np.allclose(temps, ode_temps, atol=0.05)
+        # The narrow end carries the steepest gradient
+        assert temps[-2] - temps[-1] > temps[0] - temps[1]
+
+
 class TestThermalCalculator:
     """Test thermal calculations."""
     
@@ -291,6 +443,212 @@ class TestThermalCalculator:
         assert summary['results']['thermal_power_W'] > 0
 
 
+class TestProfileInversion:
+    """Test temperature profiles computed by inverting the cumulative integral."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = ThermalCalculator()
+        self.tube = create_tube(outer_diameter_mm=20, wall_thickness_mm=2, length_mm=200)
+    
+    def test_profile_satisfies_integral_relation(self):
+        """Test Q*x/A = ∫[T(x) to T_hot] k dT at every position."""
+        material = "stainless_steel_304"
+        positions, temperatures = self.calc.calculate_temperature_profile(
+            material, self.tube, temp_hot=300.0, temp_cold=4.2, num_points=40
+        )
+        power = self.calc.calculate_thermal_power(material, self.tube, 300.0, 4.2)
+        area = self.tube.cross_sectional_area()
+        
+        assert temperatures[0] == 300.0
+        assert temperatures[-1] == 4.2
+        for x, t in zip(positions[1:-1], temperatures[1:-1]):
+            integral = self.calc.calculate_thermal_conductivity_integral(material, t, 300.0)
+            assert integral == pytest.approx(power * x / area, rel=1e-9)
+    
+    def test_inversion_matches_ode(self):
+        """Test that inversion and the legacy ODE solver agree."""
+        rod = create_rod(diameter_mm=10, length_mm=100)
+        _, inverted = self.calc.calculate_temperature_profile(
+            "copper_ofhc_rrr100", rod, temp_hot=300.0, temp_cold=77.0, num_points=20
+        )
+        _, integrated = self.calc.calculate_temperature_profile(
+            "copper_ofhc_rrr100", rod, temp_hot=300.0, temp_cold=77.0, num_points=20,
+            method='ode'
+        )
+        np.testing.assert_allclose(inverted, integrated, atol=0.05)
+    
+    def test_profile_clipped_at_lower_range_bound(self):
+        """Test that an excessive heat load clips the profile at the range minimum."""
+        rod = create_rod(diameter_mm=1, length_mm=100)
+        _, temperatures = self.calc.calculate_temperature_profile(
+            "stainless_steel_304", rod, temp_hot=300.0, thermal_power=10.0, num_points=10
+        )
+        assert temperatures[-1] == 4.0
+        assert all(temperatures[i] >= temperatures[i+1] for i in range(len(temperatures)-1))
+    
+    def test_profile_invalid_method_and_range(self):
+        """Test invalid profile method and out-of-range hot temperature."""
+        with pytest.raises(ValueError, match="Unknown profile method"):
+            self.calc.calculate_temperature_profile(
+                "stainless_steel_304", self.tube, temp_hot=300.0, temp_cold=77.0, method='euler'
+            )
+        with pytest.raises(ValueError, match="outside valid range"):
+            self.calc.calculate_temperature_profile(
+                "stainless_steel_304", self.tube, temp_hot=400.0, thermal_power=1.0
+            )
+
+
+class TestAnalyticIntegration:
+    """Test closed-form integration of polynomial thermal conductivity fits."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = ThermalCalculator()
+        self.calc.calculator.database.add_material("poly_k_material", {
+            "name": "Polynomial k(T) test material",
+            "properties": {
+                "thermal_conductivity": {
+                    "equation_type": "polynomial",
+                    "coefficients": [2.0, 0.5, -1e-3, 2e-6],
+                    "temperature_range": [4, 300],
+                    "units": "W/m-K"
+                }
+            }
+        })
+    
+    def test_integral_is_exact(self):
+        """Test the analytic integral against the hand-computed antiderivative."""
+        def antiderivative(t):
+            return 2.0 * t + 0.25 * t**2 - 1e-3 * t**3 / 3 + 2e-6 * t**4 / 4
+        
+        integral = self.calc.calculate_thermal_conductivity_integral(
+            "poly_k_material", 10.0, 250.0
+        )
+        assert isinstance(integral, float)
+        assert integral == pytest.approx(antiderivative(250.0) - antiderivative(10.0), rel=1e-12)
+    
+    def test_integral_skips_sampling(self):
+        """Test that the analytic path does not evaluate k(T) on a grid."""
+        evaluator = self.calc.calculator.get_evaluator("poly_k_material", "thermal_conductivity")
+        assert evaluator.has_antiderivative
+        
+        calls = []
+        original = evaluator.evaluate_array
+        evaluator.evaluate_array = lambda t: calls.append(t) or original(t)
+        self.calc.calculate_thermal_conductivity_integral("poly_k_material", 10.0, 250.0)
+        assert calls == []
+    
+    def test_power_and_summary_use_analytic_integral(self):
+        """Test that power and summary agree with the exact integral."""
+        rod = create_rod(diameter_mm=10, length_mm=100)
+        exact = self.calc.calculate_thermal_conductivity_integral("poly_k_material", 77.0, 300.0)
+        
+        power = self.calc.calculate_thermal_power("poly_k_material", rod, 300.0, 77.0)
+        assert power == pytest.approx(rod.cross_sectional_area() / rod.length * exact, rel=1e-12)
+        
+        summary = self.calc.get_calculation_summary("poly_k_material", rod, 300.0, 77.0)
+        assert summary['results']['thermal_conductivity_integral_W_K_per_m_K'] == exact
+    
+    def test_integral_range_still_validated(self):
+        """Test that the analytic path still enforces the valid range."""
+        with pytest.raises(ValueError):
+            self.calc.calculate_thermal_conductivity_integral("poly_k_material", 1.0, 77.0)
+
+
+class TestParameterSweep:
+    """Test vectorized integrals and thermal power sweeps."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = ThermalCalculator()
+        self.geometries = [create_rod(5.0, 100.0), create_tube(10.0, 0.5, 250.0)]
+        self.pairs = [(300.0, 4.0), (77.0, 4.0), (300.0, 77.0)]
+    
+    def test_conductivity_integrals_match_scalar(self):
+        """Test many integrals at once against the scalar method."""
+        lows = np.array([4.0, 4.0, 77.0])
+        highs = np.array([300.0, 77.0, 300.0])
+        
+        for material_id in ["aluminum_6061_t6", "stainless_steel_304", "teflon"]:
+            integrals = self.calc.calculate_conductivity_integrals(material_id, lows, highs)
+            expected = [self.calc.calculate_thermal_conductivity_integral(material_id, lo, hi)
+                        for lo, hi in zip(lows, highs)]
+            assert np.allclose(integrals, expected, rtol=1e-12)
+    
+    def test_conductivity_integrals_invalid_pairs(self):
+        """Test that invalid ranges give NaN instead of raising."""
+        integrals = self.calc.calculate_conductivity_integrals(
+            "aluminum_6061_t6", [4.0, 1.0, 100.0], [300.0, 300.0, 50.0]
+        )
+        
+        assert not np.isnan(integrals[0])
+        assert np.isnan(integrals[1:]).all()
+    
+    def test_sweep_matches_thermal_power(self):
+        """Test every grid point against calculate_thermal_power."""
+        materials = ["aluminum_6061_t6", "copper_ofhc_rrr100"]
+        results = self.calc.sweep_thermal_power(self.geometries, self.pairs, materials)
+        
+        assert len(results['power']) == 2 * 3 * 2
+        power = results['power'].reshape(2, 3, 2)
+        for i, material_id in enumerate(materials):
+            for j, (temp_hot, temp_cold) in enumerate(self.pairs):
+                for k, geometry in enumerate(self.geometries):
+                    expected = self.calc.calculate_thermal_power(material_id, geometry,
+                                                                 temp_hot, temp_cold)
+                    assert power[i, j, k] == pytest.approx(expected, rel=1e-12)
+        assert results['material'][0] == "aluminum_6061_t6"
+        assert list(results['geometry'][:4]) == [0, 1, 0, 1]
+        assert list(results['temp_cold'][:4]) == [4.0, 4.0, 4.0, 4.0]
+    
+    def test_sweep_defaults_to_all_conductivity_materials(self):
+        """Test the default material axis."""
+        results = self.calc.sweep_thermal_power(self.geometries[:1], [(300.0, 77.0)])
+        
+        materials = set(results['material'])
+        assert "aluminum_6061_t6" in materials
+        # Only directional conductivity variants; no plain thermal_conductivity
+        assert "fiberglass_epoxy_g10" not in materials
+    
+    def test_sweep_structured_array(self):
+        """Test the structured array output."""
+        array = self.calc.sweep_thermal_power(self.geometries, self.pairs,
+                                              ["aluminum_6061_t6"], structured=True)
+        
+        assert array.dtype.names == ('material', 'temp_hot', 'temp_cold', 'geometry',
+                                     'shape_factor', 'conductivity_integral', 'power')
+        assert array.shape == (6,)
+    
+    def test_thermal_power_with_geometry_array(self):
+        """Test that a GeometryArray gives one power per geometry."""
+        rods = create_rod_array([1.0, 5.0, 10.0], 100.0)
+        
+        power = self.calc.calculate_thermal_power("aluminum_6061_t6", rods, 300.0, 4.0)
+        expected = [self.calc.calculate_thermal_power("aluminum_6061_t6", rod, 300.0, 4.0)
+                    for rod in rods]
+        assert np.allclose(power, expected, rtol=1e-12)
+    
+    def test_sweep_with_geometry_array(self):
+        """Test that sweeps accept a GeometryArray like a list of geometries."""
+        rods = create_rod_array([1.0, 5.0], [100.0, 200.0])
+        
+        from_array = self.calc.sweep_thermal_power(rods, self.pairs, ["teflon"])
+        from_list = self.calc.sweep_thermal_power(list(rods), self.pairs, ["teflon"])
+        assert np.array_equal(from_array['power'], from_list['power'])
+    
+    def test_sweep_process_pool(self):
+        """Test that the process pool gives the same results as the serial path."""
+        materials = ["aluminum_6061_t6", "stainless_steel_304", "kevlar_49_fiber"]
+        pairs = [(temp_hot, 4.0) for temp_hot in np.linspace(10.0, 300.0, 25)]
+        
+        serial = self.calc.sweep_thermal_power(self.geometries, pairs, materials)
+        parallel = self.calc.sweep_thermal_power(self.geometries, pairs, materials,
+                                                 processes=2, chunk_size=10)
+        
+        assert np.array_equal(serial['power'], parallel['power'], equal_nan=True)
+
+
 class TestDifferentMaterials:
     """Test thermal calculations with different materials."""
     
@@ -0,0 +1,119 @@
+"""
+Unit tests for the transient conduction solver.
+"""
+
+import pytest
+import numpy as np
+from cryocalc.materials import MaterialDatabase
+from cryocalc.thermal import ThermalCalculator, create_rod, create_frustum
+from cryocalc.transient import TransientResult, TransientSolver
+
+
+class TestTransientSolver:
+    """Test finite-volume cooldown simulations."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.thermal = ThermalCalculator()
+        self.rod = create_rod(10.0, 200.0)
+
+    def test_density_from_database(self):
+        """Test that the material density is read from the database."""
+        solver = TransientSolver("aluminum_6061_t6", self.rod, thermal_calculator=self.thermal)
+
+        assert solver.density == MaterialDatabase().get_density("aluminum_6061_t6") == 2700.0
+        assert TransientSolver("aluminum_6061_t6", self.rod, density=2800.0,
+                               thermal_calculator=self.thermal).density == 2800.0
+
+    @pytest.mark.parametrize("geometry", [create_rod(10.0, 200.0), create_frustum(10.0, 4.0, 200.0)])
+    def test_reaches_steady_state_profile(self, geometry):
+        """Test that the long-time solution is the exact steady-state profile."""
+        solver = TransientSolver("stainless_steel_304", geometry, num_cells=50,
+                                 thermal_calculator=self.thermal)
+        result = solver.run(300.0, duration=1e6, time_step=1e4, temp_start=300.0, temp_end=77.0)
+
+        table = self.thermal.get_conductivity_integral_table("stainless_steel_304")
+        power = self.thermal.calculate_thermal_power("stainless_steel_304", geometry, 300.0, 77.0,
+                                                     method='table')
+        steady = table.inverse(table(300.0) - power * geometry.resistance(solver.positions))
+        assert np.allclose(result.temperatures[-1], steady, atol=1e-6)
+        assert result.heat_flow_end[-1] == pytest.approx(power, rel=1e-6)
+        assert result.heat_flow_start[-1] == pytest.approx(-power, rel=1e-6)
+
+    def test_energy_balance(self):
+        """Test that heat input without contacts raises the enthalpy by Q*t."""
+        solver = TransientSolver("aluminum_6061_t6", self.rod, num_cells=20,
+                                 thermal_calculator=self.thermal)
+        result = solver.run(50.0, duration=100.0, time_step=0.1, heat_start=1.0)
+
+        specific_heat = self.thermal.calculator.get_evaluator("aluminum_6061_t6", 'specific_heat')
+        enthalpy = 0.0
+        for temperature, volume in zip(result.temperatures[-1], solver.volumes):
+            grid = np.linspace(50.0, temperature, 201)
+            enthalpy += solver.density * volume * np.trapezoid(specific_heat.evaluate_array(grid), grid)
+        assert enthalpy == pytest.approx(100.0, rel=1e-2)
+        assert result.temperatures[-1][0] > result.temperatures[-1][-1]
+
+    def test_cooldown(self):
+        """Test a rod cooled from one end and the cooldown time estimate."""
+        solver = TransientSolver("aluminum_6061_t6", self.rod, num_cells=40,
+                                 thermal_calculator=self.thermal)
+        result = solver.run(300.0, duration=3 * 3600, time_step=10.0, temp_end=4.0)
+
+        assert result.temperatures.shape == (101, 40)
+        assert result.times[0] == 0.0 and result.times[-1] == pytest.approx(3 * 3600)
+        assert np.all(np.diff(result.max_temperatures) <= 1e-9)
+        assert result.heat_flow_end[1] > 0 and np.all(result.heat_flow_end > -1e-9)
+
+        time_to_10k = result.time_to_reach(10.0)
+        assert 0 < time_to_10k < 3 * 3600
+        assert result.time_to_reach(1.0) is None
+
+        # Halving the step changes the estimate only slightly
+        finer = solver.run(300.0, duration=3 * 3600, time_step=5.0, temp_end=4.0)
+        assert finer.time_to_reach(10.0) == pytest.approx(time_to_10k, rel=0.02)
+
+    def test_time_to_reach_first_step(self):
+        """Test targets reached at the start or during the first step."""
+        result = TransientResult(
+            times=np.array([0.0, 20.0]), positions=np.array([0.0, 1.0]),
+            temperatures=np.array([[300.0, 280.0], [100.0, 90.0]]),
+            heat_flow_start=np.zeros(2), heat_flow_end=np.zeros(2),
+            step_times=np.array([10.0, 20.0]), max_temperatures=np.array([200.0, 100.0]),
+        )
+        
+        assert result.time_to_reach(300.0) == 0.0
+        assert result.time_to_reach(400.0) == 0.0
+        assert result.time_to_reach(250.0) == pytest.approx(5.0)
+        assert result.time_to_reach(150.0) == pytest.approx(15.0)
+        assert result.time_to_reach(50.0) is None
+        
+        # The solver records the initial state at t = 0
+        solver = TransientSolver("aluminum_6061_t6", self.rod, num_cells=10,
+                                 thermal_calculator=self.thermal)
+        cold = solver.run(77.0, duration=100.0, time_step=10.0, temp_end=77.0)
+        assert cold.time_to_reach(77.0) == 0.0
+    
+    def test_time_dependent_boundary(self):
+        """Test a boundary temperature that ramps down over time."""
+        solver = TransientSolver("aluminum_6061_t6", self.rod, num_cells=20,
+                                 thermal_calculator=self.thermal)
+        result = solver.run(300.0, duration=2000.0, time_step=5.0,
+                            temp_end=lambda t: max(300.0 - 0.2 * t, 77.0))
+
+        assert result.temperatures[-1].min() < 300.0
+        assert result.temperatures[-1].min() >= 77.0 - 1e-6
+
+    def test_invalid_inputs(self):
+        """Test validation of ranges and parameters."""
+        solver = TransientSolver("aluminum_6061_t6", self.rod, num_cells=10,
+                                 thermal_calculator=self.thermal)
+
+        with pytest.raises(ValueError, match="outside valid range"):
+            solver.run(400.0, duration=10.0, time_step=1.0)
+        with pytest.raises(ValueError, match="outside valid range"):
+            solver.run(300.0, duration=10.0, time_step=1.0, temp_end=1.0)
+        with pytest.raises(ValueError):
+            solver.run(300.0, duration=10.0, time_step=0.0)
+        with pytest.raises(ValueError):
+            TransientSolver("aluminum_1100", self.rod, thermal_calculator=self.thermal)
@@ -0,0 +1,46 @@
+"""
+Smoke tests for the propcalc.js cross-validation script.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = PACKAGE_ROOT / "validation_test.py"
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+
+
+def run_script(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(SCRIPT), *args], cwd=PACKAGE_ROOT,
+                          capture_output=True, text=True)
+
+
+class TestValidationScript:
+    """Test the batched all-cases validation mode."""
+
+    def test_all_cases(self, tmp_path):
+        """Test that every JS case is reported and the mapped ones match."""
+        rows_file = tmp_path / "rows.json"
+        run = run_script("--points", "20", "--json", str(rows_file))
+        assert run.returncode == 0, run.stdout + run.stderr
+
+        rows = json.loads(rows_file.read_text())
+        js_source = (PACKAGE_ROOT / "propcalc.js").read_text()
+        assert len(rows) == js_source.count("// value=")
+        mapped = [row for row in rows if row["material_id"] and row["status"] != "unreachable"]
+        assert mapped and all(row["status"] == "match" for row in mapped)
+        assert all(row["max_rel_error"] <= 1e-9 for row in mapped)
+        assert any(row["status"] == "unreachable" for row in rows)
+
+    def test_mismatch_exit_status(self, tmp_path):
+        """Test that a tolerance nothing can meet fails the run."""
+        run = run_script("--points", "5", "--tolerance", "0")
+        assert run.returncode == 1
+        assert "MISMATCH" in run.stdout
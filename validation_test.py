@@ -1,122 +1,429 @@
 #!/usr/bin/env python3
 """
-Validation script to compare CryoCalc Python package results 
+Validation script to compare CryoCalc Python package results
 against the original JavaScript propcalc.js implementation.
+
+``propcalc.js`` is loaded once into a single long-lived Node.js process (no
+network access, no temporary files). Queries are sent over its stdin in
+batches, one JSON line per batch, and answered on stdout; the Python side is
+evaluated with the vectorized evaluators while Node works on the batch.
+
+Usage:
+    python validation_test.py                  # every case, per-case max error
+    python validation_test.py --mode random    # random spot checks
+    python validation_test.py --js path/to/propcalc.js --points 500
 """
 
+import argparse
 import json
+import os
 import random
+import re
+import shutil
 import subprocess
-import tempfile
-import os
-from typing import Dict, List, Tuple, Any
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+
+import numpy as np
+
 from cryocalc import MaterialCalculator
 
+DEFAULT_JS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'propcalc.js')
+
+# propcalc.js reads its inputs from a web form. The driver gives it a stand-in
+# form, lets ``parseInt`` keep fractional temperatures and makes ``toFixed``
+# return the unrounded number, then answers one batch per input line:
+#   {"queries": [[case, [T, ...]], ...]}  ->  {"values": [[v, ...], ...]}
+# Non-finite or missing results are returned as null.
+NODE_DRIVER = r"""
+const fs = require('fs');
+const vm = require('vm');
+const readline = require('readline');
+
+const elements = {y: {value: '0'}, y1: {value: '0'}, op: {value: '0'}, z: {value: null}};
+const form = {elements: elements};
+const context = vm.createContext({document: {getElementById: function () { return form; }}});
+vm.runInContext(
+    'Number.prototype.toFixed = function () { return this.valueOf(); };' +
+    'parseInt = function (text) { return Number(text); };', context);
+vm.runInContext(fs.readFileSync(process.argv[1], 'utf8'), context, {filename: process.argv[1]});
+
+function evaluate(caseNumber, temperatures) {
+    elements.op.value = String(caseNumber);
+    return temperatures.map(function (temperature) {
+        elements.y.value = String(temperature);
+        elements.z.value = null;
+        try {
+            context.updateOutput();
+        } catch (error) {
+            return null;
+        }
+        const value = elements.z.value;
+        return (typeof value === 'number' && isFinite(value)) ? value : null;
+    });
+}
+
+const lines = readline.createInterface({input: process.stdin, terminal: false});
+lines.on('line', function (line) {
+    const request = JSON.parse(line);
+    const values = request.queries.map(function (query) { return evaluate(query[0], query[1]); });
+    process.stdout.write(JSON.stringify({values: values}) + '\n');
+});
+"""
+
+# propcalc.js case -> (material_id, property_name) in the packaged database
+JS_CASE_MAP: Dict[int, Tuple[str, str]] = {
+    0: ('aluminum_1100', 'thermal_conductivity'),
+    1: ('aluminum_3003_f', 'thermal_conductivity'),
+    101: ('aluminum_3003_f', 'specific_heat'),
+    102: ('aluminum_3003_f', 'linear_expansion'),
+    2: ('aluminum_5083_o', 'thermal_conductivity'),
+    201: ('aluminum_5083_o', 'specific_heat'),
+    202: ('aluminum_5083_o', 'youngs_modulus'),
+    203: ('aluminum_5083_o', 'linear_expansion'),
+    3: ('aluminum_6061_t6', 'thermal_conductivity'),
+    301: ('aluminum_6061_t6', 'specific_heat'),
+    302: ('aluminum_6061_t6', 'youngs_modulus'),
+    303: ('aluminum_6061_t6', 'linear_expansion'),
+    4: ('aluminum_6063_t5', 'thermal_conductivity'),
+    8: ('beryllium', 'specific_heat'),
+    801: ('beryllium', 'linear_expansion_a_axis'),
+    802: ('beryllium', 'linear_expansion_c_axis'),
+    803: ('beryllium', 'linear_expansion_polycrystalline'),
+    11: ('copper_ofhc_rrr50', 'thermal_conductivity'),
+    111: ('copper_ofhc_rrr100', 'thermal_conductivity'),
+    115: ('copper_ofhc_general', 'specific_heat'),
+    116: ('copper_ofhc_general', 'electrical_conductivity'),
+    12: ('fiberglass_epoxy_g10', 'thermal_conductivity_normal'),
+    121: ('fiberglass_epoxy_g10', 'thermal_conductivity_wrap'),
+    122: ('fiberglass_epoxy_g10', 'specific_heat'),
+    123: ('fiberglass_epoxy_g10', 'linear_expansion_normal'),
+    124: ('fiberglass_epoxy_g10', 'linear_expansion_wrap'),
+    17: ('invar', 'thermal_conductivity'),
+    171: ('invar', 'specific_heat'),
+    172: ('invar', 'youngs_modulus'),
+    173: ('invar', 'linear_expansion'),
+    18: ('kevlar_49_fiber', 'thermal_conductivity'),
+    19: ('kevlar_49_composite', 'thermal_conductivity'),
+    34: ('silicon', 'expansion_coefficient'),
+    42: ('silicon', 'expansion_coefficient'),
+    35: ('stainless_steel_304', 'thermal_conductivity'),
+    351: ('stainless_steel_304', 'specific_heat'),
+    352: ('stainless_steel_304', 'youngs_modulus_low'),
+    353: ('stainless_steel_304', 'youngs_modulus_high'),
+    354: ('stainless_steel_304', 'linear_expansion'),
+    38: ('stainless_steel_316', 'thermal_conductivity'),
+    383: ('stainless_steel_316', 'youngs_modulus_low'),
+    384: ('stainless_steel_316', 'youngs_modulus_high'),
+    385: ('stainless_steel_316', 'linear_expansion'),
+    39: ('teflon', 'thermal_conductivity'),
+    391: ('teflon', 'specific_heat'),
+    392: ('teflon', 'linear_expansion'),
+    40: ('titanium_6al_4v', 'thermal_conductivity'),
+    401: ('titanium_6al_4v', 'linear_expansion'),
+}
+
+_CASE_LABEL = re.compile(r'^\s*case\s+(\d+)\s*:', re.MULTILINE)
+_HEADER = re.compile(r'//\s*value="(\d+)"\s*(.*)')
+_PROPERTY_CODE = re.compile(r'(?:-\s*|\s)(TC|SH|YM|LE|EC)(\d?)\b(?:\s*\(([^)]*)\))?')
+_RANGE = re.compile(r'(\d+(?:\.\d+)?)\s*to\s*(\d+(?:\.\d+)?)\s*K', re.IGNORECASE)
+
+
+@dataclass
+class JSCase:
+    """
+    One ``case`` block of the propcalc.js switch.
+
+    Attributes:
+        case: Case label (the form's ``op`` value)
+        header: Text of the ``// value="N"`` comment, without the marker
+        material: Material name from the header
+        property_code: TC, SH, YM, LE or EC (with a 1/2 suffix if present),
+            or None when the header does not say
+        units: Units from the header, or None
+        temperature_range: (min, max) in K from the header, or None
+        body: JavaScript source of the block, up to and including ``break;``
+        reachable: False for a repeated label, which the switch never reaches
+    """
+    case: int
+    header: str
+    material: str
+    property_code: Optional[str]
+    units: Optional[str]
+    temperature_range: Optional[Tuple[float, float]]
+    body: str
+    reachable: bool = True
+
+
+def parse_js_cases(js_code: str) -> List[JSCase]:
+    """
+    Split propcalc.js into its ``case`` blocks and parse their comment headers.
+
+    Headers look like ``// value="3"   Aluminum 6061-T6 (UNS A96061) - TC (W/m-K)
+    - Range 4  to 300 K``; older ones only name the material. The header is
+    usually just above the label but sometimes just below it.
+
+    Args:
+        js_code: Source of propcalc.js
+
+    Returns:
+        Cases in source order
+    """
+    labels = list(_CASE_LABEL.finditer(js_code))
+    cases = []
+    seen = set()
+    previous_end = 0
+    for index, label in enumerate(labels):
+        number = int(label.group(1))
+        next_start = labels[index + 1].start() if index + 1 < len(labels) else len(js_code)
+        break_at = js_code.find('break;', label.end(), next_start)
+        end = break_at + len('break;') if break_at >= 0 else next_start
+        header = ''
+        for match in _HEADER.finditer(js_code, previous_end, end):
+            if int(match.group(1)) == number:
+                header = match.group(2).strip()
+        previous_end = end
+
+        code = _PROPERTY_CODE.search(header)
+        span = _RANGE.search(header)
+        material = header[:code.start()] if code else header
+        cases.append(JSCase(
+            case=number,
+            header=header,
+            material=material.strip(' -\t'),
+            property_code=code.group(1) + code.group(2) if code else None,
+            units=code.group(3) if code else None,
+            temperature_range=(float(span.group(1)), float(span.group(2))) if span else None,
+            body=js_code[label.start():end],
+            reachable=number not in seen,
+        ))
+        seen.add(number)
+    return cases
+
+
+class NodePropcalc:
+    """A single Node.js process with propcalc.js loaded, queried in batches."""
+
+    def __init__(self, js_file_path: str, node: str = 'node'):
+        """
+        Start Node.js and load the script.
+
+        Args:
+            js_file_path: Path to propcalc.js
+            node: Node.js executable
+        """
+        self.js_file_path = js_file_path
+        self.process = subprocess.Popen(
+            [node, '-e', NODE_DRIVER, os.path.abspath(js_file_path)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, bufsize=1,
+        )
+
+    def submit(self, queries: Sequence[Tuple[int, Sequence[float]]]) -> None:
+        """Send a batch of (case, temperatures) queries without waiting."""
+        request = {'queries': [[int(case), [float(t) for t in temps]] for case, temps in queries]}
+        self.process.stdin.write(json.dumps(request) + '\n')
+        self.process.stdin.flush()
+
+    def receive(self) -> List[np.ndarray]:
+        """
+        Read the answer to the batch sent by ``submit``.
+
+        Returns:
+            One float array per query, NaN where JavaScript gave no finite number
+
+        Raises:
+            RuntimeError: If Node.js exited (e.g. propcalc.js failed to load)
+        """
+        line = self.process.stdout.readline()
+        if not line:
+            self.process.wait()
+            raise RuntimeError(f"Node.js exited: {self.process.stderr.read().strip()}")
+        return [np.array([np.nan if v is None else v for v in values], dtype=float)
+                for values in json.loads(line)['values']]
+
+    def evaluate(self, queries: Sequence[Tuple[int, Sequence[float]]]) -> List[np.ndarray]:
+        """Evaluate a batch of (case, temperatures) queries."""
+        self.submit(queries)
+        return self.receive()
+
+    def close(self) -> None:
+        """Stop the Node.js process."""
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait(timeout=10)
+        self.process.stdout.close()
+        self.process.stderr.close()
+
+    def __enter__(self) -> 'NodePropcalc':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def case_temperatures(temperature_range: Tuple[float, float], num_points: int) -> np.ndarray:
+    """Sample points covering a range evenly on both a linear and a log scale."""
+    low, high = temperature_range
+    if low <= 0:
+        low = min(1.0, high / 2)
+    return np.unique(np.concatenate([np.linspace(low, high, num_points),
+                                     np.geomspace(low, high, num_points)]))
+
+
+def relative_errors(js_values: np.ndarray, py_values: np.ndarray) -> np.ndarray:
+    """
+    |Python - JS| / |JS| at every point.
+
+    The denominator is floored at 1e-6 of the largest |JS| value of the case,
+    so fits that cross zero (e.g. linear expansion) are not dominated by the
+    points next to the crossing.
+    """
+    scale = np.abs(js_values)
+    floor = 1e-6 * np.nanmax(scale) if np.any(np.isfinite(scale)) else 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.abs(py_values - js_values) / np.maximum(scale, floor)
+
+
+def validate_all_cases(js_file_path: str, num_points: int = 200, tolerance: float = 1e-9,
+                       case_map: Optional[Dict[int, Tuple[str, str]]] = None,
+                       calculator: Optional[MaterialCalculator] = None,
+                       node: str = 'node') -> List[Dict[str, Any]]:
+    """
+    Compare every case of the propcalc.js switch with the Python database.
+
+    Each case is sampled over the intersection of its header range and the
+    Python property's valid range (just the Python range when the header has
+    none). All cases go to Node.js in one batch; the Python side is computed
+    while Node.js works.
+
+    Args:
+        js_file_path: Path to propcalc.js
+        num_points: Points per case on each of the linear and log grids
+        tolerance: Maximum relative error for a case to count as a match
+        case_map: JS case -> (material_id, property_name). Defaults to
+            ``JS_CASE_MAP``.
+        calculator: MaterialCalculator to validate. If None, a default one.
+        node: Node.js executable
+
+    Returns:
+        One row per case in source order with 'case', 'header', 'material_id',
+        'property_name', 'points', 'max_rel_error', 'worst_temperature' and
+        'status' (match, MISMATCH, JS ERROR, no python entry, unreachable)
+    """
+    with open(js_file_path, encoding='utf-8') as f:
+        cases = parse_js_cases(f.read())
+    case_map = JS_CASE_MAP if case_map is None else case_map
+    calculator = calculator or MaterialCalculator()
+
+    rows, queries, expected = [], [], []
+    for js_case in cases:
+        material_id, property_name = case_map.get(js_case.case, (None, None))
+        row = {'case': js_case.case, 'header': js_case.header, 'material_id': material_id,
+               'property_name': property_name, 'points': 0, 'max_rel_error': None,
+               'worst_temperature': None}
+        rows.append(row)
+        if not js_case.reachable:
+            row['status'] = 'unreachable'
+            continue
+        if material_id is None:
+            row['status'] = 'no python entry'
+            temperature_range = js_case.temperature_range or (4.0, 300.0)
+        else:
+            evaluator = calculator.get_evaluator(material_id, property_name)
+            temperature_range = evaluator.temperature_range
+            if js_case.temperature_range is not None:
+                temperature_range = (max(temperature_range[0], js_case.temperature_range[0]),
+                                     min(temperature_range[1], js_case.temperature_range[1]))
+        temperatures = case_temperatures(temperature_range, num_points)
+        row['points'] = len(temperatures)
+        queries.append((js_case.case, temperatures))
+        expected.append((row, temperatures))
+
+    node_process = NodePropcalc(js_file_path, node)
+    try:
+        node_process.submit(queries)
+        py_results = [
+            calculator.get_evaluator(row['material_id'], row['property_name']).evaluate_array(temps)
+            if row['material_id'] is not None else None
+            for row, temps in expected
+        ]
+        js_results = node_process.receive()
+    finally:
+        node_process.close()
+
+    for (row, temperatures), js_values, py_values in zip(expected, js_results, py_results):
+        if np.isnan(js_values).all():
+            row['status'] = 'JS ERROR'
+            continue
+        if py_values is None:
+            continue
+        errors = relative_errors(js_values, py_values)
+        errors[np.isnan(js_values) != np.isnan(py_values)] = np.inf
+        errors = np.nan_to_num(errors, nan=0.0)
+        worst = int(np.argmax(errors))
+        row['max_rel_error'] = float(errors[worst])
+        row['worst_temperature'] = float(temperatures[worst])
+        row['status'] = 'match' if row['max_rel_error'] <= tolerance else 'MISMATCH'
+    return rows
+
+
+def format_case_report(rows: List[Dict[str, Any]]) -> str:
+    """Format ``validate_all_cases`` rows as a table with a summary line."""
+    lines = [f"{'case':>5}  {'python entry':<52} {'points':>6} {'max rel err':>12} "
+             f"{'at T (K)':>9}  status",
+             '-' * 100]
+    for row in rows:
+        entry = (f"{row['material_id']}/{row['property_name']}" if row['material_id']
+                 else row['header'][:52])
+        error = f"{row['max_rel_error']:.3e}" if row['max_rel_error'] is not None else '-'
+        where = f"{row['worst_temperature']:.2f}" if row['worst_temperature'] is not None else '-'
+        lines.append(f"{row['case']:>5}  {entry:<52} {row['points']:>6} {error:>12} "
+                     f"{where:>9}  {row['status']}")
+    counts: Dict[str, int] = {}
+    for row in rows:
+        counts[row['status']] = counts.get(row['status'], 0) + 1
+    lines.append('-' * 100)
+    lines.append(f"{len(rows)} cases: " + ", ".join(f"{count} {status}"
+                                                     for status, count in sorted(counts.items())))
+    return "\n".join(lines)
+
+
 class JavaScriptValidator:
     """Validates Python results against JavaScript implementation."""
-    
-    def __init__(self, js_file_path: str):
+
+    def __init__(self, js_file_path: str, node: str = 'node'):
         self.js_file_path = js_file_path
+        self.node = node
         self.calculator = MaterialCalculator()
-        
-    def create_js_test_script(self, material: str, property_type: str, temperature: float) -> str:
-        """Create a temporary JavaScript test script."""
-        js_test_code = f"""
-// Load the original propcalc.js
-const fs = require('fs');
-const path = require('path');
-
-// Read and execute the original JavaScript file
-const jsCode = fs.readFileSync('{self.js_file_path}', 'utf8');
-eval(jsCode);
-
-// Test the calculation
-try {{
-    const result = calcProperty('{material}', '{property_type}', {temperature});
-    console.log(JSON.stringify({{
-        material: '{material}',
-        property: '{property_type}',
-        temperature: {temperature},
-        result: result,
-        success: true
-    }}));
-}} catch (error) {{
-    console.log(JSON.stringify({{
-        material: '{material}',
-        property: '{property_type}',
-        temperature: {temperature},
-        error: error.message,
-        success: false
-    }}));
-}}
-"""
-        return js_test_code
-    
+        self.js_cases = {(material, prop): case for case, (material, prop) in JS_CASE_MAP.items()}
+        self._node_process: Optional[NodePropcalc] = None
+
     def run_js_calculation(self, material: str, property_type: str, temperature: float) -> Dict[str, Any]:
         """Run calculation using the original JavaScript."""
-        js_code = self.create_js_test_script(material, property_type, temperature)
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-            f.write(js_code)
-            temp_js_file = f.name
-        
+        result = {'material': material, 'property': property_type, 'temperature': temperature}
+        case = self.js_cases.get((material, property_type))
+        if case is None:
+            result.update(error="No propcalc.js case for this property", success=False)
+            return result
+        if self._node_process is None:
+            self._node_process = NodePropcalc(self.js_file_path, self.node)
         try:
-            # Run Node.js
-            result = subprocess.run(
-                ['node', temp_js_file],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout.strip())
-            else:
-                return {
-                    'material': material,
-                    'property': property_type,
-                    'temperature': temperature,
-                    'error': f"JavaScript execution failed: {result.stderr}",
-                    'success': False
-                }
-        except subprocess.TimeoutExpired:
-            return {
-                'material': material,
-                'property': property_type,
-                'temperature': temperature,
-                'error': "JavaScript execution timed out",
-                'success': False
-            }
-        except json.JSONDecodeError as e:
-            return {
-                'material': material,
-                'property': property_type,
-                'temperature': temperature,
-                'error': f"Failed to parse JavaScript output: {e}",
-                'success': False
-            }
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_js_file)
-            except:
-                pass
-    
+            value = float(self._node_process.evaluate([(case, [temperature])])[0][0])
+        except RuntimeError as e:
+            result.update(error=f"JavaScript execution failed: {e}", success=False)
+            return result
+        if np.isnan(value):
+            result.update(error="JavaScript returned no finite value", success=False)
+        else:
+            result.update(result=value, success=True)
+        return result
+
     def run_python_calculation(self, material: str, property_type: str, temperature: float) -> Dict[str, Any]:
         """Run calculation using the Python package."""
         try:
-            if property_type == 'thermal_conductivity':
-                result = self.calculator.calculate_thermal_conductivity(material, temperature)
-            elif property_type == 'specific_heat':
-                result = self.calculator.calculate_specific_heat(material, temperature)
-            elif property_type == 'youngs_modulus':
-                result = self.calculator.calculate_youngs_modulus(material, temperature)
-            elif property_type == 'linear_expansion':
-                result = self.calculator.calculate_linear_expansion(material, temperature)
-            else:
-                raise ValueError(f"Unknown property type: {property_type}")
-            
+            result = self.calculator.calculate_property(material, property_type, temperature)
             return {
                 'material': material,
                 'property': property_type,
@@ -132,7 +439,7 @@ try {{
                 'error': str(e),
                 'success': False
             }
-    
+
     def compare_results(self, js_result: Dict[str, Any], py_result: Dict[str, Any]) -> Dict[str, Any]:
         """Compare JavaScript and Python results."""
         comparison = {
@@ -142,17 +449,17 @@ try {{
             'js_success': js_result['success'],
             'py_success': py_result['success'],
         }
-        
+
         if js_result['success'] and py_result['success']:
             js_val = js_result['result']
             py_val = py_result['result']
-            
+
             # Calculate relative difference
             if abs(js_val) > 1e-10:  # Avoid division by zero
                 rel_diff = abs(js_val - py_val) / abs(js_val) * 100
             else:
                 rel_diff = abs(js_val - py_val) * 100
-            
+
             comparison.update({
                 'js_result': js_val,
                 'py_result': py_val,
@@ -166,147 +473,95 @@ try {{
                 'py_error': py_result.get('error', 'Unknown error'),
                 'match': False
             })
-        
+
         return comparison
-    
+
     def generate_test_cases(self, num_tests: int = 50) -> List[Tuple[str, str, float]]:
-        """Generate random test cases."""
-        materials = self.calculator.database.get_available_materials()
-        
-        # Property mapping between Python and JavaScript naming
-        property_mapping = {
-            'thermal_conductivity': 'thermal_conductivity',
-            'specific_heat': 'specific_heat',
-            'youngs_modulus': 'youngs_modulus',
-            'linear_expansion': 'linear_expansion'
-        }
-        
+        """Generate random test cases among the properties that have a JS case."""
+        pairs = sorted(self.js_cases)
         test_cases = []
-        
+
         for _ in range(num_tests):
-            material = random.choice(materials)
-            
-            # Get available properties for this material
+            material, property_type = random.choice(pairs)
             try:
-                material_data = self.calculator.database._materials_data[material]
-                available_properties = list(material_data['properties'].keys())
-            except KeyError:
-                continue
-            
-            # Map to JavaScript property names and filter valid ones
-            js_properties = []
-            for prop in available_properties:
-                if prop in property_mapping:
-                    js_properties.append(property_mapping[prop])
-                elif prop.startswith('youngs_modulus'):
-                    js_properties.append('youngs_modulus')
-            
-            if not js_properties:
-                continue
-                
-            property_type = random.choice(js_properties)
-            
-            # Get temperature range for this material/property
-            try:
-                if property_type == 'youngs_modulus':
-                    # For Young's modulus, we need to check both variants
-                    available_props = [p for p in available_properties if p.startswith('youngs_modulus')]
-                    if available_props:
-                        temp_prop = available_props[0]  # Use first available variant
-                    else:
-                        continue
-                else:
-                    temp_prop = property_type
-                
-                min_temp, max_temp = self.calculator.database.get_temperature_range(material, temp_prop)
-                temperature = random.uniform(min_temp + 1, max_temp - 1)
-                
-                test_cases.append((material, property_type, temperature))
-            except:
+                min_temp, max_temp = self.calculator.database.get_temperature_range(material, property_type)
+            except ValueError:
                 continue
-        
+            temperature = random.uniform(min_temp + 1, max_temp - 1)
+            test_cases.append((material, property_type, temperature))
+
         return test_cases
-    
+
     def run_validation(self, num_tests: int = 30) -> Dict[str, Any]:
         """Run validation tests comparing Python vs JavaScript."""
         print(f"Generating {num_tests} random test cases...")
         test_cases = self.generate_test_cases(num_tests)
-        
+
         if not test_cases:
             return {'error': 'No valid test cases generated'}
-        
+
         print(f"Running validation on {len(test_cases)} test cases...")
-        
+
         results = []
         matches = 0
         total_tests = 0
-        
-        for i, (material, property_type, temperature) in enumerate(test_cases):
-            print(f"Test {i+1}/{len(test_cases)}: {material} {property_type} @ {temperature:.1f}K")
-            
-            # Run both implementations
-            js_result = self.run_js_calculation(material, property_type, temperature)
-            py_result = self.run_python_calculation(material, property_type, temperature)
-            
-            # Compare results
-            comparison = self.compare_results(js_result, py_result)
-            results.append(comparison)
-            
-            if comparison.get('match', False):
-                matches += 1
-            total_tests += 1
-            
-            # Print result
-            if comparison['js_success'] and comparison['py_success']:
-                if comparison['match']:
-                    print(f"  ✅ MATCH: JS={comparison['js_result']:.6f}, PY={comparison['py_result']:.6f}")
+
+        try:
+            for i, (material, property_type, temperature) in enumerate(test_cases):
+                print(f"Test {i+1}/{len(test_cases)}: {material} {property_type} @ {temperature:.1f}K")
+
+                # Run both implementations
+                js_result = self.run_js_calculation(material, property_type, temperature)
+                py_result = self.run_python_calculation(material, property_type, temperature)
+
+                # Compare results
+                comparison = self.compare_results(js_result, py_result)
+                results.append(comparison)
+
+                if comparison.get('match', False):
+                    matches += 1
+                total_tests += 1
+
+                # Print result
+                if comparison['js_success'] and comparison['py_success']:
+                    if comparison['match']:
+                        print(f"  ✅ MATCH: JS={comparison['js_result']:.6f}, PY={comparison['py_result']:.6f}")
+                    else:
+                        print(f"  ❌ DIFF: JS={comparison['js_result']:.6f}, PY={comparison['py_result']:.6f} ({comparison['relative_diff_percent']:.3f}%)")
                 else:
-                    print(f"  ❌ DIFF: JS={comparison['js_result']:.6f}, PY={comparison['py_result']:.6f} ({comparison['relative_diff_percent']:.3f}%)")
-            else:
-                print(f"  ❌ ERROR: JS_OK={comparison['js_success']}, PY_OK={comparison['py_success']}")
-        
+                    print(f"  ❌ ERROR: JS_OK={comparison['js_success']}, PY_OK={comparison['py_success']}")
+        finally:
+            if self._node_process is not None:
+                self._node_process.close()
+                self._node_process = None
+
         # Summary
         match_rate = (matches / total_tests * 100) if total_tests > 0 else 0
-        
+
         summary = {
             'total_tests': total_tests,
             'matches': matches,
             'match_rate_percent': match_rate,
             'results': results
         }
-        
+
         print(f"\n📊 VALIDATION SUMMARY:")
         print(f"Total tests: {total_tests}")
         print(f"Matches: {matches}")
         print(f"Match rate: {match_rate:.1f}%")
-        
+
         return summary
 
-def main():
-    """Main validation function."""
-    js_file = '/Users/dave/Library/CloudStorage/Dropbox/code/cryocalc/propcalc.js'
-    
-    if not os.path.exists(js_file):
-        print(f"❌ JavaScript file not found: {js_file}")
-        return
-    
-    # Check if Node.js is available
-    try:
-        subprocess.run(['node', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Node.js not found. Please install Node.js to run validation.")
-        return
-    
-    print("🔍 CryoCalc Validation: Python vs JavaScript")
-    print("=" * 50)
-    
-    validator = JavaScriptValidator(js_file)
-    results = validator.run_validation(num_tests=25)
-    
+
+def run_random_mode(js_file: str, num_tests: int, node: str) -> int:
+    """Random spot checks with a per-sample printout."""
+    validator = JavaScriptValidator(js_file, node)
+    results = validator.run_validation(num_tests=num_tests)
+
     if 'error' in results:
         print(f"❌ Validation failed: {results['error']}")
-        return
-    
+        return 1
+
     # Analyze discrepancies
     discrepancies = [r for r in results['results'] if not r.get('match', False)]
     if discrepancies:
@@ -317,8 +572,51 @@ def main():
                 print(f"    JS: {disc['js_result']:.6f}")
                 print(f"    PY: {disc['py_result']:.6f}")
                 print(f"    Diff: {disc['relative_diff_percent']:.3f}%")
-    
-    print(f"\n🎯 VALIDATION {'PASSED' if results['match_rate_percent'] >= 95 else 'NEEDS REVIEW'}")
+
+    passed = results['match_rate_percent'] >= 95
+    print(f"\n🎯 VALIDATION {'PASSED' if passed else 'NEEDS REVIEW'}")
+    return 0 if passed else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main validation function."""
+    parser = argparse.ArgumentParser(description='Validate CryoCalc against propcalc.js')
+    parser.add_argument('--js', default=DEFAULT_JS_FILE, help='Path to propcalc.js')
+    parser.add_argument('--mode', choices=('all', 'random'), default='all',
+                        help="'all' sweeps every JS case (default); 'random' spot-checks")
+    parser.add_argument('--points', type=int, default=200,
+                        help='Points per case on each of the linear and log grids (all mode)')
+    parser.add_argument('--tolerance', type=float, default=1e-9,
+                        help='Maximum relative error counted as a match (all mode)')
+    parser.add_argument('--tests', type=int, default=25, help='Number of samples (random mode)')
+    parser.add_argument('--json', metavar='FILE', help='Write the per-case rows to this file')
+    parser.add_argument('--node', default='node', help='Node.js executable')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.js):
+        print(f"❌ JavaScript file not found: {args.js}")
+        return 2
+
+    if shutil.which(args.node) is None:
+        print("❌ Node.js not found. Please install Node.js to run validation.")
+        return 2
+
+    print("🔍 CryoCalc Validation: Python vs JavaScript")
+    print("=" * 50)
+
+    if args.mode == 'random':
+        return run_random_mode(args.js, args.tests, args.node)
+
+    rows = validate_all_cases(args.js, args.points, args.tolerance, node=args.node)
+    print(format_case_report(rows))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+    failures = [row for row in rows if row['status'] in ('MISMATCH', 'JS ERROR')
+                and row['material_id'] is not None]
+    print(f"\n🎯 VALIDATION {'PASSED' if not failures else 'NEEDS REVIEW'}")
+    return 1 if failures else 0
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())